@@ -1,11 +1,161 @@
+import functools
+import time
+from collections.abc import Callable, Iterator
+from datetime import timedelta
 from typing import Any
+
+import httpx
 from universal_mcp.applications import APIApplication
 from universal_mcp.integrations import Integration
 
+from universal_mcp_miro.bulk import (
+    MAX_BULK_ITEMS,
+    chunked,
+    describe_error,
+    run_concurrently,
+)
+from universal_mcp_miro.cache import ResponseCache, normalize_params
+from universal_mcp_miro.endpoints import ENDPOINTS, PreparedRequest, decode_response
+from universal_mcp_miro.pagination import fetch_offset_windows, iter_cursor
+from universal_mcp_miro.ratelimit import CreditScheduler, request_weight
+from universal_mcp_miro.retry import RetryPolicy
+from universal_mcp_miro.singleflight import SingleFlight
+from universal_mcp_miro.snapshot import BoardSnapshot, apply_write_to_snapshots
+
+
 class MiroApp(APIApplication):
-    def __init__(self, integration: Integration = None, **kwargs) -> None:
-        super().__init__(name='miro', integration=integration, **kwargs)
+    def __init__(
+        self,
+        integration: Integration = None,
+        scheduler: CreditScheduler | None = None,
+        retry_policy: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(name="miro", integration=integration, **kwargs)
         self.base_url = "https://api.miro.com"
+        self.scheduler = scheduler or CreditScheduler()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache if cache is not None else ResponseCache()
+        self.snapshots: dict[str, BoardSnapshot] = {}
+        self.inflight = SingleFlight()
+        # Endpoint operations batch may run; None allows all of them.
+        self.batch_operations: frozenset[str] | None = None
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[], httpx.Response],
+        params=None,
+        idempotent: bool | None = None,
+    ) -> httpx.Response:
+        """
+        Sends a request through the response cache, credit scheduler and retry policy.
+
+        Every HTTP verb helper funnels into this method, so request-path policies
+        apply to all operations alike.
+        """
+        if method != "GET":
+            try:
+                response = self._send_with_retry(method, url, send, idempotent)
+            except httpx.TransportError:
+                self.cache.on_write(method, url)
+                raise
+            if response.is_success:
+                self.cache.on_write(method, url, response)
+                apply_write_to_snapshots(self.snapshots, method, url, params, response)
+            return response
+        key = self.cache.key_for(url, params)
+        if key is not None:
+            response = self.cache.get(key)
+            if response is not None:
+                return response
+
+        def fetch() -> httpx.Response:
+            generation = self.cache.generation(key) if key is not None else None
+            response = self._send_with_retry(method, url, send)
+            if key is not None and response.is_success:
+                self.cache.put(key, response, generation)
+            return response
+
+        # Identical GETs in flight at the same time share one request; the write
+        # generation keeps a read issued after a write from joining an older one.
+        return self.inflight.do(
+            (url, normalize_params(params), self.cache.scope_generation(url)), fetch
+        )
+
+    def _send_with_retry(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[], httpx.Response],
+        idempotent: bool | None = None,
+    ) -> httpx.Response:
+        weight = request_weight(method, url)
+        attempt, delay = 1, 0.0
+        while True:
+            self.scheduler.acquire(weight)
+            try:
+                response = send()
+            except httpx.TransportError as error:
+                delay = self.retry_policy.retry_delay(
+                    method, attempt, delay, error=error, idempotent=idempotent
+                )
+                if delay is None:
+                    raise
+            else:
+                self.scheduler.observe(response.headers, response.status_code)
+                delay = self.retry_policy.retry_delay(
+                    method, attempt, delay, response=response, idempotent=idempotent
+                )
+                if delay is None:
+                    return response
+            time.sleep(delay)
+            attempt += 1
+
+    def _request(self, request: PreparedRequest) -> httpx.Response:
+        send = functools.partial(
+            self.client.request,
+            request.method,
+            request.url,
+            params=request.params,
+            json=request.data,
+        )
+        return self._send(
+            request.method,
+            request.url,
+            send,
+            params=request.params,
+            idempotent=request.idempotent,
+        )
+
+    def _call(self, name: str, args: dict[str, Any]) -> Any:
+        """
+        Sends the endpoint operation `name` and returns its decoded response.
+
+        Every endpoint method delegates here with its `locals()`, so building,
+        sending and decoding requests is shared by all operations.
+        """
+        return decode_response(
+            self._request(ENDPOINTS[name].prepare(self.base_url, args))
+        )
+
+    # The base class verb helpers take the same path, without raising for status.
+    def _get(self, url, params=None):
+        return self._request(PreparedRequest("GET", url, params, None))
+
+    def _delete(self, url, params=None):
+        return self._request(PreparedRequest("DELETE", url, params, None))
+
+    def _post(self, url, data, params=None):
+        return self._request(PreparedRequest("POST", url, params, data))
+
+    def _put(self, url, data, params=None):
+        return self._request(PreparedRequest("PUT", url, params, data))
+
+    def _patch(self, url, data, params=None):
+        return self._request(PreparedRequest("PATCH", url, params, data))
 
     def revoke_token_v1(self, access_token=None) -> Any:
         """
@@ -20,11 +170,7 @@ class MiroApp(APIApplication):
         Tags:
             Tokens
         """
-        url = f"{self.base_url}/v1/oauth/revoke"
-        query_params = {k: v for k, v in [('access_token', access_token)] if v is not None}
-        response = self._post(url, data={}, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('revoke_token_v1', locals())
 
     def get_access_token_information(self) -> Any:
         """
@@ -36,11 +182,7 @@ class MiroApp(APIApplication):
         Tags:
             Tokens
         """
-        url = f"{self.base_url}/v1/oauth-token"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_access_token_information', locals())
 
     def get_audit_logs(self, createdAfter=None, createdBefore=None, cursor=None, limit=None, sorting=None) -> Any:
         """
@@ -59,11 +201,7 @@ class MiroApp(APIApplication):
         Tags:
             Audit Logs
         """
-        url = f"{self.base_url}/v2/audit/logs"
-        query_params = {k: v for k, v in [('createdAfter', createdAfter), ('createdBefore', createdBefore), ('cursor', cursor), ('limit', limit), ('sorting', sorting)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_audit_logs', locals())
 
     def get_organization_settings(self, org_id) -> Any:
         """
@@ -78,13 +216,7 @@ class MiroApp(APIApplication):
         Tags:
             Board classification: Organization level
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/data-classification-settings"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_organization_settings', locals())
 
     def bulk_update_boards_classification(self, org_id, team_id, labelId=None, notClassifiedOnly=None) -> Any:
         """
@@ -109,20 +241,7 @@ class MiroApp(APIApplication):
         Tags:
             Board classification: Team level
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        request_body = {
-            'labelId': labelId,
-            'notClassifiedOnly': notClassifiedOnly,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/data-classification"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('bulk_update_boards_classification', locals())
 
     def get_team_settings(self, org_id, team_id) -> Any:
         """
@@ -138,15 +257,7 @@ class MiroApp(APIApplication):
         Tags:
             Board classification: Team level
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/data-classification-settings"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_team_settings', locals())
 
     def update_team_settings(self, org_id, team_id, defaultLabelId=None, enabled=None) -> Any:
         """
@@ -171,20 +282,7 @@ class MiroApp(APIApplication):
         Tags:
             Board classification: Team level
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        request_body = {
-            'defaultLabelId': defaultLabelId,
-            'enabled': enabled,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/data-classification-settings"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_team_settings', locals())
 
     def get_board_classification(self, org_id, team_id, board_id) -> Any:
         """
@@ -201,17 +299,7 @@ class MiroApp(APIApplication):
         Tags:
             Board classification: Board level
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/boards/{board_id}/data-classification"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_board_classification', locals())
 
     def update_board_classification(self, org_id, team_id, board_id, labelId=None) -> Any:
         """
@@ -235,21 +323,7 @@ class MiroApp(APIApplication):
         Tags:
             Board classification: Board level
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        request_body = {
-            'labelId': labelId,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/boards/{board_id}/data-classification"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_board_classification', locals())
 
     def get_all_cases(self, org_id, limit=None, cursor=None) -> Any:
         """
@@ -266,13 +340,7 @@ class MiroApp(APIApplication):
         Tags:
             Legal holds
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/cases"
-        query_params = {k: v for k, v in [('limit', limit), ('cursor', cursor)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_all_cases', locals())
 
     def get_case(self, org_id, case_id) -> Any:
         """
@@ -288,15 +356,7 @@ class MiroApp(APIApplication):
         Tags:
             Legal holds
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if case_id is None:
-            raise ValueError("Missing required parameter 'case_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/cases/{case_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_case', locals())
 
     def get_all_legal_holds_within_acase(self, org_id, case_id, limit=None, cursor=None) -> Any:
         """
@@ -314,15 +374,7 @@ class MiroApp(APIApplication):
         Tags:
             Legal holds
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if case_id is None:
-            raise ValueError("Missing required parameter 'case_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/cases/{case_id}/legal-holds"
-        query_params = {k: v for k, v in [('limit', limit), ('cursor', cursor)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_all_legal_holds_within_acase', locals())
 
     def get_legal_hold_information(self, org_id, case_id, legal_hold_id) -> Any:
         """
@@ -339,17 +391,7 @@ class MiroApp(APIApplication):
         Tags:
             Legal holds
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if case_id is None:
-            raise ValueError("Missing required parameter 'case_id'")
-        if legal_hold_id is None:
-            raise ValueError("Missing required parameter 'legal_hold_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/cases/{case_id}/legal-holds/{legal_hold_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_legal_hold_information', locals())
 
     def get_content_items_under_legal_hold(self, org_id, case_id, legal_hold_id, limit=None, cursor=None) -> Any:
         """
@@ -368,17 +410,7 @@ class MiroApp(APIApplication):
         Tags:
             Legal holds
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if case_id is None:
-            raise ValueError("Missing required parameter 'case_id'")
-        if legal_hold_id is None:
-            raise ValueError("Missing required parameter 'legal_hold_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/cases/{case_id}/legal-holds/{legal_hold_id}/content-items"
-        query_params = {k: v for k, v in [('limit', limit), ('cursor', cursor)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_content_items_under_legal_hold', locals())
 
     def create_board_export_job(self, org_id, request_id=None, boardFormat=None, boardIds=None) -> Any:
         """
@@ -405,18 +437,7 @@ class MiroApp(APIApplication):
         Tags:
             Board Export
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        request_body = {
-            'boardFormat': boardFormat,
-            'boardIds': boardIds,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/orgs/{org_id}/boards/export/jobs"
-        query_params = {k: v for k, v in [('request_id', request_id)] if v is not None}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_board_export_job', locals())
 
     def get_board_export_job_status(self, org_id, job_id) -> Any:
         """
@@ -432,15 +453,7 @@ class MiroApp(APIApplication):
         Tags:
             Board Export
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if job_id is None:
-            raise ValueError("Missing required parameter 'job_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/boards/export/jobs/{job_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_board_export_job_status', locals())
 
     def get_results_for_board_export_job(self, org_id, job_id) -> Any:
         """
@@ -456,15 +469,7 @@ class MiroApp(APIApplication):
         Tags:
             Board Export
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if job_id is None:
-            raise ValueError("Missing required parameter 'job_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/boards/export/jobs/{job_id}/results"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_results_for_board_export_job', locals())
 
     def retrieve_content_change_logs_of_board_items(self, org_id, board_ids=None, emails=None, from_=None, to=None, cursor=None, limit=None, sorting=None) -> Any:
         """
@@ -488,13 +493,7 @@ class MiroApp(APIApplication):
         Tags:
             Board Content Logs
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/content-logs/items"
-        query_params = {k: v for k, v in [('board_ids', board_ids), ('emails', emails), ('from', from_), ('to', to), ('cursor', cursor), ('limit', limit), ('sorting', sorting)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('retrieve_content_change_logs_of_board_items', locals())
 
     def reset_all_sessions_of_auser(self, email=None) -> Any:
         """
@@ -509,11 +508,7 @@ class MiroApp(APIApplication):
         Tags:
             Reset all sessions of a user
         """
-        url = f"{self.base_url}/v2/sessions/reset_all"
-        query_params = {k: v for k, v in [('email', email)] if v is not None}
-        response = self._post(url, data={}, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('reset_all_sessions_of_auser', locals())
 
     def get_organization_info(self, org_id) -> Any:
         """
@@ -528,13 +523,7 @@ class MiroApp(APIApplication):
         Tags:
             Organizations
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_organization_info', locals())
 
     def get_organization_members(self, org_id, emails=None, role=None, license=None, active=None, cursor=None, limit=None) -> Any:
         """
@@ -555,13 +544,7 @@ class MiroApp(APIApplication):
         Tags:
             Organization Members
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/members"
-        query_params = {k: v for k, v in [('emails', emails), ('role', role), ('license', license), ('active', active), ('cursor', cursor), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_organization_members', locals())
 
     def get_organization_member(self, org_id, member_id) -> Any:
         """
@@ -577,15 +560,7 @@ class MiroApp(APIApplication):
         Tags:
             Organization Members
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if member_id is None:
-            raise ValueError("Missing required parameter 'member_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/members/{member_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_organization_member', locals())
 
     def get_boards(self, team_id=None, project_id=None, query=None, owner=None, limit=None, offset=None, sort=None) -> Any:
         """
@@ -606,11 +581,7 @@ class MiroApp(APIApplication):
         Tags:
             Boards
         """
-        url = f"{self.base_url}/v2/boards"
-        query_params = {k: v for k, v in [('team_id', team_id), ('project_id', project_id), ('query', query), ('owner', owner), ('limit', limit), ('offset', offset), ('sort', sort)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_boards', locals())
 
     def copy_board(self, copy_from=None, description=None, name=None, policy=None, teamId=None) -> Any:
         """
@@ -650,18 +621,7 @@ class MiroApp(APIApplication):
         Tags:
             Boards
         """
-        request_body = {
-            'description': description,
-            'name': name,
-            'policy': policy,
-            'teamId': teamId,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards"
-        query_params = {k: v for k, v in [('copy_from', copy_from)] if v is not None}
-        response = self._put(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('copy_board', locals())
 
     def create_board(self, description=None, name=None, policy=None, projectId=None, teamId=None) -> Any:
         """
@@ -702,19 +662,7 @@ class MiroApp(APIApplication):
         Tags:
             Boards
         """
-        request_body = {
-            'description': description,
-            'name': name,
-            'policy': policy,
-            'projectId': projectId,
-            'teamId': teamId,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_board', locals())
 
     def get_specific_board(self, board_id) -> Any:
         """
@@ -729,13 +677,7 @@ class MiroApp(APIApplication):
         Tags:
             Boards
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_specific_board', locals())
 
     def delete_board(self, board_id) -> Any:
         """
@@ -750,13 +692,7 @@ class MiroApp(APIApplication):
         Tags:
             Boards
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_board', locals())
 
     def update_board(self, board_id, description=None, name=None, policy=None, projectId=None, teamId=None) -> Any:
         """
@@ -798,21 +734,7 @@ class MiroApp(APIApplication):
         Tags:
             Boards
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        request_body = {
-            'description': description,
-            'name': name,
-            'policy': policy,
-            'projectId': projectId,
-            'teamId': teamId,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_board', locals())
 
     def create_app_card_item(self, board_id, data=None, geometry=None, parent=None, position=None, style=None) -> Any:
         """
@@ -899,21 +821,7 @@ class MiroApp(APIApplication):
         Tags:
             App Cards
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-            'style': style,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/app_cards"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_app_card_item', locals())
 
     def get_app_card_item(self, board_id, item_id) -> Any:
         """
@@ -929,15 +837,7 @@ class MiroApp(APIApplication):
         Tags:
             App Cards
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/app_cards/{item_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_app_card_item', locals())
 
     def delete_app_card_item(self, board_id, item_id) -> Any:
         """
@@ -953,15 +853,7 @@ class MiroApp(APIApplication):
         Tags:
             App Cards
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/app_cards/{item_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_app_card_item', locals())
 
     def update_app_card_item(self, board_id, item_id, data=None, geometry=None, parent=None, position=None, style=None) -> Any:
         """
@@ -1049,23 +941,7 @@ class MiroApp(APIApplication):
         Tags:
             App Cards
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-            'style': style,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/app_cards/{item_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_app_card_item', locals())
 
     def create_card_item(self, board_id, data=None, geometry=None, parent=None, position=None, style=None) -> Any:
         """
@@ -1111,21 +987,7 @@ class MiroApp(APIApplication):
         Tags:
             Cards
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-            'style': style,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/cards"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_card_item', locals())
 
     def get_card_item(self, board_id, item_id) -> Any:
         """
@@ -1141,15 +1003,7 @@ class MiroApp(APIApplication):
         Tags:
             Cards
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/cards/{item_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_card_item', locals())
 
     def delete_card_item(self, board_id, item_id) -> Any:
         """
@@ -1165,15 +1019,7 @@ class MiroApp(APIApplication):
         Tags:
             Cards
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/cards/{item_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_card_item', locals())
 
     def update_card_item(self, board_id, item_id, data=None, geometry=None, parent=None, position=None, style=None) -> Any:
         """
@@ -1220,23 +1066,7 @@ class MiroApp(APIApplication):
         Tags:
             Cards
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-            'style': style,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/cards/{item_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_card_item', locals())
 
     def get_connectors(self, board_id, limit=None, cursor=None) -> Any:
         """
@@ -1253,13 +1083,7 @@ class MiroApp(APIApplication):
         Tags:
             Connectors
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/connectors"
-        query_params = {k: v for k, v in [('limit', limit), ('cursor', cursor)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_connectors', locals())
 
     def create_connector(self, board_id, captions=None, endItem=None, shape=None, startItem=None, style=None) -> Any:
         """
@@ -1413,21 +1237,7 @@ class MiroApp(APIApplication):
         Tags:
             Connectors
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        request_body = {
-            'captions': captions,
-            'endItem': endItem,
-            'shape': shape,
-            'startItem': startItem,
-            'style': style,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/connectors"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_connector', locals())
 
     def get_specific_connector(self, board_id, connector_id) -> Any:
         """
@@ -1443,15 +1253,7 @@ class MiroApp(APIApplication):
         Tags:
             Connectors
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if connector_id is None:
-            raise ValueError("Missing required parameter 'connector_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/connectors/{connector_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_specific_connector', locals())
 
     def delete_connector(self, board_id, connector_id) -> Any:
         """
@@ -1467,15 +1269,7 @@ class MiroApp(APIApplication):
         Tags:
             Connectors
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if connector_id is None:
-            raise ValueError("Missing required parameter 'connector_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/connectors/{connector_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_connector', locals())
 
     def update_connector(self, board_id, connector_id, captions=None, endItem=None, shape=None, startItem=None, style=None) -> Any:
         """
@@ -1630,23 +1424,7 @@ class MiroApp(APIApplication):
         Tags:
             Connectors
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if connector_id is None:
-            raise ValueError("Missing required parameter 'connector_id'")
-        request_body = {
-            'captions': captions,
-            'endItem': endItem,
-            'shape': shape,
-            'startItem': startItem,
-            'style': style,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/connectors/{connector_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_connector', locals())
 
     def create_document_item_using_url(self, board_id, data=None, geometry=None, parent=None, position=None) -> Any:
         """
@@ -1686,20 +1464,7 @@ class MiroApp(APIApplication):
         Tags:
             Documents
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/documents"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_document_item_using_url', locals())
 
     def get_document_item(self, board_id, item_id) -> Any:
         """
@@ -1715,15 +1480,7 @@ class MiroApp(APIApplication):
         Tags:
             Documents
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/documents/{item_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_document_item', locals())
 
     def delete_document_item(self, board_id, item_id) -> Any:
         """
@@ -1739,15 +1496,7 @@ class MiroApp(APIApplication):
         Tags:
             Documents
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/documents/{item_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_document_item', locals())
 
     def update_document_item_using_url(self, board_id, item_id, data=None, geometry=None, parent=None, position=None) -> Any:
         """
@@ -1788,22 +1537,7 @@ class MiroApp(APIApplication):
         Tags:
             Documents
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/documents/{item_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_document_item_using_url', locals())
 
     def create_embed_item(self, board_id, data=None, geometry=None, parent=None, position=None) -> Any:
         """
@@ -1843,20 +1577,7 @@ class MiroApp(APIApplication):
         Tags:
             Embeds
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/embeds"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_embed_item', locals())
 
     def get_embed_item(self, board_id, item_id) -> Any:
         """
@@ -1872,15 +1593,7 @@ class MiroApp(APIApplication):
         Tags:
             Embeds
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/embeds/{item_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_embed_item', locals())
 
     def delete_embed_item(self, board_id, item_id) -> Any:
         """
@@ -1896,15 +1609,7 @@ class MiroApp(APIApplication):
         Tags:
             Embeds
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/embeds/{item_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_embed_item', locals())
 
     def update_embed_item(self, board_id, item_id, data=None, geometry=None, parent=None, position=None) -> Any:
         """
@@ -1945,22 +1650,7 @@ class MiroApp(APIApplication):
         Tags:
             Embeds
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/embeds/{item_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_embed_item', locals())
 
     def create_image_item_using_url(self, board_id, data=None, geometry=None, parent=None, position=None) -> Any:
         """
@@ -2000,20 +1690,7 @@ class MiroApp(APIApplication):
         Tags:
             Images
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/images"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_image_item_using_url', locals())
 
     def get_image_item(self, board_id, item_id) -> Any:
         """
@@ -2029,15 +1706,7 @@ class MiroApp(APIApplication):
         Tags:
             Images
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/images/{item_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_image_item', locals())
 
     def delete_image_item(self, board_id, item_id) -> Any:
         """
@@ -2053,15 +1722,7 @@ class MiroApp(APIApplication):
         Tags:
             Images
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/images/{item_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_image_item', locals())
 
     def update_image_item_using_url(self, board_id, item_id, data=None, geometry=None, parent=None, position=None) -> Any:
         """
@@ -2102,22 +1763,7 @@ class MiroApp(APIApplication):
         Tags:
             Images
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/images/{item_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_image_item_using_url', locals())
 
     def get_items_on_board(self, board_id, limit=None, type=None, cursor=None) -> Any:
         """
@@ -2135,13 +1781,7 @@ class MiroApp(APIApplication):
         Tags:
             Items
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/items"
-        query_params = {k: v for k, v in [('limit', limit), ('type', type), ('cursor', cursor)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_items_on_board', locals())
 
     def get_specific_item_on_board(self, board_id, item_id) -> Any:
         """
@@ -2157,15 +1797,7 @@ class MiroApp(APIApplication):
         Tags:
             Items
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/items/{item_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_specific_item_on_board', locals())
 
     def delete_item(self, board_id, item_id) -> Any:
         """
@@ -2181,15 +1813,7 @@ class MiroApp(APIApplication):
         Tags:
             Items
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/items/{item_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_item', locals())
 
     def update_item_position_or_parent(self, board_id, item_id, parent=None, position=None) -> Any:
         """
@@ -2219,20 +1843,7 @@ class MiroApp(APIApplication):
         Tags:
             Items
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        request_body = {
-            'parent': parent,
-            'position': position,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/items/{item_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_item_position_or_parent', locals())
 
     def get_items_within_frame(self, board_id_PlatformContainers, parent_item_id=None, limit=None, type=None, cursor=None) -> Any:
         """
@@ -2251,13 +1862,7 @@ class MiroApp(APIApplication):
         Tags:
             Items
         """
-        if board_id_PlatformContainers is None:
-            raise ValueError("Missing required parameter 'board_id_PlatformContainers'")
-        url = f"{self.base_url}/v2/boards/{board_id_PlatformContainers}/items"
-        query_params = {k: v for k, v in [('parent_item_id', parent_item_id), ('limit', limit), ('type', type), ('cursor', cursor)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_items_within_frame', locals())
 
     def get_specific_item_on_board1(self, board_id, item_id) -> Any:
         """
@@ -2273,15 +1878,7 @@ class MiroApp(APIApplication):
         Tags:
             Flowchart shapes (experimental)
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2-experimental/boards/{board_id}/items/{item_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_specific_item_on_board1', locals())
 
     def delete_item1(self, board_id, item_id) -> Any:
         """
@@ -2297,15 +1894,7 @@ class MiroApp(APIApplication):
         Tags:
             Items
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2-experimental/boards/{board_id}/items/{item_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_item1', locals())
 
     def get_all_board_members(self, board_id, limit=None, offset=None) -> Any:
         """
@@ -2322,13 +1911,7 @@ class MiroApp(APIApplication):
         Tags:
             Board Members
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/members"
-        query_params = {k: v for k, v in [('limit', limit), ('offset', offset)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_all_board_members', locals())
 
     def share_board(self, board_id, emails=None, message=None, role=None) -> Any:
         """
@@ -2356,19 +1939,7 @@ class MiroApp(APIApplication):
         Tags:
             Board Members
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        request_body = {
-            'emails': emails,
-            'message': message,
-            'role': role,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/members"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('share_board', locals())
 
     def get_specific_board_member(self, board_id, board_member_id) -> Any:
         """
@@ -2384,15 +1955,7 @@ class MiroApp(APIApplication):
         Tags:
             Board Members
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if board_member_id is None:
-            raise ValueError("Missing required parameter 'board_member_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/members/{board_member_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_specific_board_member', locals())
 
     def remove_board_member(self, board_id, board_member_id) -> Any:
         """
@@ -2408,15 +1971,7 @@ class MiroApp(APIApplication):
         Tags:
             Board Members
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if board_member_id is None:
-            raise ValueError("Missing required parameter 'board_member_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/members/{board_member_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('remove_board_member', locals())
 
     def update_board_member(self, board_id, board_member_id, role=None) -> Any:
         """
@@ -2439,19 +1994,7 @@ class MiroApp(APIApplication):
         Tags:
             Board Members
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if board_member_id is None:
-            raise ValueError("Missing required parameter 'board_member_id'")
-        request_body = {
-            'role': role,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/members/{board_member_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_board_member', locals())
 
     def create_shape_item(self, board_id, data=None, geometry=None, parent=None, position=None, style=None) -> Any:
         """
@@ -2505,21 +2048,7 @@ class MiroApp(APIApplication):
         Tags:
             Shapes
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-            'style': style,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/shapes"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_shape_item', locals())
 
     def get_shape_item(self, board_id, item_id) -> Any:
         """
@@ -2535,15 +2064,7 @@ class MiroApp(APIApplication):
         Tags:
             Shapes
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/shapes/{item_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_shape_item', locals())
 
     def delete_shape_item(self, board_id, item_id) -> Any:
         """
@@ -2559,15 +2080,7 @@ class MiroApp(APIApplication):
         Tags:
             Shapes
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/shapes/{item_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_shape_item', locals())
 
     def update_shape_item(self, board_id, item_id, data=None, geometry=None, parent=None, position=None, style=None) -> Any:
         """
@@ -2622,23 +2135,7 @@ class MiroApp(APIApplication):
         Tags:
             Shapes
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-            'style': style,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/shapes/{item_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_shape_item', locals())
 
     def create_sticky_note_item(self, board_id, data=None, geometry=None, parent=None, position=None, style=None) -> Any:
         """
@@ -2683,21 +2180,7 @@ class MiroApp(APIApplication):
         Tags:
             Sticky Notes
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-            'style': style,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/sticky_notes"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_sticky_note_item', locals())
 
     def get_sticky_note_item(self, board_id, item_id) -> Any:
         """
@@ -2713,15 +2196,7 @@ class MiroApp(APIApplication):
         Tags:
             Sticky Notes
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/sticky_notes/{item_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_sticky_note_item', locals())
 
     def delete_sticky_note_item(self, board_id, item_id) -> Any:
         """
@@ -2737,15 +2212,7 @@ class MiroApp(APIApplication):
         Tags:
             Sticky Notes
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/sticky_notes/{item_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_sticky_note_item', locals())
 
     def update_sticky_note_item(self, board_id, item_id, data=None, geometry=None, parent=None, position=None, style=None) -> Any:
         """
@@ -2791,23 +2258,7 @@ class MiroApp(APIApplication):
         Tags:
             Sticky Notes
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-            'style': style,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/sticky_notes/{item_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_sticky_note_item', locals())
 
     def create_text_item(self, board_id, data=None, geometry=None, parent=None, position=None, style=None) -> Any:
         """
@@ -2854,21 +2305,7 @@ class MiroApp(APIApplication):
         Tags:
             Texts
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-            'style': style,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/texts"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_text_item', locals())
 
     def get_text_item(self, board_id, item_id) -> Any:
         """
@@ -2884,15 +2321,7 @@ class MiroApp(APIApplication):
         Tags:
             Texts
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/texts/{item_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_text_item', locals())
 
     def delete_text_item(self, board_id, item_id) -> Any:
         """
@@ -2908,15 +2337,7 @@ class MiroApp(APIApplication):
         Tags:
             Texts
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/texts/{item_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_text_item', locals())
 
     def update_text_item(self, board_id, item_id, data=None, geometry=None, parent=None, position=None, style=None) -> Any:
         """
@@ -2964,23 +2385,7 @@ class MiroApp(APIApplication):
         Tags:
             Texts
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-            'style': style,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/texts/{item_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_text_item', locals())
 
     def create_items_in_bulk(self, board_id, items=None) -> Any:
         """
@@ -2995,15 +2400,7 @@ class MiroApp(APIApplication):
         Tags:
             Bulk operations
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        # Use items array directly as request body
-        request_body = items
-        url = f"{self.base_url}/v2/boards/{board_id}/items/bulk"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_items_in_bulk', locals())
 
     def create_frame(self, board_id, data=None, geometry=None, position=None, style=None) -> Any:
         """
@@ -3044,20 +2441,7 @@ class MiroApp(APIApplication):
         Tags:
             Frames
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'position': position,
-            'style': style,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/frames"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_frame', locals())
 
     def get_frame(self, board_id, item_id) -> Any:
         """
@@ -3073,15 +2457,7 @@ class MiroApp(APIApplication):
         Tags:
             Frames
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/frames/{item_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_frame', locals())
 
     def delete_frame(self, board_id, item_id) -> Any:
         """
@@ -3097,15 +2473,7 @@ class MiroApp(APIApplication):
         Tags:
             Frames
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/frames/{item_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_frame', locals())
 
     def update_frame(self, board_id, item_id, data=None, geometry=None, position=None, style=None) -> Any:
         """
@@ -3147,22 +2515,7 @@ class MiroApp(APIApplication):
         Tags:
             Frames
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'position': position,
-            'style': style,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/frames/{item_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_frame', locals())
 
     def get_app_metrics(self, app_id, startDate=None, endDate=None, period=None) -> Any:
         """
@@ -3180,13 +2533,7 @@ class MiroApp(APIApplication):
         Tags:
             App metrics (experimental)
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'")
-        url = f"{self.base_url}/v2-experimental/apps/{app_id}/metrics"
-        query_params = {k: v for k, v in [('startDate', startDate), ('endDate', endDate), ('period', period)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_app_metrics', locals())
 
     def get_total_app_metrics(self, app_id) -> Any:
         """
@@ -3201,13 +2548,7 @@ class MiroApp(APIApplication):
         Tags:
             App metrics (experimental)
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'")
-        url = f"{self.base_url}/v2-experimental/apps/{app_id}/metrics-total"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_total_app_metrics', locals())
 
     def create_webhook_subscription(self, boardId=None, callbackUrl=None, status=None) -> Any:
         """
@@ -3232,17 +2573,7 @@ class MiroApp(APIApplication):
         Tags:
             Webhooks (experimental)
         """
-        request_body = {
-            'boardId': boardId,
-            'callbackUrl': callbackUrl,
-            'status': status,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2-experimental/webhooks/board_subscriptions"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_webhook_subscription', locals())
 
     def update_webhook_subscription(self, subscription_id, callbackUrl=None, status=None) -> Any:
         """
@@ -3266,18 +2597,7 @@ class MiroApp(APIApplication):
         Tags:
             Webhooks (experimental)
         """
-        if subscription_id is None:
-            raise ValueError("Missing required parameter 'subscription_id'")
-        request_body = {
-            'callbackUrl': callbackUrl,
-            'status': status,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2-experimental/webhooks/board_subscriptions/{subscription_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_webhook_subscription', locals())
 
     def get_webhook_subscriptions(self, limit=None, cursor=None) -> Any:
         """
@@ -3293,11 +2613,7 @@ class MiroApp(APIApplication):
         Tags:
             Webhooks (experimental)
         """
-        url = f"{self.base_url}/v2-experimental/webhooks/subscriptions"
-        query_params = {k: v for k, v in [('limit', limit), ('cursor', cursor)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_webhook_subscriptions', locals())
 
     def get_specific_webhook_subscription(self, subscription_id) -> Any:
         """
@@ -3312,13 +2628,7 @@ class MiroApp(APIApplication):
         Tags:
             Webhooks (experimental)
         """
-        if subscription_id is None:
-            raise ValueError("Missing required parameter 'subscription_id'")
-        url = f"{self.base_url}/v2-experimental/webhooks/subscriptions/{subscription_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_specific_webhook_subscription', locals())
 
     def delete_webhook_subscription(self, subscription_id) -> Any:
         """
@@ -3333,13 +2643,7 @@ class MiroApp(APIApplication):
         Tags:
             Webhooks (experimental)
         """
-        if subscription_id is None:
-            raise ValueError("Missing required parameter 'subscription_id'")
-        url = f"{self.base_url}/v2-experimental/webhooks/subscriptions/{subscription_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_webhook_subscription', locals())
 
     def get_specific_mind_map_node(self, board_id, item_id) -> Any:
         """
@@ -3355,15 +2659,7 @@ class MiroApp(APIApplication):
         Tags:
             Mind map nodes (experimental)
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2-experimental/boards/{board_id}/mindmap_nodes/{item_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_specific_mind_map_node', locals())
 
     def delete_mind_map_node(self, board_id, item_id) -> Any:
         """
@@ -3379,15 +2675,7 @@ class MiroApp(APIApplication):
         Tags:
             Mind map nodes (experimental)
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2-experimental/boards/{board_id}/mindmap_nodes/{item_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_mind_map_node', locals())
 
     def get_mind_map_nodes(self, board_id, limit=None, cursor=None) -> Any:
         """
@@ -3404,13 +2692,7 @@ class MiroApp(APIApplication):
         Tags:
             Mind map nodes (experimental)
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        url = f"{self.base_url}/v2-experimental/boards/{board_id}/mindmap_nodes"
-        query_params = {k: v for k, v in [('limit', limit), ('cursor', cursor)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_mind_map_nodes', locals())
 
     def create_mind_map_node(self, board_id, data=None, geometry=None, parent=None, position=None) -> Any:
         """
@@ -3451,20 +2733,7 @@ class MiroApp(APIApplication):
         Tags:
             Mind map nodes (experimental)
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2-experimental/boards/{board_id}/mindmap_nodes"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_mind_map_node', locals())
 
     def get_items_on_board1(self, board_id, limit=None, type=None, cursor=None) -> Any:
         """
@@ -3482,13 +2751,7 @@ class MiroApp(APIApplication):
         Tags:
             Flowchart shapes (experimental)
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        url = f"{self.base_url}/v2-experimental/boards/{board_id}/items"
-        query_params = {k: v for k, v in [('limit', limit), ('type', type), ('cursor', cursor)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_items_on_board1', locals())
 
     def create_shape_item1(self, board_id, data=None, geometry=None, parent=None, position=None, style=None) -> Any:
         """
@@ -3542,21 +2805,7 @@ class MiroApp(APIApplication):
         Tags:
             Flowchart shapes (experimental)
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-            'style': style,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2-experimental/boards/{board_id}/shapes"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_shape_item1', locals())
 
     def get_shape_item1(self, board_id, item_id) -> Any:
         """
@@ -3572,15 +2821,7 @@ class MiroApp(APIApplication):
         Tags:
             Flowchart shapes (experimental)
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2-experimental/boards/{board_id}/shapes/{item_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_shape_item1', locals())
 
     def delete_shape_item1(self, board_id, item_id) -> Any:
         """
@@ -3596,15 +2837,7 @@ class MiroApp(APIApplication):
         Tags:
             Flowchart shapes (experimental)
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2-experimental/boards/{board_id}/shapes/{item_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_shape_item1', locals())
 
     def update_shape_item1(self, board_id, item_id, data=None, geometry=None, parent=None, position=None, style=None) -> Any:
         """
@@ -3659,23 +2892,7 @@ class MiroApp(APIApplication):
         Tags:
             Flowchart shapes (experimental)
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        request_body = {
-            'data': data,
-            'geometry': geometry,
-            'parent': parent,
-            'position': position,
-            'style': style,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2-experimental/boards/{board_id}/shapes/{item_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_shape_item1', locals())
 
     def get_all_groups_on_aboard(self, board_id, limit=None, cursor=None) -> Any:
         """
@@ -3692,13 +2909,7 @@ class MiroApp(APIApplication):
         Tags:
             Groups
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/groups"
-        query_params = {k: v for k, v in [('limit', limit), ('cursor', cursor)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_all_groups_on_aboard', locals())
 
     def create_group(self, board_id, data=None) -> Any:
         """
@@ -3725,17 +2936,7 @@ class MiroApp(APIApplication):
         Tags:
             Groups
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        request_body = {
-            'data': data,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/groups"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_group', locals())
 
     def get_items_of_agroup_by_id(self, board_id, limit=None, cursor=None, group_item_id=None) -> Any:
         """
@@ -3753,13 +2954,7 @@ class MiroApp(APIApplication):
         Tags:
             Groups
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/groups/items"
-        query_params = {k: v for k, v in [('limit', limit), ('cursor', cursor), ('group_item_id', group_item_id)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_items_of_agroup_by_id', locals())
 
     def get_agroup_by_its_id(self, board_id, group_id) -> Any:
         """
@@ -3775,15 +2970,7 @@ class MiroApp(APIApplication):
         Tags:
             Groups
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if group_id is None:
-            raise ValueError("Missing required parameter 'group_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/groups/{group_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_agroup_by_its_id', locals())
 
     def updates_agroup_with_new_items(self, board_id, group_id, data=None) -> Any:
         """
@@ -3811,19 +2998,7 @@ class MiroApp(APIApplication):
         Tags:
             Groups
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if group_id is None:
-            raise ValueError("Missing required parameter 'group_id'")
-        request_body = {
-            'data': data,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/groups/{group_id}"
-        query_params = {}
-        response = self._put(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('updates_agroup_with_new_items', locals())
 
     def ungroup_items(self, board_id, group_id, delete_items=None) -> Any:
         """
@@ -3840,15 +3015,7 @@ class MiroApp(APIApplication):
         Tags:
             Groups
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if group_id is None:
-            raise ValueError("Missing required parameter 'group_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/groups/{group_id}"
-        query_params = {k: v for k, v in [('delete_items', delete_items)] if v is not None}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('ungroup_items', locals())
 
     def deletes_the_group(self, board_id, delete_items=None) -> Any:
         """
@@ -3865,13 +3032,7 @@ class MiroApp(APIApplication):
         Tags:
             Groups
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/groups/<string>"
-        query_params = {k: v for k, v in [('delete_items', delete_items)] if v is not None}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('deletes_the_group', locals())
 
     def revoke_token_v2(self, accessToken=None, clientId=None, clientSecret=None) -> Any:
         """
@@ -3896,17 +3057,7 @@ class MiroApp(APIApplication):
         Tags:
             OAuth
         """
-        request_body = {
-            'accessToken': accessToken,
-            'clientId': clientId,
-            'clientSecret': clientSecret,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/oauth/revoke"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('revoke_token_v2', locals())
 
     def get_tags_from_item(self, board_id, item_id) -> Any:
         """
@@ -3922,15 +3073,7 @@ class MiroApp(APIApplication):
         Tags:
             Tags
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/items/{item_id}/tags"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_tags_from_item', locals())
 
     def get_tags_from_board(self, board_id, limit=None, offset=None) -> Any:
         """
@@ -3947,13 +3090,7 @@ class MiroApp(APIApplication):
         Tags:
             Tags
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/tags"
-        query_params = {k: v for k, v in [('limit', limit), ('offset', offset)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_tags_from_board', locals())
 
     def create_tag(self, board_id, fillColor=None, title=None) -> Any:
         """
@@ -3977,18 +3114,7 @@ class MiroApp(APIApplication):
         Tags:
             Tags
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        request_body = {
-            'fillColor': fillColor,
-            'title': title,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/tags"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_tag', locals())
 
     def get_tag(self, board_id, tag_id) -> Any:
         """
@@ -4004,15 +3130,7 @@ class MiroApp(APIApplication):
         Tags:
             Tags
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if tag_id is None:
-            raise ValueError("Missing required parameter 'tag_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/tags/{tag_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_tag', locals())
 
     def delete_tag(self, board_id, tag_id) -> Any:
         """
@@ -4028,15 +3146,7 @@ class MiroApp(APIApplication):
         Tags:
             Tags
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if tag_id is None:
-            raise ValueError("Missing required parameter 'tag_id'")
-        url = f"{self.base_url}/v2/boards/{board_id}/tags/{tag_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_tag', locals())
 
     def update_tag(self, board_id, tag_id, fillColor=None, title=None) -> Any:
         """
@@ -4061,20 +3171,7 @@ class MiroApp(APIApplication):
         Tags:
             Tags
         """
-        if board_id is None:
-            raise ValueError("Missing required parameter 'board_id'")
-        if tag_id is None:
-            raise ValueError("Missing required parameter 'tag_id'")
-        request_body = {
-            'fillColor': fillColor,
-            'title': title,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/boards/{board_id}/tags/{tag_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_tag', locals())
 
     def get_items_by_tag(self, board_id_PlatformTags, limit=None, offset=None, tag_id=None) -> Any:
         """
@@ -4092,13 +3189,7 @@ class MiroApp(APIApplication):
         Tags:
             Tags
         """
-        if board_id_PlatformTags is None:
-            raise ValueError("Missing required parameter 'board_id_PlatformTags'")
-        url = f"{self.base_url}/v2/boards/{board_id_PlatformTags}/items"
-        query_params = {k: v for k, v in [('limit', limit), ('offset', offset), ('tag_id', tag_id)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_items_by_tag', locals())
 
     def attach_tag_to_item(self, board_id_PlatformTags, item_id, tag_id=None) -> Any:
         """
@@ -4115,15 +3206,7 @@ class MiroApp(APIApplication):
         Tags:
             Tags
         """
-        if board_id_PlatformTags is None:
-            raise ValueError("Missing required parameter 'board_id_PlatformTags'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id_PlatformTags}/items/{item_id}"
-        query_params = {k: v for k, v in [('tag_id', tag_id)] if v is not None}
-        response = self._post(url, data={}, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('attach_tag_to_item', locals())
 
     def remove_tag_from_item(self, board_id_PlatformTags, item_id, tag_id=None) -> Any:
         """
@@ -4140,15 +3223,7 @@ class MiroApp(APIApplication):
         Tags:
             Tags
         """
-        if board_id_PlatformTags is None:
-            raise ValueError("Missing required parameter 'board_id_PlatformTags'")
-        if item_id is None:
-            raise ValueError("Missing required parameter 'item_id'")
-        url = f"{self.base_url}/v2/boards/{board_id_PlatformTags}/items/{item_id}"
-        query_params = {k: v for k, v in [('tag_id', tag_id)] if v is not None}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('remove_tag_from_item', locals())
 
     def list_of_projects(self, org_id, team_id, limit=None, cursor=None) -> Any:
         """
@@ -4166,15 +3241,7 @@ class MiroApp(APIApplication):
         Tags:
             Projects
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/projects"
-        query_params = {k: v for k, v in [('limit', limit), ('cursor', cursor)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('list_of_projects', locals())
 
     def create_project(self, org_id, team_id, name=None) -> Any:
         """
@@ -4197,19 +3264,7 @@ class MiroApp(APIApplication):
         Tags:
             Projects
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        request_body = {
-            'name': name,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/projects"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_project', locals())
 
     def get_project(self, org_id, team_id, project_id) -> Any:
         """
@@ -4226,17 +3281,7 @@ class MiroApp(APIApplication):
         Tags:
             Projects
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        if project_id is None:
-            raise ValueError("Missing required parameter 'project_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_project', locals())
 
     def delete_project(self, org_id, team_id, project_id) -> Any:
         """
@@ -4253,17 +3298,7 @@ class MiroApp(APIApplication):
         Tags:
             Projects
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        if project_id is None:
-            raise ValueError("Missing required parameter 'project_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_project', locals())
 
     def update_project(self, org_id, team_id, project_id, name=None) -> Any:
         """
@@ -4287,21 +3322,7 @@ class MiroApp(APIApplication):
         Tags:
             Projects
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        if project_id is None:
-            raise ValueError("Missing required parameter 'project_id'")
-        request_body = {
-            'name': name,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_project', locals())
 
     def get_project_settings(self, org_id, team_id, project_id) -> Any:
         """
@@ -4318,17 +3339,7 @@ class MiroApp(APIApplication):
         Tags:
             Project Settings
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        if project_id is None:
-            raise ValueError("Missing required parameter 'project_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}/settings"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_project_settings', locals())
 
     def update_project_settings(self, org_id, team_id, project_id, sharingPolicySettings=None) -> Any:
         """
@@ -4354,21 +3365,7 @@ class MiroApp(APIApplication):
         Tags:
             Project Settings
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        if project_id is None:
-            raise ValueError("Missing required parameter 'project_id'")
-        request_body = {
-            'sharingPolicySettings': sharingPolicySettings,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}/settings"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_project_settings', locals())
 
     def list_of_project_members(self, org_id, team_id, project_id, limit=None, cursor=None) -> Any:
         """
@@ -4387,17 +3384,7 @@ class MiroApp(APIApplication):
         Tags:
             Project Members
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        if project_id is None:
-            raise ValueError("Missing required parameter 'project_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}/members"
-        query_params = {k: v for k, v in [('limit', limit), ('cursor', cursor)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('list_of_project_members', locals())
 
     def add_member_in_aproject(self, org_id, team_id, project_id, email=None, role=None) -> Any:
         """
@@ -4423,22 +3410,7 @@ class MiroApp(APIApplication):
         Tags:
             Project Members
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        if project_id is None:
-            raise ValueError("Missing required parameter 'project_id'")
-        request_body = {
-            'email': email,
-            'role': role,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}/members"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('add_member_in_aproject', locals())
 
     def get_project_member(self, org_id, team_id, project_id, member_id) -> Any:
         """
@@ -4456,19 +3428,7 @@ class MiroApp(APIApplication):
         Tags:
             Project Members
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        if project_id is None:
-            raise ValueError("Missing required parameter 'project_id'")
-        if member_id is None:
-            raise ValueError("Missing required parameter 'member_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}/members/{member_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_project_member', locals())
 
     def remove_project_member(self, org_id, team_id, project_id, member_id) -> Any:
         """
@@ -4486,19 +3446,7 @@ class MiroApp(APIApplication):
         Tags:
             Project Members
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        if project_id is None:
-            raise ValueError("Missing required parameter 'project_id'")
-        if member_id is None:
-            raise ValueError("Missing required parameter 'member_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}/members/{member_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('remove_project_member', locals())
 
     def update_project_member(self, org_id, team_id, project_id, member_id, role=None) -> Any:
         """
@@ -4523,23 +3471,7 @@ class MiroApp(APIApplication):
         Tags:
             Project Members
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        if project_id is None:
-            raise ValueError("Missing required parameter 'project_id'")
-        if member_id is None:
-            raise ValueError("Missing required parameter 'member_id'")
-        request_body = {
-            'role': role,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}/members/{member_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_project_member', locals())
 
     def list_teams(self, org_id, limit=None, cursor=None, name=None) -> Any:
         """
@@ -4557,13 +3489,7 @@ class MiroApp(APIApplication):
         Tags:
             Teams
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams"
-        query_params = {k: v for k, v in [('limit', limit), ('cursor', cursor), ('name', name)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('list_teams', locals())
 
     def create_team(self, org_id, name=None) -> Any:
         """
@@ -4585,17 +3511,7 @@ class MiroApp(APIApplication):
         Tags:
             Teams, important
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        request_body = {
-            'name': name,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('create_team', locals())
 
     def get_team(self, org_id, team_id) -> Any:
         """
@@ -4611,15 +3527,7 @@ class MiroApp(APIApplication):
         Tags:
             Teams, important
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_team', locals())
 
     def delete_team(self, org_id, team_id) -> Any:
         """
@@ -4635,15 +3543,7 @@ class MiroApp(APIApplication):
         Tags:
             Teams, important
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_team', locals())
 
     def update_team(self, org_id, team_id, name=None) -> Any:
         """
@@ -4666,19 +3566,7 @@ class MiroApp(APIApplication):
         Tags:
             Teams, important
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        request_body = {
-            'name': name,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_team', locals())
 
     def list_team_members(self, org_id, team_id, limit=None, cursor=None, role=None) -> Any:
         """
@@ -4701,15 +3589,7 @@ class MiroApp(APIApplication):
         Tags:
             Team Members, important
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/members"
-        query_params = {k: v for k, v in [('limit', limit), ('cursor', cursor), ('role', role)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('list_team_members', locals())
 
     def invite_team_members(self, org_id, team_id, email=None, role=None) -> Any:
         """
@@ -4734,20 +3614,7 @@ class MiroApp(APIApplication):
         Tags:
             Team Members
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        request_body = {
-            'email': email,
-            'role': role,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/members"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('invite_team_members', locals())
 
     def get_team_member(self, org_id, team_id, member_id) -> Any:
         """
@@ -4764,17 +3631,7 @@ class MiroApp(APIApplication):
         Tags:
             Team Members
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        if member_id is None:
-            raise ValueError("Missing required parameter 'member_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/members/{member_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_team_member', locals())
 
     def delete_team_member_from_team(self, org_id, team_id, member_id) -> Any:
         """
@@ -4791,17 +3648,7 @@ class MiroApp(APIApplication):
         Tags:
             Team Members
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        if member_id is None:
-            raise ValueError("Missing required parameter 'member_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/members/{member_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('delete_team_member_from_team', locals())
 
     def update_team_member(self, org_id, team_id, member_id, role=None) -> Any:
         """
@@ -4825,21 +3672,7 @@ class MiroApp(APIApplication):
         Tags:
             Team Members
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        if member_id is None:
-            raise ValueError("Missing required parameter 'member_id'")
-        request_body = {
-            'role': role,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/members/{member_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('update_team_member', locals())
 
     def get_default_team_settings(self, org_id) -> Any:
         """
@@ -4854,13 +3687,7 @@ class MiroApp(APIApplication):
         Tags:
             Team Settings
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/default_teams_settings"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_default_team_settings', locals())
 
     def get_team_settings1(self, org_id, team_id) -> Any:
         """
@@ -4876,15 +3703,7 @@ class MiroApp(APIApplication):
         Tags:
             Team Settings
         """
-        if org_id is None:
-            raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/settings"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._call('get_team_settings1', locals())
 
     def update_team_settings1(self, org_id, team_id, teamAccountDiscoverySettings=None, teamCollaborationSettings=None, teamCopyAccessLevelSettings=None, teamInvitationSettings=None, teamSharingPolicySettings=None) -> Any:
         """
@@ -4940,23 +3759,1217 @@ class MiroApp(APIApplication):
         Tags:
             Team Settings
         """
+        return self._call('update_team_settings1', locals())
+
+    def iter_audit_logs(
+        self, createdAfter, createdBefore, sorting=None, limit=100, prefetch=True
+    ) -> Iterator[dict]:
+        """
+        Iterates over all audit logs in a time range, following the cursor page by page.
+
+        Args:
+            createdAfter (string): Start of the time range (ISO 8601, UTC). Example:
+                '2023-03-30T17:26:50.000Z'.
+            createdBefore (string): End of the time range (ISO 8601, UTC). Example:
+                '2023-04-30T17:26:50.000Z'.
+            sorting (string): Sort order of the results, 'ASC' or 'DESC'.
+            limit (integer): Page size requested per call (max 100).
+            prefetch (boolean): Fetch the next page while the current one is consumed.
+
+        Returns:
+            Iterator[dict]: Audit log events, streamed one at a time.
+        """
+        return iter_cursor(
+            lambda cursor: self.get_audit_logs(
+                createdAfter=createdAfter,
+                createdBefore=createdBefore,
+                cursor=cursor,
+                limit=limit,
+                sorting=sorting,
+            ),
+            prefetch=prefetch,
+        )
+
+    def iter_cases(self, org_id, limit=100, prefetch=True) -> Iterator[dict]:
+        """
+        Iterates over all eDiscovery cases of an organization.
+
+        Args:
+            org_id (string): org_id
+            limit (integer): Page size requested per call (max 100).
+            prefetch (boolean): Fetch the next page while the current one is consumed.
+
+        Returns:
+            Iterator[dict]: Cases, streamed one at a time.
+        """
+        return iter_cursor(
+            lambda cursor: self.get_all_cases(org_id, limit=limit, cursor=cursor),
+            prefetch=prefetch,
+        )
+
+    def iter_legal_holds(
+        self, org_id, case_id, limit=100, prefetch=True
+    ) -> Iterator[dict]:
+        """
+        Iterates over all legal holds within a case.
+
+        Args:
+            org_id (string): org_id
+            case_id (string): case_id
+            limit (integer): Page size requested per call (max 100).
+            prefetch (boolean): Fetch the next page while the current one is consumed.
+
+        Returns:
+            Iterator[dict]: Legal holds, streamed one at a time.
+        """
+        return iter_cursor(
+            lambda cursor: self.get_all_legal_holds_within_acase(
+                org_id, case_id, limit=limit, cursor=cursor
+            ),
+            prefetch=prefetch,
+        )
+
+    def iter_content_items_under_legal_hold(
+        self, org_id, case_id, legal_hold_id, limit=100, prefetch=True
+    ) -> Iterator[dict]:
+        """
+        Iterates over all content items held by a legal hold.
+
+        Args:
+            org_id (string): org_id
+            case_id (string): case_id
+            legal_hold_id (string): legal_hold_id
+            limit (integer): Page size requested per call (max 100).
+            prefetch (boolean): Fetch the next page while the current one is consumed.
+
+        Returns:
+            Iterator[dict]: Content items, streamed one at a time.
+        """
+        return iter_cursor(
+            lambda cursor: self.get_content_items_under_legal_hold(
+                org_id, case_id, legal_hold_id, limit=limit, cursor=cursor
+            ),
+            prefetch=prefetch,
+        )
+
+    def iter_content_change_logs(
+        self,
+        org_id,
+        from_,
+        to,
+        board_ids=None,
+        emails=None,
+        sorting=None,
+        limit=1000,
+        prefetch=True,
+    ) -> Iterator[dict]:
+        """
+        Iterates over all content change log entries of board items in a time range.
+
+        Args:
+            org_id (string): org_id
+            from_ (string): Start of the time range (ISO 8601, UTC).
+            to (string): End of the time range (ISO 8601, UTC).
+            board_ids (array): Optional list of board IDs to restrict the logs to.
+            emails (array): Optional list of user emails to restrict the logs to.
+            sorting (string): Sort order of the results, 'asc' or 'desc'.
+            limit (integer): Page size requested per call (max 1000).
+            prefetch (boolean): Fetch the next page while the current one is consumed.
+
+        Returns:
+            Iterator[dict]: Change log entries, streamed one at a time.
+        """
+        return iter_cursor(
+            lambda cursor: self.retrieve_content_change_logs_of_board_items(
+                org_id,
+                board_ids=board_ids,
+                emails=emails,
+                from_=from_,
+                to=to,
+                cursor=cursor,
+                limit=limit,
+                sorting=sorting,
+            ),
+            prefetch=prefetch,
+        )
+
+    def iter_organization_members(
+        self,
+        org_id,
+        emails=None,
+        role=None,
+        license=None,
+        active=None,
+        limit=100,
+        prefetch=True,
+    ) -> Iterator[dict]:
+        """
+        Iterates over all members of an organization matching the given filters.
+
+        Args:
+            org_id (string): org_id
+            emails (string): Optional comma-separated list of emails to filter by.
+            role (string): Optional role to filter by.
+            license (string): Optional license type to filter by.
+            active (boolean): Optional active status to filter by.
+            limit (integer): Page size requested per call (max 100).
+            prefetch (boolean): Fetch the next page while the current one is consumed.
+
+        Returns:
+            Iterator[dict]: Organization members, streamed one at a time.
+        """
+        return iter_cursor(
+            lambda cursor: self.get_organization_members(
+                org_id,
+                emails=emails,
+                role=role,
+                license=license,
+                active=active,
+                cursor=cursor,
+                limit=limit,
+            ),
+            prefetch=prefetch,
+        )
+
+    def iter_connectors(self, board_id, limit=50, prefetch=True) -> Iterator[dict]:
+        """
+        Iterates over all connectors on a board.
+
+        Args:
+            board_id (string): board_id
+            limit (integer): Page size requested per call (max 50).
+            prefetch (boolean): Fetch the next page while the current one is consumed.
+
+        Returns:
+            Iterator[dict]: Connectors, streamed one at a time.
+        """
+        return iter_cursor(
+            lambda cursor: self.get_connectors(board_id, limit=limit, cursor=cursor),
+            prefetch=prefetch,
+        )
+
+    def iter_items_on_board(
+        self, board_id, type=None, limit=50, prefetch=True
+    ) -> Iterator[dict]:
+        """
+        Iterates over all items on a board, optionally restricted to one item type.
+
+        Args:
+            board_id (string): board_id
+            type (string): Optional item type to filter by. Example: 'sticky_note'.
+            limit (integer): Page size requested per call (max 50).
+            prefetch (boolean): Fetch the next page while the current one is consumed.
+
+        Returns:
+            Iterator[dict]: Board items, streamed one at a time.
+        """
+        return iter_cursor(
+            lambda cursor: self.get_items_on_board(
+                board_id, limit=limit, type=type, cursor=cursor
+            ),
+            prefetch=prefetch,
+        )
+
+    def iter_items_within_frame(
+        self, board_id, parent_item_id, type=None, limit=50, prefetch=True
+    ) -> Iterator[dict]:
+        """
+        Iterates over all items inside a frame.
+
+        Args:
+            board_id (string): board_id
+            parent_item_id (string): ID of the frame whose children are listed.
+            type (string): Optional item type to filter by. Example: 'sticky_note'.
+            limit (integer): Page size requested per call (max 50).
+            prefetch (boolean): Fetch the next page while the current one is consumed.
+
+        Returns:
+            Iterator[dict]: Items within the frame, streamed one at a time.
+        """
+        return iter_cursor(
+            lambda cursor: self.get_items_within_frame(
+                board_id,
+                parent_item_id=parent_item_id,
+                limit=limit,
+                type=type,
+                cursor=cursor,
+            ),
+            prefetch=prefetch,
+        )
+
+    def iter_webhook_subscriptions(self, limit=100, prefetch=True) -> Iterator[dict]:
+        """
+        Iterates over all webhook subscriptions of the current user.
+
+        Args:
+            limit (integer): Page size requested per call (max 100).
+            prefetch (boolean): Fetch the next page while the current one is consumed.
+
+        Returns:
+            Iterator[dict]: Webhook subscriptions, streamed one at a time.
+        """
+        return iter_cursor(
+            lambda cursor: self.get_webhook_subscriptions(limit=limit, cursor=cursor),
+            prefetch=prefetch,
+        )
+
+    def iter_mind_map_nodes(self, board_id, limit=50, prefetch=True) -> Iterator[dict]:
+        """
+        Iterates over all mind map nodes on a board.
+
+        Args:
+            board_id (string): board_id
+            limit (integer): Page size requested per call (max 50).
+            prefetch (boolean): Fetch the next page while the current one is consumed.
+
+        Returns:
+            Iterator[dict]: Mind map nodes, streamed one at a time.
+        """
+        return iter_cursor(
+            lambda cursor: self.get_mind_map_nodes(
+                board_id, limit=limit, cursor=cursor
+            ),
+            prefetch=prefetch,
+        )
+
+    def iter_groups_on_board(self, board_id, limit=50, prefetch=True) -> Iterator[dict]:
+        """
+        Iterates over all groups on a board.
+
+        Args:
+            board_id (string): board_id
+            limit (integer): Page size requested per call (max 50).
+            prefetch (boolean): Fetch the next page while the current one is consumed.
+
+        Returns:
+            Iterator[dict]: Groups, streamed one at a time.
+        """
+        return iter_cursor(
+            lambda cursor: self.get_all_groups_on_aboard(
+                board_id, limit=limit, cursor=cursor
+            ),
+            prefetch=prefetch,
+        )
+
+    def iter_items_of_group(
+        self, board_id, group_item_id, limit=50, prefetch=True
+    ) -> Iterator[dict]:
+        """
+        Iterates over all items belonging to a group.
+
+        Args:
+            board_id (string): board_id
+            group_item_id (string): ID of the group whose items are listed.
+            limit (integer): Page size requested per call (max 50).
+            prefetch (boolean): Fetch the next page while the current one is consumed.
+
+        Returns:
+            Iterator[dict]: Group items, streamed one at a time.
+        """
+        return iter_cursor(
+            lambda cursor: self.get_items_of_agroup_by_id(
+                board_id, limit=limit, cursor=cursor, group_item_id=group_item_id
+            ),
+            prefetch=prefetch,
+        )
+
+    def iter_projects(
+        self, org_id, team_id, limit=100, prefetch=True
+    ) -> Iterator[dict]:
+        """
+        Iterates over all projects of a team.
+
+        Args:
+            org_id (string): org_id
+            team_id (string): team_id
+            limit (integer): Page size requested per call (max 100).
+            prefetch (boolean): Fetch the next page while the current one is consumed.
+
+        Returns:
+            Iterator[dict]: Projects, streamed one at a time.
+        """
+        return iter_cursor(
+            lambda cursor: self.list_of_projects(
+                org_id, team_id, limit=limit, cursor=cursor
+            ),
+            prefetch=prefetch,
+        )
+
+    def iter_project_members(
+        self, org_id, team_id, project_id, limit=100, prefetch=True
+    ) -> Iterator[dict]:
+        """
+        Iterates over all members of a project.
+
+        Args:
+            org_id (string): org_id
+            team_id (string): team_id
+            project_id (string): project_id
+            limit (integer): Page size requested per call (max 100).
+            prefetch (boolean): Fetch the next page while the current one is consumed.
+
+        Returns:
+            Iterator[dict]: Project members, streamed one at a time.
+        """
+        return iter_cursor(
+            lambda cursor: self.list_of_project_members(
+                org_id, team_id, project_id, limit=limit, cursor=cursor
+            ),
+            prefetch=prefetch,
+        )
+
+    def iter_teams(self, org_id, name=None, limit=100, prefetch=True) -> Iterator[dict]:
+        """
+        Iterates over all teams of an organization, optionally filtered by name.
+
+        Args:
+            org_id (string): org_id
+            name (string): Optional team name to filter by.
+            limit (integer): Page size requested per call (max 100).
+            prefetch (boolean): Fetch the next page while the current one is consumed.
+
+        Returns:
+            Iterator[dict]: Teams, streamed one at a time.
+        """
+        return iter_cursor(
+            lambda cursor: self.list_teams(
+                org_id, limit=limit, cursor=cursor, name=name
+            ),
+            prefetch=prefetch,
+        )
+
+    def iter_team_members(
+        self, org_id, team_id, role=None, limit=100, prefetch=True
+    ) -> Iterator[dict]:
+        """
+        Iterates over all members of a team, optionally filtered by role.
+
+        Args:
+            org_id (string): org_id
+            team_id (string): team_id
+            role (string): Optional team role to filter by.
+            limit (integer): Page size requested per call (max 100).
+            prefetch (boolean): Fetch the next page while the current one is consumed.
+
+        Returns:
+            Iterator[dict]: Team members, streamed one at a time.
+        """
+        return iter_cursor(
+            lambda cursor: self.list_team_members(
+                org_id, team_id, limit=limit, cursor=cursor, role=role
+            ),
+            prefetch=prefetch,
+        )
+
+    def fetch_all_boards(
+        self,
+        team_id=None,
+        project_id=None,
+        query=None,
+        owner=None,
+        sort=None,
+        page_size=50,
+        max_workers=8,
+    ) -> list[dict]:
+        """
+        Retrieves every matching board, fetching the offset windows concurrently.
+
+        Args:
+            team_id (string): Optional team to list boards from.
+            project_id (string): Optional project to list boards from.
+            query (string): Optional text to search board names and descriptions for.
+            owner (string): Optional owner ID to filter by.
+            sort (string): Optional sort order. Example: 'last_modified'.
+            page_size (integer): Number of boards requested per window (max 50).
+            max_workers (integer): Maximum number of windows fetched at the same time.
+
+        Returns:
+            list[dict]: All matching boards, in the order returned by the API.
+        """
+        return fetch_offset_windows(
+            lambda offset, limit: self.get_boards(
+                team_id=team_id,
+                project_id=project_id,
+                query=query,
+                owner=owner,
+                limit=limit,
+                offset=offset,
+                sort=sort,
+            ),
+            page_size=page_size,
+            max_workers=max_workers,
+        )
+
+    def fetch_all_board_members(
+        self, board_id, page_size=50, max_workers=8
+    ) -> list[dict]:
+        """
+        Retrieves every member of a board, fetching offset windows concurrently.
+
+        Args:
+            board_id (string): board_id
+            page_size (integer): Number of members requested per window (max 50).
+            max_workers (integer): Maximum number of windows fetched at the same time.
+
+        Returns:
+            list[dict]: All board members.
+        """
+        return fetch_offset_windows(
+            lambda offset, limit: self.get_all_board_members(
+                board_id, limit=limit, offset=offset
+            ),
+            page_size=page_size,
+            max_workers=max_workers,
+        )
+
+    def fetch_all_tags_from_board(
+        self, board_id, page_size=50, max_workers=8
+    ) -> list[dict]:
+        """
+        Retrieves every tag of a board, fetching offset windows concurrently.
+
+        Args:
+            board_id (string): board_id
+            page_size (integer): Number of tags requested per window (max 50).
+            max_workers (integer): Maximum number of windows fetched at the same time.
+
+        Returns:
+            list[dict]: All tags on the board.
+        """
+        return fetch_offset_windows(
+            lambda offset, limit: self.get_tags_from_board(
+                board_id, limit=limit, offset=offset
+            ),
+            page_size=page_size,
+            max_workers=max_workers,
+        )
+
+    def fetch_all_items_by_tag(
+        self, board_id, tag_id, page_size=50, max_workers=8
+    ) -> list[dict]:
+        """
+        Retrieves every item carrying a tag, fetching offset windows concurrently.
+
+        Args:
+            board_id (string): board_id
+            tag_id (string): ID of the tag to filter items by.
+            page_size (integer): Number of items requested per window (max 50).
+            max_workers (integer): Maximum number of windows fetched at the same time.
+
+        Returns:
+            list[dict]: All items with the tag attached.
+        """
+        return fetch_offset_windows(
+            lambda offset, limit: self.get_items_by_tag(
+                board_id, limit=limit, offset=offset, tag_id=tag_id
+            ),
+            page_size=page_size,
+            max_workers=max_workers,
+        )
+
+    def board_snapshot(self, board_id, max_age=300.0) -> BoardSnapshot:
+        """
+        Returns a local snapshot of a board, reloaded once older than `max_age` seconds.
+
+        Snapshots are kept in `self.snapshots` and follow the writes made through this
+        client. A reload evicts the board's cached responses first, so it reflects
+        changes made by others even while their list pages are still cached.
+
+        Args:
+            board_id (string): board_id
+            max_age (number): Maximum age in seconds of a reused snapshot; 0 always
+                reloads the board from the API.
+
+        Returns:
+            BoardSnapshot: The board's snapshot.
+        """
+        snapshot = self.snapshots.get(board_id)
+        if (
+            snapshot is None
+            or snapshot.loaded_at is None
+            or time.time() - snapshot.loaded_at > max_age
+        ):
+            self.cache.invalidate_scope(f"board:{board_id}")
+            snapshot = BoardSnapshot.load(self, board_id)
+            self.snapshots[board_id] = snapshot
+        return snapshot
+
+    def bulk_create_items(
+        self, board_id, items, chunk_size=MAX_BULK_ITEMS, max_workers=4
+    ) -> dict:
+        """
+        Creates any number of items on a board by splitting them into bulk requests of
+        at most 20 items that are sent concurrently within the rate limit budget.
+
+        Args:
+            board_id (string): board_id
+            items (array): Item definitions in the format accepted by
+                create_items_in_bulk, e.g.
+                `{"type": "sticky_note", "data": {"content": "Hello"}}`.
+            chunk_size (integer): Number of items sent per bulk request (max 20).
+            max_workers (integer): Maximum number of bulk requests in flight at once.
+
+        Returns:
+            dict: `ids` holds the created item IDs in input order, with null for items
+                of a failed chunk; `failures` lists each failed chunk with its `start`
+                index, `size` and `error`.
+
+        Tags:
+            Bulk operations
+        """
+        if board_id is None:
+            raise ValueError("Missing required parameter 'board_id'")
+        if not 1 <= chunk_size <= MAX_BULK_ITEMS:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_BULK_ITEMS}")
+        items = list(items or [])
+        chunks = chunked(items, chunk_size)
+        outcomes = run_concurrently(
+            lambda chunk: self.create_items_in_bulk(board_id, items=list(chunk)),
+            chunks,
+            max_workers=max_workers,
+        )
+        ids, failures = [], []
+        for index, (chunk, outcome) in enumerate(zip(chunks, outcomes)):
+            if outcome.error is not None:
+                ids.extend([None] * len(chunk))
+                failures.append(
+                    {
+                        "start": index * chunk_size,
+                        "size": len(chunk),
+                        "error": describe_error(outcome.error),
+                    }
+                )
+                continue
+            created = (
+                (outcome.result.get("data") or [])
+                if isinstance(outcome.result, dict)
+                else []
+            )
+            ids.extend(item.get("id") for item in created)
+            ids.extend([None] * (len(chunk) - len(created)))
+        return {"ids": ids, "failures": failures}
+
+    def bulk_update_items(self, board_id, updates, max_workers=8) -> dict:
+        """
+        Updates many items on a board concurrently, routing each update to the endpoint
+        for its item type.
+
+        Args:
+            board_id (string): board_id
+            updates (array): One object per item with its `id`, optional `type` (e.g.
+                'sticky_note', 'shape', 'text', 'card', 'frame') and the fields to
+                change (`data`, `style`, `geometry`, `position`, `parent`). Updates
+                without a type may only change `position` and `parent`. Example:
+                `[{"id": "3458764517517818867", "type": "text", "style": {...}}]`.
+            max_workers (integer): Maximum number of update requests in flight at once.
+
+        Returns:
+            dict: `results` holds one entry per update in input order with the item
+                `id`, `ok` and, on failure, `error`; `succeeded` and `failed` count the
+                outcomes.
+
+        Tags:
+            Bulk operations
+        """
+        if board_id is None:
+            raise ValueError("Missing required parameter 'board_id'")
+
+        def update(patch):
+            fields = dict(patch)
+            item_id = fields.pop("id", None)
+            if item_id is None:
+                raise ValueError("Missing required field 'id'")
+            item_type = fields.pop("type", None)
+            if item_type is None:
+                method = self.update_item_position_or_parent
+            elif item_type in _ITEM_UPDATE_METHODS:
+                method = getattr(self, _ITEM_UPDATE_METHODS[item_type])
+            else:
+                raise ValueError(f"Unsupported item type '{item_type}'")
+            return method(board_id, item_id, **fields)
+
+        updates = list(updates or [])
+        return _summarize_outcomes(
+            [patch.get("id") for patch in updates],
+            run_concurrently(update, updates, max_workers=max_workers),
+        )
+
+    def bulk_delete_items(self, board_id, item_ids, max_workers=8) -> dict:
+        """
+        Deletes many items from a board concurrently.
+
+        Args:
+            board_id (string): board_id
+            item_ids (array): IDs of the items to delete. Example:
+                `["3458764517517818867", "3458764517517818868"]`.
+            max_workers (integer): Maximum number of delete requests in flight at once.
+
+        Returns:
+            dict: `results` holds one entry per item in input order with the item `id`,
+                `ok` and, on failure, `error`; `succeeded` and `failed` count the
+                outcomes.
+
+        Tags:
+            Bulk operations
+        """
+        if board_id is None:
+            raise ValueError("Missing required parameter 'board_id'")
+
+        item_ids = list(item_ids or [])
+        return _summarize_outcomes(
+            item_ids,
+            run_concurrently(
+                lambda item_id: self.delete_item(board_id, item_id),
+                item_ids,
+                max_workers=max_workers,
+            ),
+        )
+
+    def find_free_positions(
+        self, board_id, sizes, near_x=0.0, near_y=0.0, gap=20.0, frame_id=None
+    ) -> list[dict]:
+        """
+        Finds positions where new items can be placed without overlapping existing items
+        or each other, computed locally from a snapshot of the board.
+
+        Args:
+            board_id (string): board_id
+            sizes (array): Width and height of each new item, e.g.
+                `[{"width": 200, "height": 200}, {"width": 400, "height": 100}]`.
+            near_x (number): X coordinate the items should be placed close to.
+            near_y (number): Y coordinate the items should be placed close to.
+            gap (number): Minimum free space kept around each item.
+            frame_id (string): Optional frame the items must fit in. Positions are then
+                relative to the frame's top-left corner, as expected for items created
+                with the frame as parent.
+
+        Returns:
+            list[dict]: One `{"x", "y"}` center per size in input order, usable as the
+                item's `position`.
+
+        Tags:
+            Items
+        """
+        from universal_mcp_miro import placement  # noqa: PLC0415
+        from universal_mcp_miro.spatial import SpatialIndex  # noqa: PLC0415
+
+        if board_id is None:
+            raise ValueError("Missing required parameter 'board_id'")
+        snapshot = self.board_snapshot(board_id)
+        index = SpatialIndex.from_snapshot(snapshot)
+        region = None
+        if frame_id is not None:
+            region = snapshot.bounds(frame_id)
+            if region is None:
+                raise ValueError(f"Frame '{frame_id}' not found on board '{board_id}'")
+            index.remove(frame_id)
+        boxes = [(float(size["width"]), float(size["height"])) for size in sizes or []]
+        positions = placement.find_free_positions(
+            index,
+            boxes,
+            near=(float(near_x), float(near_y)),
+            gap=float(gap),
+            region=region,
+        )
+        if region is not None:
+            positions = [
+                {"x": position["x"] - region[0], "y": position["y"] - region[1]}
+                for position in positions
+            ]
+        return positions
+
+    def analyze_connector_graph(
+        self, board_id, start_item_id=None, end_item_id=None
+    ) -> dict:
+        """
+        Analyzes the flow formed by the connectors on a board: topological order or a
+        cycle, and optionally what an item reaches and the shortest path between two
+        items.
+
+        Args:
+            board_id (string): board_id
+            start_item_id (string): Optional item to report the reachable items from.
+            end_item_id (string): Optional item to find the shortest connector path to
+                from start_item_id.
+
+        Returns:
+            dict: `nodes` and `edges` counts; `order` with item IDs in flow order, or
+                `cycle` with the item IDs of a cycle when there is no such order; with
+                start_item_id, `reachable` item IDs; with both items, `path` as item IDs
+                or null.
+
+        Tags:
+            Connectors
+        """
+        from universal_mcp_miro.graph import ConnectorGraph  # noqa: PLC0415
+
+        if board_id is None:
+            raise ValueError("Missing required parameter 'board_id'")
+        graph = ConnectorGraph.from_connectors(self.iter_connectors(board_id))
+        result = {"nodes": len(graph), "edges": len(graph.edges)}
+        cycle = graph.find_cycle()
+        if cycle is None:
+            result["order"] = graph.topological_order()
+        else:
+            result["cycle"] = cycle
+        if start_item_id is not None:
+            result["reachable"] = sorted(graph.reachable(start_item_id))
+            if end_item_id is not None:
+                result["path"] = graph.shortest_path(start_item_id, end_item_id)
+        return result
+
+    def get_mind_map_tree(self, board_id) -> list[dict]:
+        """
+        Retrieves every mind map on a board as a nested hierarchy, built in one pass
+        over the paginated node list.
+
+        Args:
+            board_id (string): board_id
+
+        Returns:
+            list[dict]: One outline per mind map root, each node as `{"id", "content",
+                "children"}`.
+
+        Tags:
+            Mind map nodes (experimental)
+        """
+        from universal_mcp_miro.mindmap import MindMapTree  # noqa: PLC0415
+
+        if board_id is None:
+            raise ValueError("Missing required parameter 'board_id'")
+        return MindMapTree.from_nodes(self.iter_mind_map_nodes(board_id)).to_outline()
+
+    def create_mind_map(self, board_id, outline, x=0, y=0, max_workers=8) -> dict:
+        """
+        Creates a whole mind map from a nested outline, creating all nodes of a level
+        concurrently once their parents exist.
+
+        Args:
+            board_id (string): board_id
+            outline (array): Root nodes; each is a string or `{"content": "...",
+                "children": [...]}`. Example: `[{"content": "Plan", "children":
+                ["Goals", {"content": "Risks", "children": ["Budget"]}]}]`.
+            x (number): X coordinate of the roots on the board.
+            y (number): Y coordinate of the first root on the board; further roots are
+                stacked below it, spaced by the size of each subtree.
+            max_workers (integer): Maximum number of nodes created at the same time.
+
+        Returns:
+            dict: `nodes` lists the created nodes as `{"path", "id"}`, where `path` is
+                the index path such as "0/1/0"; `failures` lists failed nodes with
+                `path`, `error` and the number of `skipped` descendants.
+
+        Tags:
+            Mind map nodes (experimental)
+        """
+        from universal_mcp_miro.mindmap import build_level_by_level, root_positions  # noqa: PLC0415
+
+        if board_id is None:
+            raise ValueError("Missing required parameter 'board_id'")
+        outline = list(outline or [])
+        roots = [
+            {"content": spec} if isinstance(spec, str) else dict(spec)
+            for spec in outline
+        ]
+        for spec, position in zip(roots, root_positions(outline, float(x), float(y))):
+            spec["position"] = position
+
+        def create(spec, parent_id):
+            data = {
+                "nodeView": {
+                    "data": {"type": "text", "content": spec.get("content", "")}
+                }
+            }
+            if parent_id is None:
+                node = self.create_mind_map_node(
+                    board_id, data=data, position=spec["position"]
+                )
+            else:
+                node = self.create_mind_map_node(
+                    board_id, data=data, parent={"id": parent_id}
+                )
+            return node["id"]
+
+        return build_level_by_level(create, roots, max_workers=max_workers)
+
+    def export_boards(
+        self,
+        org_id,
+        board_ids,
+        directory,
+        board_format="SVG",
+        shard_size=50,
+        max_workers=4,
+        timeout=3600,
+    ) -> dict:
+        """
+        Exports boards to local files in one call: creates export jobs for shards of the
+        board list concurrently, polls them with adaptive backoff and streams each
+        archive to disk with resume support.
+
+        Args:
+            org_id (string): org_id
+            board_ids (array): IDs of the boards to export. Example: `["o9J_kzlUDmo="]`.
+            directory (string): Local folder the archives are written to; created if
+                missing.
+            board_format (string): Export format. Example: 'SVG'.
+            shard_size (integer): Maximum number of boards per export job.
+            max_workers (integer): Maximum number of export jobs handled at the same
+                time.
+            timeout (number): Seconds each export job may take before it is reported as
+                failed.
+
+        Returns:
+            dict: `boards` holds one entry per board in input order with `boardId`,
+                `jobId` and either the local `path` or an `error`; `succeeded` and
+                `failed` count the outcomes.
+
+        Tags:
+            Board Export
+        """
+        from universal_mcp_miro import export  # noqa: PLC0415
+
+        if org_id is None:
+            raise ValueError("Missing required parameter 'org_id'")
+        boards = export.export_boards(
+            self,
+            org_id,
+            list(board_ids or []),
+            directory,
+            board_format=board_format,
+            shard_size=shard_size,
+            max_workers=max_workers,
+            timeout=timeout,
+        )
+        failed = sum(1 for board in boards if "error" in board)
+        return {"boards": boards, "succeeded": len(boards) - failed, "failed": failed}
+
+    def sync_content_logs(self, org_id, database, start=None) -> dict:
+        """
+        Copies the organization's board content logs into a local SQLite database,
+        fetching only the entries added since the previous sync and resuming an
+        interrupted one.
+
+        Args:
+            org_id (string): org_id
+            database (string): Path of the SQLite database file; created if missing.
+            start (string): Start of the first sync (ISO 8601, UTC); later syncs
+                continue from their checkpoint. Defaults to the last 90 days. Example:
+                '2024-01-01T00:00:00Z'.
+
+        Returns:
+            dict: Number of `fetched` entries, the synced window `from` and `to`, and
+                whether an interrupted sync was `resumed`.
+
+        Tags:
+            Board Content Logs
+        """
+        from universal_mcp_miro.contentlogs import ContentLogStore, parse_timestamp  # noqa: PLC0415
+
         if org_id is None:
             raise ValueError("Missing required parameter 'org_id'")
-        if team_id is None:
-            raise ValueError("Missing required parameter 'team_id'")
-        request_body = {
-            'teamAccountDiscoverySettings': teamAccountDiscoverySettings,
-            'teamCollaborationSettings': teamCollaborationSettings,
-            'teamCopyAccessLevelSettings': teamCopyAccessLevelSettings,
-            'teamInvitationSettings': teamInvitationSettings,
-            'teamSharingPolicySettings': teamSharingPolicySettings,
+        with ContentLogStore(database) as store:
+            return store.sync(
+                self, org_id, start=parse_timestamp(start) if start else None
+            )
+
+    def query_content_logs(
+        self,
+        database,
+        org_id=None,
+        board_id=None,
+        item_id=None,
+        actor_email=None,
+        action_type=None,
+        since=None,
+        until=None,
+        limit=100,
+    ) -> list[dict]:
+        """
+        Queries board content logs previously copied with sync_content_logs, without
+        calling the API.
+
+        Args:
+            database (string): Path of the SQLite database written by sync_content_logs.
+            org_id (string): Optional organization to filter by.
+            board_id (string): Optional board to filter by.
+            item_id (string): Optional board item to filter by.
+            actor_email (string): Optional email of the user who made the changes.
+            action_type (string): Optional action to filter by: 'create', 'update' or
+                'delete'.
+            since (string): Optional earliest action time (ISO 8601, UTC), inclusive.
+            until (string): Optional latest action time (ISO 8601, UTC), exclusive.
+            limit (integer): Maximum number of entries returned.
+
+        Returns:
+            list[dict]: Matching log entries, oldest first.
+
+        Tags:
+            Board Content Logs
+        """
+        from universal_mcp_miro.contentlogs import ContentLogStore  # noqa: PLC0415
+
+        with ContentLogStore(database) as store:
+            return store.changes(
+                org_id=org_id,
+                board_id=board_id,
+                item_id=item_id,
+                actor_email=actor_email,
+                action_type=action_type,
+                since=since,
+                until=until,
+                limit=limit,
+            )
+
+    def export_audit_logs(
+        self, createdAfter, createdBefore, path, window_hours=24, max_workers=4
+    ) -> dict:
+        """
+        Exports all audit logs of a time range to a JSONL file, fetching sub-windows of
+        the range concurrently and resuming an interrupted export.
+
+        Args:
+            createdAfter (string): Start of the time range (ISO 8601, UTC). Example:
+                '2023-03-30T17:26:50.000Z'.
+            createdBefore (string): End of the time range (ISO 8601, UTC). Example:
+                '2023-06-30T17:26:50.000Z'.
+            path (string): Local JSONL file the events are written to, oldest first, one
+                per line.
+            window_hours (number): Length in hours of the sub-windows fetched in
+                parallel.
+            max_workers (integer): Maximum number of sub-windows fetched at the same
+                time.
+
+        Returns:
+            dict: Output `path`, number of `events` written, `duplicates` dropped,
+                number of `windows` and of windows `resumed` from an earlier run.
+
+        Tags:
+            Audit Logs
+        """
+
+        from universal_mcp_miro import auditlogs  # noqa: PLC0415
+
+        if createdAfter is None or createdBefore is None:
+            raise ValueError(
+                "Missing required parameters 'createdAfter' and 'createdBefore'"
+            )
+        return auditlogs.export_audit_logs(
+            self,
+            path,
+            createdAfter,
+            createdBefore,
+            window=timedelta(hours=window_hours),
+            max_workers=max_workers,
+        )
+
+    def reconcile_board(
+        self,
+        board_id,
+        items,
+        connectors=None,
+        tags=None,
+        state=None,
+        prune=False,
+        dry_run=False,
+        max_workers=8,
+    ) -> dict:
+        """
+        Brings a board to a desired state with the fewest calls: diffs the desired
+        items, connectors and tags against the live board and only creates, updates or
+        deletes what differs, batching and running the calls concurrently.
+
+        Args:
+            board_id (string): board_id
+            items (array): Desired items, each with a stable `key` (or a live `id`),
+                `type`, and optional `data`, `style`, `geometry`, `position`, `parent`
+                (key or ID of a frame) and `tags` (tag titles). Example:
+                `[{"key": "intro", "type": "sticky_note", "data": {"content": "Hello"},
+                "position": {"x": 0, "y": 0}}]`.
+            connectors (array): Desired connectors with `start` and `end` item keys or
+                IDs, and optional `key`, `style`, `captions` and `shape`.
+            tags (array): Desired tags with `title` and optional `fillColor`; omit to
+                leave the board's tags unmanaged.
+            state (object): The `ids` returned by the previous run, used to match keys
+                to live items.
+            prune (boolean): Delete live items, connectors and tags that are not in the
+                desired state.
+            dry_run (boolean): Only report the planned changes.
+            max_workers (integer): Maximum number of calls in flight at the same time.
+
+        Returns:
+            dict: `summary` counts of planned creates, updates, deletes, tag changes and
+                unchanged objects; unless dry_run, `ids` (store and pass back as
+                `state`) and `failures`.
+
+        Tags:
+            Bulk operations
+        """
+        from universal_mcp_miro.reconcile import apply_plan, plan_reconciliation  # noqa: PLC0415
+
+        if board_id is None:
+            raise ValueError("Missing required parameter 'board_id'")
+        snapshot = self.board_snapshot(board_id, max_age=0)
+        plan = plan_reconciliation(
+            snapshot,
+            list(items or []),
+            connectors=list(connectors or []),
+            tags=tags,
+            state=state,
+            prune=prune,
+        )
+        if dry_run:
+            return {"summary": plan.summary()}
+        return apply_plan(self, board_id, plan, max_workers=max_workers)
+
+    def batch(self, operations, max_workers=8) -> dict:
+        """
+        Runs many independent endpoint operations in one call, concurrently and under
+        the shared rate limit scheduler.
+
+        Args:
+            operations (array): One object per call with the endpoint tool name as
+                `operation` and its arguments as `args`. Composite tools such as
+                bulk_create_items cannot be batched. Example:
+                `[{"operation": "get_specific_item_on_board", "args": {"board_id":
+                "uXjVOD", "item_id": "3458764517517818867"}}]`.
+            max_workers (integer): Maximum number of calls in flight at the same time.
+
+        Returns:
+            dict: `results` holds one entry per operation in input order with
+                `operation`, `ok` and either `result` or `error`; `succeeded` and
+                `failed` count the outcomes.
+
+        Tags:
+            Bulk operations
+        """
+
+        def run(call):
+            name = call.get("operation")
+            if name not in ENDPOINTS:
+                raise ValueError(f"Unknown operation '{name}'")
+            if self.batch_operations is not None and name not in self.batch_operations:
+                raise ValueError(f"Operation '{name}' is not enabled")
+            return getattr(self, name)(**(call.get("args") or {}))
+
+        operations = list(operations or [])
+        if not all(isinstance(call, dict) for call in operations):
+            raise ValueError(
+                "Each operation must be an object with 'operation' and 'args'"
+            )
+        results = [
+            {"operation": call.get("operation"), "ok": True, "result": outcome.result}
+            if outcome.error is None
+            else {
+                "operation": call.get("operation"),
+                "ok": False,
+                "error": describe_error(outcome.error),
+            }
+            for call, outcome in zip(
+                operations, run_concurrently(run, operations, max_workers=max_workers)
+            )
+        ]
+        failed = sum(not result["ok"] for result in results)
+        return {
+            "results": results,
+            "succeeded": len(results) - failed,
+            "failed": failed,
+        }
+
+    def hydrate_items(
+        self,
+        board_id,
+        items,
+        fields=None,
+        use_snapshot=True,
+        max_age=300.0,
+        max_workers=8,
+    ) -> dict:
+        """
+        Returns the full payloads of many items, served from the board snapshot where it
+        already holds them and otherwise fetched concurrently, once per item.
+
+        Args:
+            board_id (string): board_id
+            items (array): Item IDs, or objects with `id` and optional `type` (e.g.
+                entries of get_items_on_board) so an item that must be fetched uses its
+                typed endpoint. Example: `["3458764517517818867",
+                {"id": "3458764517517818868", "type": "card"}]`.
+            fields (array): Payload fields an item must have to be served from the
+                snapshot. Defaults to `["data"]`.
+            use_snapshot (boolean): Serve items from the board snapshot, loading it in
+                one paged pass over the board when none younger than max_age is held.
+                Disable to fetch every item, e.g. for a few items on a very large board.
+            max_age (number): Maximum age in seconds of a reused snapshot.
+            max_workers (integer): Maximum number of fetches in flight at the same time.
+
+        Returns:
+            dict: `items` holds one payload per input entry in input order, null when it
+                could not be fetched; `served` and `fetched` count the distinct items
+                taken from the snapshot and from the API; `failures` lists each failed
+                `id` with its `error`.
+
+        Tags:
+            Bulk operations
+        """
+        if board_id is None:
+            raise ValueError("Missing required parameter 'board_id'")
+        entries = [
+            item if isinstance(item, dict) else {"id": item} for item in items or []
+        ]
+        if any(entry.get("id") is None for entry in entries):
+            raise ValueError("Missing required field 'id'")
+        ids = [str(entry["id"]) for entry in entries]
+        types = {}
+        for item_id, entry in zip(ids, entries):
+            if entry.get("type"):
+                types.setdefault(item_id, entry["type"])
+        required = list(fields or ["data"])
+        snapshot = (
+            self.board_snapshot(board_id, max_age=max_age) if use_snapshot else None
+        )
+
+        known = _snapshot_payloads(snapshot, ids) if snapshot is not None else {}
+        payloads, missing = {}, []
+        for item_id in dict.fromkeys(ids):
+            payload = known.get(item_id)
+            if payload is not None and all(field in payload for field in required):
+                payloads[item_id] = payload
+                continue
+            if payload is not None and payload.get("type"):
+                types.setdefault(item_id, payload["type"])
+            missing.append(item_id)
+        served = len(payloads)
+
+        def fetch(item_id):
+            return getattr(
+                self,
+                _ITEM_GET_METHODS.get(types.get(item_id), "get_specific_item_on_board"),
+            )(board_id, item_id)
+
+        fetched, failures = 0, []
+        for item_id, outcome in zip(
+            missing, run_concurrently(fetch, missing, max_workers=max_workers)
+        ):
+            if outcome.error is not None:
+                failures.append({"id": item_id, "error": describe_error(outcome.error)})
+                continue
+            payloads[item_id] = outcome.result
+            fetched += 1
+            if (
+                snapshot is not None
+                and isinstance(outcome.result, dict)
+                and outcome.result.get("id")
+                and outcome.result.get("type")
+            ):
+                # upsert_item takes the snapshot lock shared with the request threads.
+                snapshot.upsert_item(outcome.result)
+        return {
+            "items": [payloads.get(item_id) for item_id in ids],
+            "served": served,
+            "fetched": fetched,
+            "failures": failures,
         }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/v2/orgs/{org_id}/teams/{team_id}/settings"
-        query_params = {}
-        response = self._patch(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
 
     def list_tools(self):
         return [
@@ -5100,4 +5113,82 @@ class MiroApp(APIApplication):
             self.get_default_team_settings,
             self.get_team_settings1,
             self.update_team_settings1
-        ]
+        ] + self._composite_tools()
+
+    def _composite_tools(self):
+        """Tools that combine several endpoint calls, bound to this app."""
+        return [getattr(self, name) for name in COMPOSITE_OPERATIONS]
+
+
+# Tools that combine several endpoint calls, in listing order; AsyncMiroApp runs
+# them on a worker thread.
+COMPOSITE_OPERATIONS: tuple[str, ...] = (
+    "bulk_create_items",
+    "bulk_update_items",
+    "bulk_delete_items",
+    "find_free_positions",
+    "analyze_connector_graph",
+    "get_mind_map_tree",
+    "create_mind_map",
+    "export_boards",
+    "sync_content_logs",
+    "query_content_logs",
+    "export_audit_logs",
+    "reconcile_board",
+    "batch",
+    "hydrate_items",
+)
+
+
+# Typed update endpoint for each item type accepted by MiroApp.bulk_update_items.
+_ITEM_UPDATE_METHODS = {
+    "app_card": "update_app_card_item",
+    "card": "update_card_item",
+    "document": "update_document_item_using_url",
+    "embed": "update_embed_item",
+    "frame": "update_frame",
+    "image": "update_image_item_using_url",
+    "shape": "update_shape_item",
+    "sticky_note": "update_sticky_note_item",
+    "text": "update_text_item",
+}
+
+
+# Typed detail endpoint for each item type, used by MiroApp.hydrate_items.
+_ITEM_GET_METHODS = {
+    "app_card": "get_app_card_item",
+    "card": "get_card_item",
+    "connector": "get_specific_connector",
+    "document": "get_document_item",
+    "embed": "get_embed_item",
+    "frame": "get_frame",
+    "image": "get_image_item",
+    "mindmap_node": "get_specific_mind_map_node",
+    "shape": "get_shape_item",
+    "sticky_note": "get_sticky_note_item",
+    "text": "get_text_item",
+}
+
+
+def _summarize_outcomes(item_ids, outcomes) -> dict:
+    results = [
+        {"id": item_id, "ok": True}
+        if outcome.error is None
+        else {"id": item_id, "ok": False, "error": describe_error(outcome.error)}
+        for item_id, outcome in zip(item_ids, outcomes)
+    ]
+    failed = sum(not result["ok"] for result in results)
+    return {"results": results, "succeeded": len(results) - failed, "failed": failed}
+
+
+def _snapshot_payloads(snapshot: BoardSnapshot, item_ids) -> dict:
+    """Payloads a snapshot holds for the given item or connector IDs, by ID."""
+    known = {}
+    with snapshot.lock:
+        for item_id in dict.fromkeys(item_ids):
+            payload = snapshot.connectors.get(item_id)
+            if payload is None and (item := snapshot.get(item_id)) is not None:
+                payload = item.payload
+            if payload is not None:
+                known[item_id] = payload
+    return known
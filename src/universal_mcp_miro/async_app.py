@@ -0,0 +1,228 @@
+import asyncio
+import functools
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+from universal_mcp.applications import APIApplication
+from universal_mcp.integrations import Integration
+
+from universal_mcp_miro.app import COMPOSITE_OPERATIONS, MiroApp
+from universal_mcp_miro.cache import ResponseCache, normalize_params
+from universal_mcp_miro.endpoints import ENDPOINTS, PreparedRequest, decode_response
+from universal_mcp_miro.ratelimit import CreditScheduler, request_weight
+from universal_mcp_miro.retry import RetryPolicy
+from universal_mcp_miro.singleflight import AsyncSingleFlight
+from universal_mcp_miro.snapshot import BoardSnapshot, apply_write_to_snapshots
+
+
+class _RequestBuilder:
+    """Stands in for a MiroApp so an endpoint method returns its request unsent."""
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url
+
+    def _call(self, name: str, args: dict[str, Any]) -> PreparedRequest:
+        return ENDPOINTS[name].prepare(self.base_url, args)
+
+
+def prepare_request(
+    operation: Callable[..., Any], base_url: str, *args, **kwargs
+) -> PreparedRequest:
+    """
+    Builds the HTTP request a MiroApp endpoint operation would send, without sending it.
+
+    The arguments are bound by the operation itself and validated against its
+    endpoint spec, so missing path parameters still raise ValueError.
+
+    Args:
+        operation (Callable): An unbound MiroApp endpoint method.
+        base_url (str): Base URL the request URL is built from.
+        *args: Positional arguments of the operation.
+        **kwargs: Keyword arguments of the operation.
+
+    Returns:
+        PreparedRequest: The HTTP method, URL, query parameters and JSON body.
+    """
+    return operation(_RequestBuilder(base_url), *args, **kwargs)
+
+
+ENDPOINT_OPERATIONS: tuple[str, ...] = tuple(ENDPOINTS)
+
+
+class AsyncMiroApp(APIApplication):
+    """
+    Asyncio counterpart of MiroApp.
+
+    Exposes every MiroApp endpoint operation under the same name, signature and
+    docstring, but as a coroutine sent on one shared `httpx.AsyncClient`, so many
+    Miro calls can be in flight from a single event loop. Composite tools such as
+    bulk_create_items run on a worker thread with a MiroApp that shares this
+    app's scheduler, retry policy and cache.
+    """
+
+    def __init__(
+        self,
+        integration: Integration = None,
+        client: httpx.AsyncClient | None = None,
+        max_connections: int = 100,
+        scheduler: CreditScheduler | None = None,
+        retry_policy: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(name="miro", integration=integration, **kwargs)
+        self.base_url = "https://api.miro.com"
+        self.scheduler = scheduler or CreditScheduler()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache if cache is not None else ResponseCache()
+        self.snapshots: dict[str, BoardSnapshot] = {}
+        self.inflight = AsyncSingleFlight()
+        self.batch_operations: frozenset[str] | None = None
+        self.max_connections = max_connections
+        self._async_client = client
+        self._sync_app: MiroApp | None = None
+
+    @property
+    def sync_app(self) -> MiroApp:
+        """The MiroApp sharing this app's policies and snapshots, made on first use."""
+        if self._sync_app is None:
+            self._sync_app = MiroApp(
+                integration=self.integration,
+                scheduler=self.scheduler,
+                retry_policy=self.retry_policy,
+                cache=self.cache,
+            )
+            self._sync_app.snapshots = self.snapshots
+        self._sync_app.batch_operations = self.batch_operations
+        return self._sync_app
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """The shared async HTTP client, created on first use."""
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                headers=self._get_headers(),
+                timeout=self.default_timeout,
+                limits=httpx.Limits(max_connections=self.max_connections),
+            )
+        return self._async_client
+
+    async def _asend(self, request: PreparedRequest) -> httpx.Response:
+        if request.method != "GET":
+            try:
+                response = await self._asend_with_retry(request)
+            except httpx.TransportError:
+                self.cache.on_write(request.method, request.url)
+                raise
+            if response.is_success:
+                self.cache.on_write(request.method, request.url, response)
+                apply_write_to_snapshots(
+                    self.snapshots,
+                    request.method,
+                    request.url,
+                    request.params,
+                    response,
+                )
+            return response
+        key = self.cache.key_for(request.url, request.params)
+        if key is not None:
+            response = self.cache.get(key)
+            if response is not None:
+                return response
+
+        async def fetch() -> httpx.Response:
+            generation = self.cache.generation(key) if key is not None else None
+            response = await self._asend_with_retry(request)
+            if key is not None and response.is_success:
+                self.cache.put(key, response, generation)
+            return response
+
+        return await self.inflight.do(
+            (
+                request.url,
+                normalize_params(request.params),
+                self.cache.scope_generation(request.url),
+            ),
+            fetch,
+        )
+
+    async def _asend_with_retry(self, request: PreparedRequest) -> httpx.Response:
+        weight = request_weight(request.method, request.url)
+        attempt, delay = 1, 0.0
+        while True:
+            await self.scheduler.aacquire(weight)
+            try:
+                response = await self.async_client.request(
+                    request.method,
+                    request.url,
+                    params=request.params,
+                    json=request.data,
+                )
+            except httpx.TransportError as error:
+                delay = self.retry_policy.retry_delay(
+                    request.method,
+                    attempt,
+                    delay,
+                    error=error,
+                    idempotent=request.idempotent,
+                )
+                if delay is None:
+                    raise
+            else:
+                self.scheduler.observe(response.headers, response.status_code)
+                delay = self.retry_policy.retry_delay(
+                    request.method,
+                    attempt,
+                    delay,
+                    response=response,
+                    idempotent=request.idempotent,
+                )
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        """Closes the shared async HTTP client."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    async def __aenter__(self) -> "AsyncMiroApp":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def list_tools(self):
+        return [
+            getattr(self, name) for name in ENDPOINT_OPERATIONS + COMPOSITE_OPERATIONS
+        ]
+
+
+def _make_async_operation(name: str):
+    operation = getattr(MiroApp, name)
+
+    @functools.wraps(operation)
+    async def async_operation(self: AsyncMiroApp, *args, **kwargs) -> Any:
+        request = prepare_request(operation, self.base_url, *args, **kwargs)
+        return decode_response(await self._asend(request))
+
+    return async_operation
+
+
+def _make_threaded_operation(name: str):
+    operation = getattr(MiroApp, name)
+
+    @functools.wraps(operation)
+    async def threaded_operation(self: AsyncMiroApp, *args, **kwargs) -> Any:
+        return await asyncio.to_thread(operation, self.sync_app, *args, **kwargs)
+
+    return threaded_operation
+
+
+for _name in ENDPOINT_OPERATIONS:
+    setattr(AsyncMiroApp, _name, _make_async_operation(_name))
+for _name in COMPOSITE_OPERATIONS:
+    setattr(AsyncMiroApp, _name, _make_threaded_operation(_name))
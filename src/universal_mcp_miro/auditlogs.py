@@ -0,0 +1,205 @@
+import json
+import os
+import shutil
+import threading
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from universal_mcp_miro.bulk import run_concurrently
+from universal_mcp_miro.contentlogs import parse_timestamp
+from universal_mcp_miro.pagination import iter_cursor
+
+
+def format_millis(moment: datetime) -> str:
+    """Formats a datetime in the UTC `YYYY-MM-DDTHH:MM:SS.mmmZ` form of audit logs."""
+    moment = moment.astimezone(UTC)
+    return f"{moment:%Y-%m-%dT%H:%M:%S}.{moment.microsecond // 1000:03d}Z"
+
+
+def split_windows(
+    start: datetime, end: datetime, window: timedelta
+) -> list[tuple[str, str]]:
+    """Splits `[start, end)` into formatted windows of at most `window` each."""
+    if window <= timedelta(0):
+        raise ValueError("window must be positive")
+    windows = []
+    while start < end:
+        stop = min(start + window, end)
+        windows.append((format_millis(start), format_millis(stop)))
+        start = stop
+    return windows
+
+
+class AuditLogExport:
+    """
+    Exports a range of audit logs to a time-ordered JSONL file, windows in parallel.
+
+    The range is split into windows whose cursor chains are walked
+    concurrently; each finished window is spooled to its own part file and
+    recorded in a checkpoint next to the output. Running the same export again
+    after an interruption only fetches the windows that did not finish. The
+    parts are then merged in time order, dropping events returned by two
+    adjacent windows.
+
+    Args:
+        app (MiroApp): Client used to call get_audit_logs.
+        path (str | PathLike): JSONL file written by `run`.
+        created_after (datetime): Start of the range.
+        created_before (datetime): End of the range.
+        window (timedelta): Length of each sub-window.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        path: str | os.PathLike,
+        created_after: datetime,
+        created_before: datetime,
+        window: timedelta = timedelta(days=1),
+    ) -> None:
+        self.app = app
+        self.path = Path(path)
+        self.windows = split_windows(created_after, created_before, window)
+        self.parts = self.path.with_name(self.path.name + ".parts")
+        self.checkpoint_path = self.path.with_name(self.path.name + ".checkpoint.json")
+
+    def _load_done(self) -> set[int]:
+        try:
+            checkpoint = json.loads(self.checkpoint_path.read_text())
+        except (OSError, ValueError):
+            return set()
+        if checkpoint.get("windows") != [list(window) for window in self.windows]:
+            return set()
+        return {
+            index
+            for index in checkpoint.get("done", [])
+            if (self.parts / f"{index}.jsonl").exists()
+        }
+
+    def _save_done(self, done: set[int]) -> None:
+        temporary = self.checkpoint_path.with_suffix(".tmp")
+        temporary.write_text(
+            json.dumps({"windows": self.windows, "done": sorted(done)})
+        )
+        temporary.replace(self.checkpoint_path)
+
+    def _fetch_window(self, index: int, limit: int) -> int:
+        created_after, created_before = self.windows[index]
+        part = self.parts / f"{index}.jsonl"
+        events = list(
+            iter_cursor(
+                lambda cursor: self.app.get_audit_logs(
+                    createdAfter=created_after,
+                    createdBefore=created_before,
+                    cursor=cursor,
+                    limit=limit,
+                    sorting="ASC",
+                )
+            )
+        )
+        events.sort(
+            key=lambda event: (event.get("createdAt") or "", str(event.get("id")))
+        )
+        temporary = part.with_suffix(".tmp")
+        with open(temporary, "w", encoding="utf-8") as file:
+            for event in events:
+                file.write(json.dumps(event) + "\n")
+        temporary.replace(part)
+        return len(events)
+
+    def run(self, max_workers: int = 4, limit: int = 100) -> dict[str, Any]:
+        """
+        Fetches the missing windows and writes the merged JSONL file.
+
+        Args:
+            max_workers (int): Maximum number of windows fetched at the same time.
+            limit (int): Page size requested per call (max 100).
+
+        Returns:
+            dict: Output `path`, number of `events` written, `duplicates` dropped,
+            `windows` in the range and `resumed` windows reused from an earlier run.
+
+        Raises:
+            RuntimeError: If a window could not be fetched; finished windows are kept
+                for the next run.
+        """
+        self.parts.mkdir(parents=True, exist_ok=True)
+        done = self._load_done()
+        resumed = len(done)
+        pending = [index for index in range(len(self.windows)) if index not in done]
+        lock = threading.Lock()
+
+        def fetch(index: int) -> int:
+            count = self._fetch_window(index, limit)
+            with lock:
+                done.add(index)
+                self._save_done(done)
+            return count
+
+        outcomes = run_concurrently(fetch, pending, max_workers=max_workers)
+        failed = [
+            (self.windows[index], outcome.error)
+            for index, outcome in zip(pending, outcomes)
+            if outcome.error is not None
+        ]
+        if failed:
+            (window, error), *_ = failed
+            raise RuntimeError(
+                f"{len(failed)} audit log window(s) failed, "
+                f"first {window[0]}..{window[1]}: {error}"
+            ) from error
+        events, duplicates = self._merge()
+        shutil.rmtree(self.parts, ignore_errors=True)
+        self.checkpoint_path.unlink(missing_ok=True)
+        return {
+            "path": str(self.path),
+            "events": events,
+            "duplicates": duplicates,
+            "windows": len(self.windows),
+            "resumed": resumed,
+        }
+
+    def _merge(self) -> tuple[int, int]:
+        events = duplicates = 0
+        boundary_ids: set[str] = set()
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        with open(temporary, "w", encoding="utf-8") as output:
+            for index, (_, window_end) in enumerate(self.windows):
+                seen = boundary_ids
+                boundary_ids = set()
+                with open(self.parts / f"{index}.jsonl", encoding="utf-8") as part:
+                    for line in part:
+                        event = json.loads(line)
+                        event_id = str(event.get("id"))
+                        if event_id in seen:
+                            duplicates += 1
+                            continue
+                        seen.add(event_id)
+                        # Only events on a window edge can be in both neighbours.
+                        if (event.get("createdAt") or "") >= window_end:
+                            boundary_ids.add(event_id)
+                        output.write(line)
+                        events += 1
+        temporary.replace(self.path)
+        return events, duplicates
+
+
+def export_audit_logs(
+    app: Any,
+    path: str | os.PathLike,
+    created_after: str | datetime,
+    created_before: str | datetime,
+    *,
+    window: timedelta = timedelta(days=1),
+    max_workers: int = 4,
+    limit: int = 100,
+) -> dict[str, Any]:
+    """Exports audit logs of a time range to a JSONL file; see AuditLogExport."""
+    if isinstance(created_after, str):
+        created_after = parse_timestamp(created_after)
+    if isinstance(created_before, str):
+        created_before = parse_timestamp(created_before)
+    return AuditLogExport(app, path, created_after, created_before, window).run(
+        max_workers=max_workers, limit=limit
+    )
@@ -0,0 +1,61 @@
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+# Maximum number of items Miro accepts in one bulk create request.
+MAX_BULK_ITEMS = 20
+
+
+class Outcome(NamedTuple):
+    result: Any
+    error: Exception | None
+
+
+def chunked(items: Sequence[T], size: int) -> list[Sequence[T]]:
+    """Splits `items` into consecutive slices of at most `size` elements."""
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def run_concurrently(
+    fn: Callable[[T], Any], jobs: Iterable[T], max_workers: int = 8
+) -> list[Outcome]:
+    """
+    Runs `fn` for every job on a bounded thread pool.
+
+    A failing job does not stop the others; its exception is captured in its outcome.
+
+    Args:
+        fn (Callable): Function applied to each job.
+        jobs (Iterable): Inputs to process.
+        max_workers (int): Maximum number of jobs running at the same time.
+
+    Returns:
+        list[Outcome]: One `(result, error)` pair per job, in input order.
+    """
+
+    def attempt(job: T) -> Outcome:
+        try:
+            return Outcome(fn(job), None)
+        except Exception as error:
+            return Outcome(None, error)
+
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(jobs))), thread_name_prefix="miro-bulk"
+    ) as executor:
+        return list(executor.map(attempt, jobs))
+
+
+def describe_error(error: Exception) -> str:
+    """Returns a short, JSON-friendly description of a failed call."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return f"HTTP {error.response.status_code}: {error.response.text}"
+    return f"{type(error).__name__}: {error}"
@@ -0,0 +1,293 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+from urllib.parse import urlsplit
+
+
+class CacheRule(NamedTuple):
+    operation: str
+    pattern: re.Pattern
+    ttl: float
+
+
+# Read-only lookups that are safe to serve from memory, with their default TTL
+# in seconds. Only GET requests whose path matches a rule are cached; writes
+# keep the entries coherent through ResponseCache.on_write.
+DEFAULT_RULES = (
+    CacheRule("get_access_token_information", re.compile(r"^/v1/oauth-token$"), 300.0),
+    CacheRule("get_organization_info", re.compile(r"^/v2/orgs/[^/]+$"), 300.0),
+    CacheRule("get_team", re.compile(r"^/v2/orgs/[^/]+/teams/[^/]+$"), 300.0),
+    CacheRule("get_specific_board", re.compile(r"^/v2/boards/[^/]+$"), 60.0),
+    CacheRule("get_tags_from_board", re.compile(r"^/v2/boards/[^/]+/tags$"), 60.0),
+    CacheRule(
+        "get_items_on_board",
+        re.compile(r"^/v2(-experimental)?/boards/[^/]+/items$"),
+        60.0,
+    ),
+    CacheRule("get_connectors", re.compile(r"^/v2/boards/[^/]+/connectors$"), 60.0),
+    CacheRule(
+        "get_tags_from_item", re.compile(r"^/v2/boards/[^/]+/items/[^/]+/tags$"), 60.0
+    ),
+    CacheRule(
+        "get_specific_item_on_board",
+        re.compile(r"^/v2(-experimental)?/boards/[^/]+/items/[^/]+$"),
+        60.0,
+    ),
+    CacheRule(
+        "get_board_item",
+        re.compile(
+            r"^/v2/boards/[^/]+/(app_cards|cards|connectors|documents|embeds|frames|images|shapes|sticky_notes|tags|texts)/[^/]+$"
+        ),
+        60.0,
+    ),
+)
+
+_BOARD_PATH = re.compile(
+    r"^/v2(?:-experimental)?/boards/(?P<board>[^/]+)(?:/(?P<kind>[^/]+)(?:/(?P<item>[^/]+))?)?"
+)
+_ORG_PATH = re.compile(r"^/v2/orgs/(?P<org>[^/]+)")
+
+# Board sub-resources whose writes can change every cached entry of the board,
+# e.g. renaming a tag changes the tag lists of all items.
+_BOARD_WIDE_KINDS = frozenset({None, "tags", "members"})
+
+
+def locate_resource(path: str) -> tuple[str | None, str | None, str | None]:
+    """Returns the invalidation scope, sub-resource kind and item ID of a path."""
+    match = _BOARD_PATH.match(path)
+    if match:
+        item = match["item"]
+        if item == "bulk":
+            item = None
+        return f"board:{match['board']}", match["kind"], item
+    match = _ORG_PATH.match(path)
+    if match:
+        return f"org:{match['org']}", None, None
+    return None, None, None
+
+
+class CacheKey(NamedTuple):
+    operation: str
+    path: str
+    params: tuple[tuple[str, str], ...]
+    scope: str | None = None
+    item: str | None = None
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+def normalize_params(params: Mapping[str, Any] | None) -> tuple[tuple[str, str], ...]:
+    """Returns query parameters as a sorted tuple of strings, without None values."""
+    if not params:
+        return ()
+    return tuple(sorted((str(k), str(v)) for k, v in params.items() if v is not None))
+
+
+class ResponseCache:
+    """
+    In-process TTL cache with LRU eviction for read-only Miro lookups.
+
+    Entries are keyed by the operation name, the request path and the normalized
+    query parameters. Each operation has its own TTL; once `max_entries` is
+    reached the least recently used entry is evicted. A cache with
+    `max_entries=0` stores nothing.
+
+    Entries are grouped by the board or organization they belong to, so a write
+    only evicts what it can have changed: the written item, the board itself and
+    the board's list pages. Successful item writes are stored back as the item's
+    lookup (write-through), keeping read-your-writes without another request.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttls: Mapping[str, float] | None = None,
+        rules: tuple[CacheRule, ...] = DEFAULT_RULES,
+    ) -> None:
+        overrides = dict(ttls or {})
+        self.rules = tuple(
+            rule._replace(ttl=overrides.get(rule.operation, rule.ttl)) for rule in rules
+        )
+        self._ttls = {rule.operation: rule.ttl for rule in self.rules}
+        self.max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+        self._scopes: dict[str | None, set[CacheKey]] = {}
+        self._generations: dict[str | None, int] = {}
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def key_for(
+        self, url: str, params: Mapping[str, Any] | None = None
+    ) -> CacheKey | None:
+        """
+        Returns the cache key of a GET request, or None if the request is not cacheable.
+
+        Args:
+            url (str): Absolute or path-only request URL.
+            params (Mapping[str, Any] | None): Query parameters of the request.
+
+        Returns:
+            CacheKey | None: Key under which the response is cached.
+        """
+        if self.max_entries <= 0:
+            return None
+        path = urlsplit(url).path.rstrip("/")
+        for rule in self.rules:
+            if rule.ttl > 0 and rule.pattern.match(path):
+                scope, _, item = locate_resource(path)
+                return CacheKey(
+                    rule.operation, path, normalize_params(params), scope, item
+                )
+        return None
+
+    def generation(self, key: CacheKey) -> int:
+        """
+        Returns the write generation of the key's scope.
+
+        Pass it to `put` for a response fetched after this call, so a response
+        that raced with a write to the same board is not stored.
+        """
+        with self._lock:
+            return self._generations.get(key.scope, 0)
+
+    def scope_generation(self, url: str) -> int:
+        """Returns the write generation of the board or organization of a URL."""
+        scope, _, _ = locate_resource(urlsplit(url).path.rstrip("/"))
+        with self._lock:
+            return self._generations.get(scope, 0)
+
+    def _drop(self, key: CacheKey) -> None:
+        self._entries.pop(key, None)
+        keys = self._scopes.get(key.scope)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._scopes[key.scope]
+
+    def get(self, key: CacheKey) -> Any | None:
+        """Returns the cached value for `key`, or None on a miss or an expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return entry[1]
+            if entry is not None:
+                self._drop(key)
+            self._stats.misses += 1
+            return None
+
+    def put(self, key: CacheKey, value: Any, generation: int | None = None) -> None:
+        """
+        Stores `value` under `key` with the TTL of the key's operation.
+
+        Args:
+            key (CacheKey): Key returned by `key_for`.
+            value (Any): Value to cache.
+            generation (int | None): Result of `generation(key)` taken before the value
+                was fetched; the value is discarded if the scope was written since.
+        """
+        ttl = self._ttls.get(key.operation, 0)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            written = self._generations.get(key.scope, 0)
+            if generation is not None and generation != written:
+                return
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            self._scopes.setdefault(key.scope, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                self._stats.evictions += 1
+
+    def invalidate(self, key: CacheKey) -> None:
+        """Drops the entry stored under `key`, if any."""
+        with self._lock:
+            self._drop(key)
+
+    def invalidate_scope(self, scope: str, item: str | None = None) -> None:
+        """
+        Drops the entries of a board or organization scope.
+
+        Args:
+            scope (str): Scope such as `board:<board_id>` or `org:<org_id>`.
+            item (str | None): When given, only the entries of this item and the scope's
+                non-item entries (the board itself and its list pages) are dropped.
+        """
+        with self._lock:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+            for key in list(self._scopes.get(scope, ())):
+                if item is None or key.item is None or key.item == item:
+                    self._drop(key)
+
+    def on_write(self, method: str, url: str, response: Any | None = None) -> None:
+        """
+        Keeps the cache coherent after a create, update or delete call.
+
+        Args:
+            method (str): HTTP method of the write.
+            url (str): Absolute or path-only URL of the write.
+            response (Any | None): Successful response of the write, used for
+                write-through; None when the outcome of the write is unknown.
+        """
+        path = urlsplit(url).path.rstrip("/")
+        scope, kind, item = locate_resource(path)
+        if scope is None:
+            if path.endswith("/oauth/revoke"):
+                self.clear()
+            return
+        if (
+            not scope.startswith("board:")
+            or kind in _BOARD_WIDE_KINDS
+            or method.upper() == "DELETE"
+        ):
+            # Deleting an item also removes its connectors and frame children,
+            # so deletes drop everything cached for the board.
+            self.invalidate_scope(scope)
+            return
+        self.invalidate_scope(scope, item)
+        if response is None or method.upper() not in ("POST", "PATCH"):
+            return
+        try:
+            body = response.json()
+        except ValueError:
+            return
+        if not isinstance(body, dict) or not body.get("id"):
+            return
+        if item is None:
+            path = f"{path}/{body['id']}"
+        elif str(body["id"]) != item:
+            return
+        key = self.key_for(path)
+        if key is not None:
+            self.put(key, response)
+
+    def clear(self) -> None:
+        """Drops every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._scopes.clear()
+            for scope in self._generations:
+                self._generations[scope] += 1
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of the hit, miss and eviction counters and the current size."""
+        with self._lock:
+            return CacheStats(
+                self._stats.hits,
+                self._stats.misses,
+                self._stats.evictions,
+                len(self._entries),
+            )
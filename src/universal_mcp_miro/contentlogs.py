@@ -0,0 +1,257 @@
+import json
+import sqlite3
+import threading
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from universal_mcp_miro.pagination import iter_cursor_pages
+
+# Miro keeps content logs for 90 days; a first sync without a start point
+# pulls everything still available.
+DEFAULT_LOOKBACK = timedelta(days=90)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS content_logs (
+    id TEXT PRIMARY KEY,
+    org_id TEXT NOT NULL,
+    board_id TEXT,
+    item_id TEXT,
+    item_type TEXT,
+    action_type TEXT,
+    action_time TEXT,
+    actor_email TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS content_logs_board_time
+    ON content_logs (board_id, action_time);
+CREATE INDEX IF NOT EXISTS content_logs_item
+    ON content_logs (item_id, action_time);
+CREATE INDEX IF NOT EXISTS content_logs_actor
+    ON content_logs (actor_email, action_time);
+CREATE INDEX IF NOT EXISTS content_logs_time
+    ON content_logs (org_id, action_time);
+CREATE TABLE IF NOT EXISTS content_log_checkpoints (
+    org_id TEXT PRIMARY KEY,
+    synced_to TEXT,
+    window_from TEXT,
+    window_to TEXT,
+    cursor TEXT
+);
+"""
+
+
+def format_timestamp(moment: datetime) -> str:
+    """Formats a datetime in the UTC `YYYY-MM-DDTHH:MM:SSZ` form Miro expects."""
+    return moment.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class ContentLogStore:
+    """
+    Local SQLite copy of an organization's board content logs.
+
+    `sync` only asks Miro for the entries logged since the previous sync. The
+    end of the last completed window and, while a window is being paged, its
+    cursor are checkpointed in the database after every page, so an interrupted
+    sync resumes where it stopped. Entries are upserted by ID, which makes the
+    small overlap between consecutive windows harmless.
+
+    Args:
+        path (str): Database file; ':memory:' keeps the store in memory.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "ContentLogStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def checkpoint(self, org_id: str) -> dict[str, str | None] | None:
+        """Returns the sync checkpoint of an organization, or None before any sync."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT * FROM content_log_checkpoints WHERE org_id = ?", (org_id,)
+            ).fetchone()
+        return dict(row) if row is not None else None
+
+    def _save_checkpoint(
+        self,
+        org_id: str,
+        synced_to: str | None,
+        window_from: str | None,
+        window_to: str | None,
+        cursor: str | None,
+    ) -> None:
+        self._connection.execute(
+            "INSERT INTO content_log_checkpoints"
+            " (org_id, synced_to, window_from, window_to, cursor)"
+            " VALUES (?, ?, ?, ?, ?) ON CONFLICT (org_id) DO UPDATE SET"
+            " synced_to = excluded.synced_to, window_from = excluded.window_from,"
+            " window_to = excluded.window_to, cursor = excluded.cursor",
+            (org_id, synced_to, window_from, window_to, cursor),
+        )
+
+    def upsert(self, org_id: str, entries: list[dict[str, Any]]) -> None:
+        """Inserts or replaces log entries by ID."""
+        rows = [
+            (
+                str(entry["id"]),
+                org_id,
+                entry.get("boardKey"),
+                entry.get("itemId"),
+                entry.get("itemType"),
+                entry.get("actionType"),
+                entry.get("actionTime"),
+                (entry.get("actor") or {}).get("email"),
+                json.dumps(entry),
+            )
+            for entry in entries
+            if entry.get("id") is not None
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO content_logs"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def sync(
+        self,
+        app: Any,
+        org_id: str,
+        *,
+        start: datetime | None = None,
+        until: datetime | None = None,
+        overlap: timedelta = timedelta(minutes=5),
+        limit: int = 1000,
+    ) -> dict[str, Any]:
+        """
+        Fetches the log entries added since the last sync and stores them.
+
+        Args:
+            app (MiroApp): Client used to call
+                retrieve_content_change_logs_of_board_items.
+            org_id (str): Organization whose logs are synced.
+            start (datetime | None): Start of the first sync; ignored once a checkpoint
+                exists. Defaults to the 90 days Miro retains.
+            until (datetime | None): End of the window; defaults to now.
+            overlap (timedelta): How far each window reaches back before the previous
+                one ended, to pick up entries that were logged late.
+            limit (int): Page size requested per call (max 1000).
+
+        Returns:
+            dict: `fetched` entries, the window `from` and `to`, and whether the sync
+                `resumed` an interrupted window.
+        """
+        saved = self.checkpoint(org_id) or {}
+        resumed = bool(saved.get("cursor"))
+        if resumed:
+            window_from, window_to, cursor = (
+                saved["window_from"],
+                saved["window_to"],
+                saved["cursor"],
+            )
+        else:
+            end = until or datetime.now(UTC)
+            if saved.get("synced_to"):
+                begin = parse_timestamp(saved["synced_to"]) - overlap
+            else:
+                begin = start or end - DEFAULT_LOOKBACK
+            window_from, window_to, cursor = (
+                format_timestamp(begin),
+                format_timestamp(end),
+                None,
+            )
+
+        def fetch(page_cursor: str | None) -> dict[str, Any]:
+            return app.retrieve_content_change_logs_of_board_items(
+                org_id,
+                from_=window_from,
+                to=window_to,
+                cursor=page_cursor,
+                limit=limit,
+                sorting="asc",
+            )
+
+        fetched = 0
+        for page in iter_cursor_pages(fetch, cursor=cursor):
+            entries = page.get("data") or []
+            fetched += len(entries)
+            self.upsert(org_id, entries)
+            next_cursor = page.get("cursor") if entries else None
+            with self._lock, self._connection:
+                self._save_checkpoint(
+                    org_id, saved.get("synced_to"), window_from, window_to, next_cursor
+                )
+        with self._lock, self._connection:
+            self._save_checkpoint(org_id, window_to, None, None, None)
+        return {
+            "fetched": fetched,
+            "from": window_from,
+            "to": window_to,
+            "resumed": resumed,
+        }
+
+    def changes(
+        self,
+        *,
+        org_id: str | None = None,
+        board_id: str | None = None,
+        item_id: str | None = None,
+        actor_email: str | None = None,
+        action_type: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Returns stored log entries matching every given filter, oldest first.
+
+        Args:
+            org_id (str | None): Organization the entries belong to.
+            board_id (str | None): Board the entries belong to.
+            item_id (str | None): Board item the entries are about.
+            actor_email (str | None): Email of the user who made the change.
+            action_type (str | None): 'create', 'update' or 'delete'.
+            since (str | None): Earliest action time (ISO 8601, UTC), inclusive.
+            until (str | None): Latest action time (ISO 8601, UTC), exclusive.
+            limit (int | None): Maximum number of entries returned.
+
+        Returns:
+            list[dict]: Entries as returned by the API.
+        """
+        filters = [
+            ("org_id = ?", org_id),
+            ("board_id = ?", board_id),
+            ("item_id = ?", item_id),
+            ("actor_email = ?", actor_email),
+            ("action_type = ?", action_type),
+            ("action_time >= ?", since),
+            ("action_time < ?", until),
+        ]
+        clauses = [clause for clause, value in filters if value is not None]
+        values: list[Any] = [value for _, value in filters if value is not None]
+        query = "SELECT payload FROM content_logs"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY action_time, id"
+        if limit is not None:
+            query += " LIMIT ?"
+            values.append(limit)
+        with self._lock:
+            rows = self._connection.execute(query, values).fetchall()
+        return [json.loads(row["payload"]) for row in rows]
@@ -0,0 +1,807 @@
+import re
+from collections.abc import Mapping
+from typing import Any, NamedTuple
+
+import httpx
+
+_PATH_PARAM = re.compile(r"\{(\w+)\}")
+
+
+class PreparedRequest(NamedTuple):
+    method: str
+    url: str
+    params: dict[str, Any] | None
+    data: Any
+    idempotent: bool | None = None
+
+
+class Endpoint:
+    """
+    One Miro REST operation, compiled once from its row in ENDPOINTS.
+
+    Path parameters are required and formatted into the path; query and body
+    fields are sent when not None. A trailing underscore marks an argument
+    renamed around a Python keyword (`from_` is sent as `from`).
+
+    Args:
+        name (str): Name of the MiroApp method exposing the operation.
+        method (str): HTTP method.
+        path (str): Path template relative to the base URL, e.g.
+            `/v2/boards/{board_id}`.
+        query (tuple[str, ...]): Arguments sent as query parameters.
+        body (tuple[str, ...] | None): Arguments sent as fields of a JSON object body.
+            An empty tuple sends `{}`; None sends no body.
+        raw_body (str | None): Argument sent as the whole JSON body instead.
+        idempotent (bool | None): Whether resending the call is safe; None decides from
+            the HTTP method. Set to False for calls that create something on every send.
+    """
+
+    __slots__ = (
+        "name",
+        "method",
+        "path",
+        "path_params",
+        "query",
+        "body",
+        "raw_body",
+        "idempotent",
+        "_format",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        method: str,
+        path: str,
+        *,
+        query: tuple[str, ...] = (),
+        body: tuple[str, ...] | None = None,
+        raw_body: str | None = None,
+        idempotent: bool | None = None,
+    ) -> None:
+        self.name = name
+        self.method = method
+        self.path = path
+        self.path_params = tuple(_PATH_PARAM.findall(path))
+        self.query = tuple((arg, arg.removesuffix("_")) for arg in query)
+        self.body = (
+            None
+            if body is None
+            else tuple((arg, arg.removesuffix("_")) for arg in body)
+        )
+        self.raw_body = raw_body
+        self.idempotent = idempotent
+        self._format = path.format_map
+
+    def prepare(self, base_url: str, args: Mapping[str, Any]) -> PreparedRequest:
+        """
+        Builds the request for one call from the method's arguments by name.
+
+        Raises:
+            ValueError: If a path parameter is missing.
+        """
+        for name in self.path_params:
+            if args.get(name) is None:
+                raise ValueError(f"Missing required parameter '{name}'")
+        params = {
+            field: value
+            for arg, field in self.query
+            if (value := args.get(arg)) is not None
+        }
+        if self.raw_body is not None:
+            data = args.get(self.raw_body)
+        elif self.body is not None:
+            data = {
+                field: value
+                for arg, field in self.body
+                if (value := args.get(arg)) is not None
+            }
+        else:
+            data = None
+        return PreparedRequest(
+            self.method, base_url + self._format(args), params, data, self.idempotent
+        )
+
+
+def decode_response(response: httpx.Response) -> Any:
+    """Raises for error statuses; returns the JSON body, or None for an empty one."""
+    response.raise_for_status()
+    return response.json() if response.content else None
+
+
+# One row per operation, in MiroApp.list_tools order.
+ENDPOINTS: dict[str, Endpoint] = {
+    endpoint.name: endpoint
+    for endpoint in (
+        Endpoint(
+            "revoke_token_v1",
+            "POST",
+            "/v1/oauth/revoke",
+            query=("access_token",),
+            body=(),
+        ),
+        Endpoint("get_access_token_information", "GET", "/v1/oauth-token"),
+        Endpoint(
+            "get_audit_logs",
+            "GET",
+            "/v2/audit/logs",
+            query=("createdAfter", "createdBefore", "cursor", "limit", "sorting"),
+        ),
+        Endpoint(
+            "get_organization_settings",
+            "GET",
+            "/v2/orgs/{org_id}/data-classification-settings",
+        ),
+        Endpoint(
+            "bulk_update_boards_classification",
+            "PATCH",
+            "/v2/orgs/{org_id}/teams/{team_id}/data-classification",
+            body=("labelId", "notClassifiedOnly"),
+        ),
+        Endpoint(
+            "get_team_settings",
+            "GET",
+            "/v2/orgs/{org_id}/teams/{team_id}/data-classification-settings",
+        ),
+        Endpoint(
+            "update_team_settings",
+            "PATCH",
+            "/v2/orgs/{org_id}/teams/{team_id}/data-classification-settings",
+            body=("defaultLabelId", "enabled"),
+        ),
+        Endpoint(
+            "get_board_classification",
+            "GET",
+            "/v2/orgs/{org_id}/teams/{team_id}/boards/{board_id}/data-classification",
+        ),
+        Endpoint(
+            "update_board_classification",
+            "POST",
+            "/v2/orgs/{org_id}/teams/{team_id}/boards/{board_id}/data-classification",
+            body=("labelId",),
+        ),
+        Endpoint(
+            "get_all_cases", "GET", "/v2/orgs/{org_id}/cases", query=("limit", "cursor")
+        ),
+        Endpoint("get_case", "GET", "/v2/orgs/{org_id}/cases/{case_id}"),
+        Endpoint(
+            "get_all_legal_holds_within_acase",
+            "GET",
+            "/v2/orgs/{org_id}/cases/{case_id}/legal-holds",
+            query=("limit", "cursor"),
+        ),
+        Endpoint(
+            "get_legal_hold_information",
+            "GET",
+            "/v2/orgs/{org_id}/cases/{case_id}/legal-holds/{legal_hold_id}",
+        ),
+        Endpoint(
+            "get_content_items_under_legal_hold",
+            "GET",
+            "/v2/orgs/{org_id}/cases/{case_id}/legal-holds/{legal_hold_id}/content-items",
+            query=("limit", "cursor"),
+        ),
+        Endpoint(
+            "create_board_export_job",
+            "POST",
+            "/v2/orgs/{org_id}/boards/export/jobs",
+            query=("request_id",),
+            body=("boardFormat", "boardIds"),
+        ),
+        Endpoint(
+            "get_board_export_job_status",
+            "GET",
+            "/v2/orgs/{org_id}/boards/export/jobs/{job_id}",
+        ),
+        Endpoint(
+            "get_results_for_board_export_job",
+            "GET",
+            "/v2/orgs/{org_id}/boards/export/jobs/{job_id}/results",
+        ),
+        Endpoint(
+            "retrieve_content_change_logs_of_board_items",
+            "GET",
+            "/v2/orgs/{org_id}/content-logs/items",
+            query=("board_ids", "emails", "from_", "to", "cursor", "limit", "sorting"),
+        ),
+        Endpoint(
+            "reset_all_sessions_of_auser",
+            "POST",
+            "/v2/sessions/reset_all",
+            query=("email",),
+            body=(),
+        ),
+        Endpoint("get_organization_info", "GET", "/v2/orgs/{org_id}"),
+        Endpoint(
+            "get_organization_members",
+            "GET",
+            "/v2/orgs/{org_id}/members",
+            query=("emails", "role", "license", "active", "cursor", "limit"),
+        ),
+        Endpoint(
+            "get_organization_member", "GET", "/v2/orgs/{org_id}/members/{member_id}"
+        ),
+        Endpoint(
+            "get_boards",
+            "GET",
+            "/v2/boards",
+            query=(
+                "team_id",
+                "project_id",
+                "query",
+                "owner",
+                "limit",
+                "offset",
+                "sort",
+            ),
+        ),
+        Endpoint(
+            "copy_board",
+            "PUT",
+            "/v2/boards",
+            query=("copy_from",),
+            body=("description", "name", "policy", "teamId"),
+            idempotent=False,
+        ),
+        Endpoint(
+            "create_board",
+            "POST",
+            "/v2/boards",
+            body=("description", "name", "policy", "projectId", "teamId"),
+        ),
+        Endpoint("get_specific_board", "GET", "/v2/boards/{board_id}"),
+        Endpoint("delete_board", "DELETE", "/v2/boards/{board_id}"),
+        Endpoint(
+            "update_board",
+            "PATCH",
+            "/v2/boards/{board_id}",
+            body=("description", "name", "policy", "projectId", "teamId"),
+        ),
+        Endpoint(
+            "create_app_card_item",
+            "POST",
+            "/v2/boards/{board_id}/app_cards",
+            body=("data", "geometry", "parent", "position", "style"),
+        ),
+        Endpoint(
+            "get_app_card_item", "GET", "/v2/boards/{board_id}/app_cards/{item_id}"
+        ),
+        Endpoint(
+            "delete_app_card_item",
+            "DELETE",
+            "/v2/boards/{board_id}/app_cards/{item_id}",
+        ),
+        Endpoint(
+            "update_app_card_item",
+            "PATCH",
+            "/v2/boards/{board_id}/app_cards/{item_id}",
+            body=("data", "geometry", "parent", "position", "style"),
+        ),
+        Endpoint(
+            "create_card_item",
+            "POST",
+            "/v2/boards/{board_id}/cards",
+            body=("data", "geometry", "parent", "position", "style"),
+        ),
+        Endpoint("get_card_item", "GET", "/v2/boards/{board_id}/cards/{item_id}"),
+        Endpoint("delete_card_item", "DELETE", "/v2/boards/{board_id}/cards/{item_id}"),
+        Endpoint(
+            "update_card_item",
+            "PATCH",
+            "/v2/boards/{board_id}/cards/{item_id}",
+            body=("data", "geometry", "parent", "position", "style"),
+        ),
+        Endpoint(
+            "get_connectors",
+            "GET",
+            "/v2/boards/{board_id}/connectors",
+            query=("limit", "cursor"),
+        ),
+        Endpoint(
+            "create_connector",
+            "POST",
+            "/v2/boards/{board_id}/connectors",
+            body=("captions", "endItem", "shape", "startItem", "style"),
+        ),
+        Endpoint(
+            "get_specific_connector",
+            "GET",
+            "/v2/boards/{board_id}/connectors/{connector_id}",
+        ),
+        Endpoint(
+            "delete_connector",
+            "DELETE",
+            "/v2/boards/{board_id}/connectors/{connector_id}",
+        ),
+        Endpoint(
+            "update_connector",
+            "PATCH",
+            "/v2/boards/{board_id}/connectors/{connector_id}",
+            body=("captions", "endItem", "shape", "startItem", "style"),
+        ),
+        Endpoint(
+            "create_document_item_using_url",
+            "POST",
+            "/v2/boards/{board_id}/documents",
+            body=("data", "geometry", "parent", "position"),
+        ),
+        Endpoint(
+            "get_document_item", "GET", "/v2/boards/{board_id}/documents/{item_id}"
+        ),
+        Endpoint(
+            "delete_document_item",
+            "DELETE",
+            "/v2/boards/{board_id}/documents/{item_id}",
+        ),
+        Endpoint(
+            "update_document_item_using_url",
+            "PATCH",
+            "/v2/boards/{board_id}/documents/{item_id}",
+            body=("data", "geometry", "parent", "position"),
+        ),
+        Endpoint(
+            "create_embed_item",
+            "POST",
+            "/v2/boards/{board_id}/embeds",
+            body=("data", "geometry", "parent", "position"),
+        ),
+        Endpoint("get_embed_item", "GET", "/v2/boards/{board_id}/embeds/{item_id}"),
+        Endpoint(
+            "delete_embed_item", "DELETE", "/v2/boards/{board_id}/embeds/{item_id}"
+        ),
+        Endpoint(
+            "update_embed_item",
+            "PATCH",
+            "/v2/boards/{board_id}/embeds/{item_id}",
+            body=("data", "geometry", "parent", "position"),
+        ),
+        Endpoint(
+            "create_image_item_using_url",
+            "POST",
+            "/v2/boards/{board_id}/images",
+            body=("data", "geometry", "parent", "position"),
+        ),
+        Endpoint("get_image_item", "GET", "/v2/boards/{board_id}/images/{item_id}"),
+        Endpoint(
+            "delete_image_item", "DELETE", "/v2/boards/{board_id}/images/{item_id}"
+        ),
+        Endpoint(
+            "update_image_item_using_url",
+            "PATCH",
+            "/v2/boards/{board_id}/images/{item_id}",
+            body=("data", "geometry", "parent", "position"),
+        ),
+        Endpoint(
+            "get_items_on_board",
+            "GET",
+            "/v2/boards/{board_id}/items",
+            query=("limit", "type", "cursor"),
+        ),
+        Endpoint(
+            "get_specific_item_on_board", "GET", "/v2/boards/{board_id}/items/{item_id}"
+        ),
+        Endpoint("delete_item", "DELETE", "/v2/boards/{board_id}/items/{item_id}"),
+        Endpoint(
+            "update_item_position_or_parent",
+            "PATCH",
+            "/v2/boards/{board_id}/items/{item_id}",
+            body=("parent", "position"),
+        ),
+        Endpoint(
+            "get_items_within_frame",
+            "GET",
+            "/v2/boards/{board_id_PlatformContainers}/items",
+            query=("parent_item_id", "limit", "type", "cursor"),
+        ),
+        Endpoint(
+            "get_specific_item_on_board1",
+            "GET",
+            "/v2-experimental/boards/{board_id}/items/{item_id}",
+        ),
+        Endpoint(
+            "delete_item1",
+            "DELETE",
+            "/v2-experimental/boards/{board_id}/items/{item_id}",
+        ),
+        Endpoint(
+            "get_all_board_members",
+            "GET",
+            "/v2/boards/{board_id}/members",
+            query=("limit", "offset"),
+        ),
+        Endpoint(
+            "share_board",
+            "POST",
+            "/v2/boards/{board_id}/members",
+            body=("emails", "message", "role"),
+        ),
+        Endpoint(
+            "get_specific_board_member",
+            "GET",
+            "/v2/boards/{board_id}/members/{board_member_id}",
+        ),
+        Endpoint(
+            "remove_board_member",
+            "DELETE",
+            "/v2/boards/{board_id}/members/{board_member_id}",
+        ),
+        Endpoint(
+            "update_board_member",
+            "PATCH",
+            "/v2/boards/{board_id}/members/{board_member_id}",
+            body=("role",),
+        ),
+        Endpoint(
+            "create_shape_item",
+            "POST",
+            "/v2/boards/{board_id}/shapes",
+            body=("data", "geometry", "parent", "position", "style"),
+        ),
+        Endpoint("get_shape_item", "GET", "/v2/boards/{board_id}/shapes/{item_id}"),
+        Endpoint(
+            "delete_shape_item", "DELETE", "/v2/boards/{board_id}/shapes/{item_id}"
+        ),
+        Endpoint(
+            "update_shape_item",
+            "PATCH",
+            "/v2/boards/{board_id}/shapes/{item_id}",
+            body=("data", "geometry", "parent", "position", "style"),
+        ),
+        Endpoint(
+            "create_sticky_note_item",
+            "POST",
+            "/v2/boards/{board_id}/sticky_notes",
+            body=("data", "geometry", "parent", "position", "style"),
+        ),
+        Endpoint(
+            "get_sticky_note_item",
+            "GET",
+            "/v2/boards/{board_id}/sticky_notes/{item_id}",
+        ),
+        Endpoint(
+            "delete_sticky_note_item",
+            "DELETE",
+            "/v2/boards/{board_id}/sticky_notes/{item_id}",
+        ),
+        Endpoint(
+            "update_sticky_note_item",
+            "PATCH",
+            "/v2/boards/{board_id}/sticky_notes/{item_id}",
+            body=("data", "geometry", "parent", "position", "style"),
+        ),
+        Endpoint(
+            "create_text_item",
+            "POST",
+            "/v2/boards/{board_id}/texts",
+            body=("data", "geometry", "parent", "position", "style"),
+        ),
+        Endpoint("get_text_item", "GET", "/v2/boards/{board_id}/texts/{item_id}"),
+        Endpoint("delete_text_item", "DELETE", "/v2/boards/{board_id}/texts/{item_id}"),
+        Endpoint(
+            "update_text_item",
+            "PATCH",
+            "/v2/boards/{board_id}/texts/{item_id}",
+            body=("data", "geometry", "parent", "position", "style"),
+        ),
+        Endpoint(
+            "create_items_in_bulk",
+            "POST",
+            "/v2/boards/{board_id}/items/bulk",
+            raw_body="items",
+        ),
+        Endpoint(
+            "create_frame",
+            "POST",
+            "/v2/boards/{board_id}/frames",
+            body=("data", "geometry", "position", "style"),
+        ),
+        Endpoint("get_frame", "GET", "/v2/boards/{board_id}/frames/{item_id}"),
+        Endpoint("delete_frame", "DELETE", "/v2/boards/{board_id}/frames/{item_id}"),
+        Endpoint(
+            "update_frame",
+            "PATCH",
+            "/v2/boards/{board_id}/frames/{item_id}",
+            body=("data", "geometry", "position", "style"),
+        ),
+        Endpoint(
+            "get_app_metrics",
+            "GET",
+            "/v2-experimental/apps/{app_id}/metrics",
+            query=("startDate", "endDate", "period"),
+        ),
+        Endpoint(
+            "get_total_app_metrics",
+            "GET",
+            "/v2-experimental/apps/{app_id}/metrics-total",
+        ),
+        Endpoint(
+            "create_webhook_subscription",
+            "POST",
+            "/v2-experimental/webhooks/board_subscriptions",
+            body=("boardId", "callbackUrl", "status"),
+        ),
+        Endpoint(
+            "update_webhook_subscription",
+            "PATCH",
+            "/v2-experimental/webhooks/board_subscriptions/{subscription_id}",
+            body=("callbackUrl", "status"),
+        ),
+        Endpoint(
+            "get_webhook_subscriptions",
+            "GET",
+            "/v2-experimental/webhooks/subscriptions",
+            query=("limit", "cursor"),
+        ),
+        Endpoint(
+            "get_specific_webhook_subscription",
+            "GET",
+            "/v2-experimental/webhooks/subscriptions/{subscription_id}",
+        ),
+        Endpoint(
+            "delete_webhook_subscription",
+            "DELETE",
+            "/v2-experimental/webhooks/subscriptions/{subscription_id}",
+        ),
+        Endpoint(
+            "get_specific_mind_map_node",
+            "GET",
+            "/v2-experimental/boards/{board_id}/mindmap_nodes/{item_id}",
+        ),
+        Endpoint(
+            "delete_mind_map_node",
+            "DELETE",
+            "/v2-experimental/boards/{board_id}/mindmap_nodes/{item_id}",
+        ),
+        Endpoint(
+            "get_mind_map_nodes",
+            "GET",
+            "/v2-experimental/boards/{board_id}/mindmap_nodes",
+            query=("limit", "cursor"),
+        ),
+        Endpoint(
+            "create_mind_map_node",
+            "POST",
+            "/v2-experimental/boards/{board_id}/mindmap_nodes",
+            body=("data", "geometry", "parent", "position"),
+        ),
+        Endpoint(
+            "get_items_on_board1",
+            "GET",
+            "/v2-experimental/boards/{board_id}/items",
+            query=("limit", "type", "cursor"),
+        ),
+        Endpoint(
+            "create_shape_item1",
+            "POST",
+            "/v2-experimental/boards/{board_id}/shapes",
+            body=("data", "geometry", "parent", "position", "style"),
+        ),
+        Endpoint(
+            "get_shape_item1",
+            "GET",
+            "/v2-experimental/boards/{board_id}/shapes/{item_id}",
+        ),
+        Endpoint(
+            "delete_shape_item1",
+            "DELETE",
+            "/v2-experimental/boards/{board_id}/shapes/{item_id}",
+        ),
+        Endpoint(
+            "update_shape_item1",
+            "PATCH",
+            "/v2-experimental/boards/{board_id}/shapes/{item_id}",
+            body=("data", "geometry", "parent", "position", "style"),
+        ),
+        Endpoint(
+            "get_all_groups_on_aboard",
+            "GET",
+            "/v2/boards/{board_id}/groups",
+            query=("limit", "cursor"),
+        ),
+        Endpoint(
+            "create_group", "POST", "/v2/boards/{board_id}/groups", body=("data",)
+        ),
+        Endpoint(
+            "get_items_of_agroup_by_id",
+            "GET",
+            "/v2/boards/{board_id}/groups/items",
+            query=("limit", "cursor", "group_item_id"),
+        ),
+        Endpoint(
+            "get_agroup_by_its_id", "GET", "/v2/boards/{board_id}/groups/{group_id}"
+        ),
+        Endpoint(
+            "updates_agroup_with_new_items",
+            "PUT",
+            "/v2/boards/{board_id}/groups/{group_id}",
+            body=("data",),
+        ),
+        Endpoint(
+            "ungroup_items",
+            "DELETE",
+            "/v2/boards/{board_id}/groups/{group_id}",
+            query=("delete_items",),
+        ),
+        Endpoint(
+            "deletes_the_group",
+            "DELETE",
+            "/v2/boards/{board_id}/groups/<string>",
+            query=("delete_items",),
+        ),
+        Endpoint(
+            "revoke_token_v2",
+            "POST",
+            "/v2/oauth/revoke",
+            body=("accessToken", "clientId", "clientSecret"),
+        ),
+        Endpoint(
+            "get_tags_from_item", "GET", "/v2/boards/{board_id}/items/{item_id}/tags"
+        ),
+        Endpoint(
+            "get_tags_from_board",
+            "GET",
+            "/v2/boards/{board_id}/tags",
+            query=("limit", "offset"),
+        ),
+        Endpoint(
+            "create_tag",
+            "POST",
+            "/v2/boards/{board_id}/tags",
+            body=("fillColor", "title"),
+        ),
+        Endpoint("get_tag", "GET", "/v2/boards/{board_id}/tags/{tag_id}"),
+        Endpoint("delete_tag", "DELETE", "/v2/boards/{board_id}/tags/{tag_id}"),
+        Endpoint(
+            "update_tag",
+            "PATCH",
+            "/v2/boards/{board_id}/tags/{tag_id}",
+            body=("fillColor", "title"),
+        ),
+        Endpoint(
+            "get_items_by_tag",
+            "GET",
+            "/v2/boards/{board_id_PlatformTags}/items",
+            query=("limit", "offset", "tag_id"),
+        ),
+        Endpoint(
+            "attach_tag_to_item",
+            "POST",
+            "/v2/boards/{board_id_PlatformTags}/items/{item_id}",
+            query=("tag_id",),
+            body=(),
+        ),
+        Endpoint(
+            "remove_tag_from_item",
+            "DELETE",
+            "/v2/boards/{board_id_PlatformTags}/items/{item_id}",
+            query=("tag_id",),
+        ),
+        Endpoint(
+            "list_of_projects",
+            "GET",
+            "/v2/orgs/{org_id}/teams/{team_id}/projects",
+            query=("limit", "cursor"),
+        ),
+        Endpoint(
+            "create_project",
+            "POST",
+            "/v2/orgs/{org_id}/teams/{team_id}/projects",
+            body=("name",),
+        ),
+        Endpoint(
+            "get_project",
+            "GET",
+            "/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}",
+        ),
+        Endpoint(
+            "delete_project",
+            "DELETE",
+            "/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}",
+        ),
+        Endpoint(
+            "update_project",
+            "PATCH",
+            "/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}",
+            body=("name",),
+        ),
+        Endpoint(
+            "get_project_settings",
+            "GET",
+            "/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}/settings",
+        ),
+        Endpoint(
+            "update_project_settings",
+            "PATCH",
+            "/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}/settings",
+            body=("sharingPolicySettings",),
+        ),
+        Endpoint(
+            "list_of_project_members",
+            "GET",
+            "/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}/members",
+            query=("limit", "cursor"),
+        ),
+        Endpoint(
+            "add_member_in_aproject",
+            "POST",
+            "/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}/members",
+            body=("email", "role"),
+        ),
+        Endpoint(
+            "get_project_member",
+            "GET",
+            "/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}/members/{member_id}",
+        ),
+        Endpoint(
+            "remove_project_member",
+            "DELETE",
+            "/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}/members/{member_id}",
+        ),
+        Endpoint(
+            "update_project_member",
+            "PATCH",
+            "/v2/orgs/{org_id}/teams/{team_id}/projects/{project_id}/members/{member_id}",
+            body=("role",),
+        ),
+        Endpoint(
+            "list_teams",
+            "GET",
+            "/v2/orgs/{org_id}/teams",
+            query=("limit", "cursor", "name"),
+        ),
+        Endpoint("create_team", "POST", "/v2/orgs/{org_id}/teams", body=("name",)),
+        Endpoint("get_team", "GET", "/v2/orgs/{org_id}/teams/{team_id}"),
+        Endpoint("delete_team", "DELETE", "/v2/orgs/{org_id}/teams/{team_id}"),
+        Endpoint(
+            "update_team", "PATCH", "/v2/orgs/{org_id}/teams/{team_id}", body=("name",)
+        ),
+        Endpoint(
+            "list_team_members",
+            "GET",
+            "/v2/orgs/{org_id}/teams/{team_id}/members",
+            query=("limit", "cursor", "role"),
+        ),
+        Endpoint(
+            "invite_team_members",
+            "POST",
+            "/v2/orgs/{org_id}/teams/{team_id}/members",
+            body=("email", "role"),
+        ),
+        Endpoint(
+            "get_team_member",
+            "GET",
+            "/v2/orgs/{org_id}/teams/{team_id}/members/{member_id}",
+        ),
+        Endpoint(
+            "delete_team_member_from_team",
+            "DELETE",
+            "/v2/orgs/{org_id}/teams/{team_id}/members/{member_id}",
+        ),
+        Endpoint(
+            "update_team_member",
+            "PATCH",
+            "/v2/orgs/{org_id}/teams/{team_id}/members/{member_id}",
+            body=("role",),
+        ),
+        Endpoint(
+            "get_default_team_settings",
+            "GET",
+            "/v2/orgs/{org_id}/default_teams_settings",
+        ),
+        Endpoint(
+            "get_team_settings1", "GET", "/v2/orgs/{org_id}/teams/{team_id}/settings"
+        ),
+        Endpoint(
+            "update_team_settings1",
+            "PATCH",
+            "/v2/orgs/{org_id}/teams/{team_id}/settings",
+            body=(
+                "teamAccountDiscoverySettings",
+                "teamCollaborationSettings",
+                "teamCopyAccessLevelSettings",
+                "teamInvitationSettings",
+                "teamSharingPolicySettings",
+            ),
+        ),
+    )
+}
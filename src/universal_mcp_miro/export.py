@@ -0,0 +1,285 @@
+import os
+import re
+import time
+import uuid
+from collections.abc import Callable, Sequence
+from pathlib import Path, PurePosixPath
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from universal_mcp_miro.bulk import chunked, describe_error, run_concurrently
+from universal_mcp_miro.retry import RetryPolicy
+
+# Job statuses reported while Miro is still working on an export.
+PENDING_STATUSES = frozenset({"CREATED", "IN_PROGRESS"})
+
+# Boards requested per export job when a board list is sharded across jobs.
+DEFAULT_SHARD_SIZE = 50
+
+
+def wait_for_job(
+    fetch_status: Callable[[], str | None],
+    *,
+    initial_interval: float = 2.0,
+    max_interval: float = 60.0,
+    factor: float = 1.5,
+    timeout: float | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> str | None:
+    """
+    Polls an asynchronous job until it leaves the pending statuses.
+
+    The interval grows by `factor` after every poll that reports no change and
+    drops back to `initial_interval` when the status moves, so short jobs finish
+    quickly and long ones cost few status calls.
+
+    Args:
+        fetch_status (Callable): Returns the current job status.
+        initial_interval (float): First wait in seconds, and the wait after a status
+            change.
+        max_interval (float): Longest wait between two polls.
+        factor (float): Growth of the wait while the status is unchanged.
+        timeout (float | None): Seconds after which polling gives up; None waits
+            indefinitely.
+        sleep (Callable): Used to wait between polls.
+
+    Returns:
+        str | None: The final status, e.g. 'FINISHED' or 'CANCELLED'.
+
+    Raises:
+        TimeoutError: If the job is still pending after `timeout` seconds.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    interval = initial_interval
+    previous = None
+    while True:
+        status = fetch_status()
+        if status not in PENDING_STATUSES:
+            return status
+        if status != previous:
+            interval = initial_interval
+        previous = status
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Job still {status} after {timeout} seconds")
+            interval = min(interval, remaining)
+        sleep(interval)
+        interval = min(interval * factor, max_interval)
+
+
+def _validator(response: httpx.Response) -> str | None:
+    # If-Range only accepts a strong ETag or a Last-Modified date.
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+def _range_start(response: httpx.Response) -> int | None:
+    match = re.match(r"bytes (\d+)-", response.headers.get("Content-Range", ""))
+    return int(match[1]) if match else None
+
+
+def download_file(
+    client: httpx.Client,
+    url: str,
+    path: str | os.PathLike,
+    chunk_size: int = 1 << 20,
+    retry_policy: RetryPolicy | None = None,
+) -> Path:
+    """
+    Streams a file to disk in chunks, resuming interrupted transfers via `Range`.
+
+    Data is written to `<path>.part`, which is renamed to `path` once complete.
+    The ETag or Last-Modified of the download is kept next to it and sent as
+    `If-Range` when resuming, so a leftover `.part` file is only continued
+    when the server still has the same file; otherwise it is downloaded again.
+    Memory use is bounded by `chunk_size`.
+
+    Args:
+        client (httpx.Client): Client used for the download.
+        url (str): URL of the file.
+        path (str | PathLike): Destination file.
+        chunk_size (int): Bytes read and written at a time.
+        retry_policy (RetryPolicy | None): Decides whether a failed attempt is resumed.
+
+    Returns:
+        Path: The destination file.
+    """
+    policy = retry_policy or RetryPolicy()
+    path = Path(path)
+    part = path.with_name(path.name + ".part")
+    meta = path.with_name(path.name + ".part.validator")
+    attempt, delay = 1, 0.0
+    while True:
+        offset = part.stat().st_size if part.exists() else 0
+        validator = meta.read_text(encoding="utf-8") if meta.exists() else None
+        headers = (
+            {"Range": f"bytes={offset}-", "If-Range": validator}
+            if offset and validator
+            else {}
+        )
+        try:
+            with client.stream("GET", url, headers=headers) as response:
+                status = response.status_code
+                if headers and status == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE:
+                    break
+                if response.is_success:
+                    resumed = status == httpx.codes.PARTIAL_CONTENT and bool(headers)
+                    if resumed and _range_start(response) != offset:
+                        # The server sent some other range; start over without one.
+                        part.unlink()
+                        meta.unlink(missing_ok=True)
+                        continue
+                    if not resumed:
+                        # A changed file, or a server ignoring Range, answers 200 with
+                        # the whole file.
+                        validator = _validator(response)
+                        if validator:
+                            meta.write_text(validator, encoding="utf-8")
+                        else:
+                            meta.unlink(missing_ok=True)
+                    with open(part, "ab" if resumed else "wb") as file:
+                        for chunk in response.iter_bytes(chunk_size):
+                            file.write(chunk)
+                    break
+                delay = policy.retry_delay("GET", attempt, delay, response=response)
+                if delay is None:
+                    response.raise_for_status()
+        except httpx.TransportError as error:
+            delay = policy.retry_delay("GET", attempt, delay, error=error)
+            if delay is None:
+                raise
+        time.sleep(delay)
+        attempt += 1
+    part.replace(path)
+    meta.unlink(missing_ok=True)
+    return path
+
+
+def _file_name(board_id: str, link: str) -> str:
+    suffix = "".join(PurePosixPath(urlsplit(link).path).suffixes) or ".zip"
+    return f"{board_id}{suffix}"
+
+
+def export_boards(
+    app: Any,
+    org_id: str,
+    board_ids: Sequence[str],
+    directory: str | os.PathLike,
+    *,
+    board_format: str = "SVG",
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    max_workers: int = 4,
+    timeout: float | None = 3600.0,
+    client: httpx.Client | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Exports boards end to end: creates jobs, waits for them, downloads archives.
+
+    The board list is split into shards of `shard_size` boards, each exported
+    by its own job; up to `max_workers` jobs run concurrently. Archives are
+    streamed to `directory` as `<board_id>.<ext>`.
+
+    Args:
+        app (MiroApp): Client used for the export job endpoints.
+        org_id (str): ID of the organization owning the boards.
+        board_ids (Sequence[str]): Boards to export.
+        directory (str | PathLike): Folder the archives are written to; created if
+            missing.
+        board_format (str): Export format, e.g. 'SVG', 'HTML' or 'PDF'.
+        shard_size (int): Maximum number of boards per export job.
+        max_workers (int): Maximum number of jobs handled at the same time.
+        timeout (float | None): Seconds each job may stay pending.
+        client (httpx.Client | None): Client used for the downloads; the export
+            links are pre-signed, so it needs no Miro credentials.
+
+    Returns:
+        list[dict]: One entry per board in input order with `boardId`, `jobId`
+        and either `path` or `error`.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    board_ids = list(board_ids)
+    download_client = client or httpx.Client(
+        timeout=httpx.Timeout(30.0, read=300.0), follow_redirects=True
+    )
+
+    def export_shard(shard: Sequence[str]) -> dict[str, dict[str, Any]]:
+        job = app.create_board_export_job(
+            org_id,
+            request_id=str(uuid.uuid4()),
+            boardFormat=board_format,
+            boardIds=list(shard),
+        )
+        job_id = job["jobId"]
+        status = wait_for_job(
+            lambda: app.get_board_export_job_status(org_id, job_id).get("jobStatus"),
+            timeout=timeout,
+        )
+        if status != "FINISHED":
+            return {
+                board_id: {
+                    "boardId": board_id,
+                    "jobId": job_id,
+                    "error": f"Export job ended as {status}",
+                }
+                for board_id in shard
+            }
+        entries = {}
+        for result in (
+            app.get_results_for_board_export_job(org_id, job_id).get("results") or []
+        ):
+            board_id = result.get("boardId")
+            entry = {"boardId": board_id, "jobId": job_id}
+            link = result.get("exportLink")
+            if result.get("status") != "SUCCESS" or not link:
+                entry["error"] = (
+                    result.get("errorMessage")
+                    or result.get("errorType")
+                    or "Export failed"
+                )
+            else:
+                try:
+                    entry["path"] = str(
+                        download_file(
+                            download_client,
+                            link,
+                            directory / _file_name(board_id, link),
+                        )
+                    )
+                except Exception as error:
+                    entry["error"] = describe_error(error)
+            entries[board_id] = entry
+        return entries
+
+    try:
+        shards = chunked(board_ids, shard_size)
+        outcomes = run_concurrently(export_shard, shards, max_workers=max_workers)
+    finally:
+        if client is None:
+            download_client.close()
+    results = []
+    for shard, outcome in zip(shards, outcomes):
+        for board_id in shard:
+            if outcome.error is not None:
+                results.append(
+                    {
+                        "boardId": board_id,
+                        "jobId": None,
+                        "error": describe_error(outcome.error),
+                    }
+                )
+            else:
+                results.append(
+                    outcome.result.get(board_id)
+                    or {
+                        "boardId": board_id,
+                        "jobId": None,
+                        "error": "Missing from the export job results",
+                    }
+                )
+    return results
@@ -0,0 +1,215 @@
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+
+def _endpoint(connector: Mapping[str, Any], field: str) -> str | None:
+    item_id = (connector.get(field) or {}).get("id")
+    return str(item_id) if item_id is not None else None
+
+
+class ConnectorGraph:
+    """
+    Directed adjacency-list graph of board items and the connectors between them.
+
+    Each connector is an edge from its `startItem` to its `endItem`; connectors
+    missing either end are ignored. All traversals are iterative and run in
+    O(nodes + edges), so flowchart questions are answered locally once the
+    connectors are fetched.
+    """
+
+    def __init__(self) -> None:
+        self._out: dict[str, list[tuple[str, str]]] = {}
+        self._in: dict[str, list[tuple[str, str]]] = {}
+        self._edges: dict[str, tuple[str, str]] = {}
+
+    @classmethod
+    def from_connectors(
+        cls, connectors: Iterable[Mapping[str, Any]]
+    ) -> "ConnectorGraph":
+        """Builds a graph from connector payloads as returned by get_connectors."""
+        graph = cls()
+        for connector in connectors:
+            start, end = (
+                _endpoint(connector, "startItem"),
+                _endpoint(connector, "endItem"),
+            )
+            if start is not None and end is not None:
+                graph.add_edge(str(connector.get("id")), start, end)
+        return graph
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Any) -> "ConnectorGraph":
+        """Builds a graph from a BoardSnapshot, keeping unconnected items as nodes."""
+        graph = cls.from_connectors(snapshot.connectors.values())
+        for item in snapshot:
+            graph.add_node(item.id)
+        return graph
+
+    def add_node(self, item_id: str) -> None:
+        self._out.setdefault(item_id, [])
+        self._in.setdefault(item_id, [])
+
+    def add_edge(self, connector_id: str, start: str, end: str) -> None:
+        """Adds edge `connector_id` from `start` to `end`, replacing an existing one."""
+        if connector_id in self._edges:
+            self.remove_edge(connector_id)
+        self.add_node(start)
+        self.add_node(end)
+        self._edges[connector_id] = (start, end)
+        self._out[start].append((end, connector_id))
+        self._in[end].append((start, connector_id))
+
+    def remove_edge(self, connector_id: str) -> bool:
+        """Removes a connector; returns False if it was not in the graph."""
+        edge = self._edges.pop(connector_id, None)
+        if edge is None:
+            return False
+        start, end = edge
+        self._out[start] = [
+            entry for entry in self._out[start] if entry[1] != connector_id
+        ]
+        self._in[end] = [entry for entry in self._in[end] if entry[1] != connector_id]
+        return True
+
+    def __len__(self) -> int:
+        return len(self._out)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._out
+
+    @property
+    def nodes(self) -> list[str]:
+        return list(self._out)
+
+    @property
+    def edges(self) -> dict[str, tuple[str, str]]:
+        """`(start, end)` item IDs by connector ID."""
+        return dict(self._edges)
+
+    def _adjacent(self, item_id: str, direction: str) -> Iterator[str]:
+        if direction not in ("out", "in", "both"):
+            raise ValueError("direction must be 'out', 'in' or 'both'")
+        if direction in ("out", "both"):
+            for node, _ in self._out.get(item_id, ()):
+                yield node
+        if direction in ("in", "both"):
+            for node, _ in self._in.get(item_id, ()):
+                yield node
+
+    def neighbors(self, item_id: str, direction: str = "out") -> list[str]:
+        """
+        Returns the items connected to `item_id`, without duplicates.
+
+        Args:
+            item_id (str): Item to look around.
+            direction (str): 'out' for successors, 'in' for predecessors, 'both' for
+                either.
+        """
+        return list(dict.fromkeys(self._adjacent(item_id, direction)))
+
+    def reachable(self, item_id: str, direction: str = "out") -> set[str]:
+        """Returns the items reachable from `item_id`, itself only if on a cycle."""
+        seen: set[str] = set()
+        queue = deque(self._adjacent(item_id, direction))
+        while queue:
+            node = queue.popleft()
+            if node in seen:
+                continue
+            seen.add(node)
+            queue.extend(
+                next_node
+                for next_node in self._adjacent(node, direction)
+                if next_node not in seen
+            )
+        return seen
+
+    def shortest_path(
+        self, start: str, end: str, directed: bool = True
+    ) -> list[str] | None:
+        """
+        Returns the path with the fewest connectors from `start` to `end`.
+
+        Args:
+            start (str): ID of the first item.
+            end (str): ID of the last item.
+            directed (bool): Follow connectors only from start to end item; False treats
+                them as undirected.
+
+        Returns:
+            list[str] | None: Item IDs from `start` to `end`, or None if `end` cannot be
+                reached.
+        """
+        if start not in self._out or end not in self._out:
+            return None
+        direction = "out" if directed else "both"
+        previous: dict[str, str | None] = {start: None}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            if node == end:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = previous[node]
+                return path[::-1]
+            for next_node in self._adjacent(node, direction):
+                if next_node not in previous:
+                    previous[next_node] = node
+                    queue.append(next_node)
+        return None
+
+    def find_cycle(self) -> list[str] | None:
+        """
+        Returns the item IDs of one directed cycle, or None if the graph is acyclic.
+
+        The cycle is closed by repeating its first item.
+        """
+        state: dict[str, int] = {}
+        for root in self._out:
+            if root in state:
+                continue
+            state[root] = 1
+            stack = [(root, iter(self._out[root]))]
+            while stack:
+                node, successors = stack[-1]
+                for next_node, _ in successors:
+                    if state.get(next_node) == 1:
+                        path = [entry[0] for entry in stack]
+                        return path[path.index(next_node) :] + [next_node]
+                    if next_node not in state:
+                        state[next_node] = 1
+                        stack.append((next_node, iter(self._out[next_node])))
+                        break
+                else:
+                    state[node] = 2
+                    stack.pop()
+        return None
+
+    def has_cycle(self) -> bool:
+        return self.find_cycle() is not None
+
+    def topological_order(self) -> list[str]:
+        """
+        Orders the items so every connector points from an earlier to a later item.
+
+        Items without incoming connectors come first, in insertion order.
+
+        Raises:
+            ValueError: If the connectors form a cycle.
+        """
+        indegree = {node: len(self._in[node]) for node in self._out}
+        queue = deque(node for node, degree in indegree.items() if degree == 0)
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for next_node, _ in self._out[node]:
+                indegree[next_node] -= 1
+                if indegree[next_node] == 0:
+                    queue.append(next_node)
+        if len(order) != len(self._out):
+            raise ValueError(
+                f"Connectors form a cycle: {' -> '.join(self.find_cycle() or [])}"
+            )
+        return order
@@ -0,0 +1,175 @@
+import functools
+import inspect
+import itertools
+import json
+import re
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+MANIFEST_PATH = Path(__file__).with_name("tools.json")
+
+# Longest description kept for a tool or a parameter in the manifest.
+MAX_DESCRIPTION = 200
+
+_JSON_TYPES = {
+    "string": "string",
+    "str": "string",
+    "integer": "integer",
+    "int": "integer",
+    "number": "number",
+    "float": "number",
+    "boolean": "boolean",
+    "bool": "boolean",
+    "array": "array",
+    "list": "array",
+    "object": "object",
+    "dict": "object",
+}
+_SECTION = re.compile(r"^(Args|Returns|Raises|Tags):\s*$")
+_ARG = re.compile(r"^ {4}(\w+) \(([^)]*)\):\s*(.*)$")
+# A wrapped argument description; an `Example:` block or code fence ends it.
+_ARG_CONTINUATION = re.compile(r"^ {8}(?!Example:|```)\S")
+
+
+def shorten(text: str, limit: int = MAX_DESCRIPTION) -> str:
+    """Collapses whitespace and cuts `text` to `limit` characters at a word boundary."""
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    return text[: limit - 1].rsplit(" ", 1)[0] + "…"
+
+
+def parse_docstring(fn: Callable[..., Any]) -> dict[str, Any]:
+    """
+    Reads the summary, argument types and descriptions, and tags of a tool docstring.
+
+    Wrapped summaries and argument descriptions are joined into one line; the
+    multi-line JSON examples of the generated methods are dropped.
+
+    Returns:
+        dict: `summary`, `args` as `{name: (type, description)}` and `tags`.
+    """
+    lines = (inspect.getdoc(fn) or "").splitlines()
+    summary = list(itertools.takewhile(str.strip, lines))
+    args: dict[str, tuple[str, str]] = {}
+    tags: list[str] = []
+    section = None
+    current = None
+    for line in lines[len(summary) :]:
+        match = _SECTION.match(line)
+        if match:
+            section = match[1]
+            current = None
+            continue
+        if section == "Args":
+            arg = _ARG.match(line)
+            if arg:
+                current = arg[1]
+                args[current] = (arg[2].strip(), arg[3].strip())
+            elif current and _ARG_CONTINUATION.match(line):
+                arg_type, description = args[current]
+                args[current] = (arg_type, f"{description} {line.strip()}")
+            else:
+                current = None
+        elif section == "Tags" and line.strip():
+            tags += [tag.strip() for tag in line.split(",") if tag.strip()]
+    return {
+        "summary": " ".join(line.strip() for line in summary),
+        "args": args,
+        "tags": tags,
+    }
+
+
+def describe_tool(fn: Callable[..., Any]) -> dict[str, Any]:
+    """Builds the manifest entry of one tool: name, description, tags, input schema."""
+    doc = parse_docstring(fn)
+    properties: dict[str, dict[str, Any]] = {}
+    required = []
+    for name, parameter in inspect.signature(fn).parameters.items():
+        if name == "self" or parameter.kind in (
+            parameter.VAR_POSITIONAL,
+            parameter.VAR_KEYWORD,
+        ):
+            continue
+        arg_type, description = doc["args"].get(name, ("", ""))
+        schema: dict[str, Any] = {}
+        json_type = _JSON_TYPES.get(arg_type.split()[0].lower()) if arg_type else None
+        if json_type:
+            schema["type"] = json_type
+        if description and description != name:
+            schema["description"] = shorten(description)
+        if parameter.default is parameter.empty:
+            required.append(name)
+        elif parameter.default is not None:
+            schema["default"] = parameter.default
+        properties[name] = schema
+    input_schema: dict[str, Any] = {"type": "object", "properties": properties}
+    if required:
+        input_schema["required"] = required
+    return {
+        "name": fn.__name__,
+        "description": shorten(doc["summary"]),
+        "tags": doc["tags"],
+        "inputSchema": input_schema,
+    }
+
+
+def build_manifest(app: Any) -> list[dict[str, Any]]:
+    """Returns the manifest entries of every tool listed by `app`, in listing order."""
+    return [describe_tool(fn) for fn in app.list_tools()]
+
+
+def write_manifest(app: Any, path: Path = MANIFEST_PATH) -> Path:
+    """
+    Regenerates the manifest file.
+
+    Run `python -m universal_mcp_miro.manifest` after changing tools.
+    """
+    path.write_text(
+        json.dumps(build_manifest(app), indent=1, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@functools.cache
+def load_manifest(path: Path = MANIFEST_PATH) -> dict[str, dict[str, Any]]:
+    """Reads the manifest once per process and returns its entries by tool name."""
+    with open(path, encoding="utf-8") as file:
+        return {entry["name"]: entry for entry in json.load(file)}
+
+
+def select_tools(
+    manifest: dict[str, dict[str, Any]], tags: Iterable[str] | None
+) -> dict[str, dict[str, Any]]:
+    """
+    Returns the manifest entries carrying at least one of `tags`.
+
+    Tags are compared case-insensitively; `None` or an empty allowlist selects
+    every tool.
+
+    Raises:
+        ValueError: If a tag matches no tool; the message lists the known tags.
+    """
+    wanted = {tag.strip().lower() for tag in tags or () if tag.strip()}
+    if not wanted:
+        return dict(manifest)
+    known = {tag.lower(): tag for entry in manifest.values() for tag in entry["tags"]}
+    unknown = sorted(wanted - known.keys())
+    if unknown:
+        available = ", ".join(sorted(known.values()))
+        raise ValueError(
+            f"Unknown tool tags: {', '.join(unknown)}. Available: {available}"
+        )
+    return {
+        name: entry
+        for name, entry in manifest.items()
+        if wanted.intersection(tag.lower() for tag in entry["tags"])
+    }
+
+
+if __name__ == "__main__":
+    from universal_mcp_miro.app import MiroApp
+
+    print(write_manifest(MiroApp.__new__(MiroApp)))  # noqa: T201
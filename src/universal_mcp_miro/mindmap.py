@@ -0,0 +1,216 @@
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+from universal_mcp_miro.bulk import describe_error, run_concurrently
+
+# Vertical space given to each leaf of a root's subtree when stacking roots.
+ROW_HEIGHT = 100.0
+
+
+def node_content(payload: Mapping[str, Any]) -> str | None:
+    """Returns the text of a mind map node payload."""
+    view = ((payload.get("data") or {}).get("nodeView") or {}).get("data") or {}
+    return view.get("content")
+
+
+class MindMapNode:
+    __slots__ = ("id", "parent_id", "payload", "children")
+
+    def __init__(self, payload: Mapping[str, Any]) -> None:
+        self.id = str(payload["id"])
+        parent_id = (payload.get("parent") or {}).get("id")
+        self.parent_id = str(parent_id) if parent_id is not None else None
+        self.payload = dict(payload)
+        self.children: list[MindMapNode] = []
+
+    @property
+    def content(self) -> str | None:
+        return node_content(self.payload)
+
+    def __repr__(self) -> str:
+        return f"MindMapNode(id={self.id!r}, children={len(self.children)})"
+
+
+class MindMapTree:
+    """
+    Hierarchy of the mind map nodes on a board.
+
+    `from_nodes` links the flat node list returned by get_mind_map_nodes in a
+    single pass, whatever order parents and children arrive in, so it can
+    consume the paginated stream directly. A board can hold several mind maps;
+    each one is a root.
+    """
+
+    def __init__(self) -> None:
+        self.nodes: dict[str, MindMapNode] = {}
+        self._waiting: dict[str, list[MindMapNode]] = {}
+
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[Mapping[str, Any]]) -> "MindMapTree":
+        tree = cls()
+        for payload in nodes:
+            tree.add(payload)
+        return tree
+
+    def add(self, payload: Mapping[str, Any]) -> MindMapNode:
+        """Adds a node payload, linking it to its parent and already-seen children."""
+        node = MindMapNode(payload)
+        self.nodes[node.id] = node
+        node.children.extend(self._waiting.pop(node.id, ()))
+        if node.parent_id is not None:
+            parent = self.nodes.get(node.parent_id)
+            if parent is not None:
+                parent.children.append(node)
+            else:
+                self._waiting.setdefault(node.parent_id, []).append(node)
+        return node
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self.nodes
+
+    def get(self, node_id: str) -> MindMapNode | None:
+        return self.nodes.get(node_id)
+
+    @property
+    def roots(self) -> list[MindMapNode]:
+        """Nodes without a parent on the board, or whose parent was never seen."""
+        return [
+            node
+            for node in self.nodes.values()
+            if node.parent_id is None or node.parent_id not in self.nodes
+        ]
+
+    def walk(self, node_id: str | None = None) -> Iterator[tuple[MindMapNode, int]]:
+        """Yields `(node, depth)` pairs depth-first, from one node or every root."""
+        stack = (
+            [(self.nodes[node_id], 0)]
+            if node_id is not None
+            else [(root, 0) for root in reversed(self.roots)]
+        )
+        while stack:
+            node, depth = stack.pop()
+            yield node, depth
+            stack.extend((child, depth + 1) for child in reversed(node.children))
+
+    def to_outline(self, node_id: str | None = None) -> list[dict[str, Any]]:
+        """
+        Returns the hierarchy as nested `{"id", "content", "children"}` dicts.
+
+        Args:
+            node_id (str | None): Node whose subtree is returned; every root when None.
+
+        Returns:
+            list[dict]: One outline per root.
+        """
+        outlines: dict[str, dict[str, Any]] = {}
+        top = []
+        for node, depth in self.walk(node_id):
+            outline = {"id": node.id, "content": node.content, "children": []}
+            outlines[node.id] = outline
+            if depth == 0:
+                top.append(outline)
+            else:
+                outlines[node.parent_id]["children"].append(outline)
+        return top
+
+
+def _as_spec(spec: str | Mapping[str, Any]) -> Mapping[str, Any]:
+    return {"content": spec} if isinstance(spec, str) else spec
+
+
+def root_positions(
+    outline: Sequence[str | Mapping[str, Any]],
+    x: float = 0.0,
+    y: float = 0.0,
+    row_height: float = ROW_HEIGHT,
+) -> list[dict[str, float]]:
+    """
+    Stacks the roots of an outline vertically so their subtrees do not overlap.
+
+    The first root is placed at (x, y). Each subtree gets a band one row per
+    leaf plus one row of spacing, centered on its root.
+
+    Returns:
+        list[dict]: One `{"x", "y"}` position per root, in outline order.
+    """
+    positions, offset, previous = [], 0.0, None
+    for spec in outline:
+        band = (_leaves(_as_spec(spec)) + 1) * row_height
+        if previous is not None:
+            offset += (previous + band) / 2
+        positions.append({"x": x, "y": y + offset})
+        previous = band
+    return positions
+
+
+def _leaves(spec: Mapping[str, Any]) -> int:
+    total, stack = 0, [spec]
+    while stack:
+        children = _as_spec(stack.pop()).get("children") or []
+        if not children:
+            total += 1
+        stack.extend(children)
+    return total
+
+
+def build_level_by_level(
+    create: Callable[[Mapping[str, Any], str | None], str],
+    outline: Sequence[str | Mapping[str, Any]],
+    max_workers: int = 8,
+) -> dict[str, Any]:
+    """
+    Creates a mind map breadth-first, one concurrent wave per level.
+
+    Every node of a level is created at the same time once its parent exists,
+    so a map costs as many waves as it has levels instead of one sequential
+    request per node. When a node fails, its subtree is skipped.
+
+    Args:
+        create (Callable): Creates one node from its spec and parent ID (None for a
+            root) and returns the new node's ID.
+        outline (Sequence): Root specs; each is a string or a `{"content", "children"}`
+            dict.
+        max_workers (int): Maximum number of nodes created at the same time.
+
+    Returns:
+        dict: `nodes` lists `{"path", "id"}` per created node, `failures` lists
+        `{"path", "error", "skipped"}` per failed node, where `path` is the
+        node's index path such as `"0/2/1"` and `skipped` counts its descendants.
+    """
+    level = [(str(index), _as_spec(spec), None) for index, spec in enumerate(outline)]
+    created, failures = [], []
+    while level:
+        outcomes = run_concurrently(
+            lambda job: create(job[1], job[2]), level, max_workers=max_workers
+        )
+        next_level = []
+        for (path, spec, _), outcome in zip(level, outcomes):
+            children = spec.get("children") or []
+            if outcome.error is not None:
+                failures.append(
+                    {
+                        "path": path,
+                        "error": describe_error(outcome.error),
+                        "skipped": _count(children),
+                    }
+                )
+                continue
+            created.append({"path": path, "id": outcome.result})
+            next_level.extend(
+                (f"{path}/{index}", _as_spec(child), outcome.result)
+                for index, child in enumerate(children)
+            )
+        level = next_level
+    return {"nodes": created, "failures": failures}
+
+
+def _count(specs: Sequence[str | Mapping[str, Any]]) -> int:
+    total, stack = 0, list(specs)
+    while stack:
+        spec = _as_spec(stack.pop())
+        total += 1
+        stack.extend(spec.get("children") or [])
+    return total
@@ -0,0 +1,124 @@
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+PageFetcher = Callable[[str | None], dict[str, Any]]
+
+
+def _next_cursor(page: dict[str, Any], previous: str | None) -> str | None:
+    """Returns the cursor for the page after `page`, or None after the last page."""
+    cursor = page.get("cursor")
+    if not cursor or cursor == previous or not page.get("data"):
+        return None
+    return cursor
+
+
+def iter_cursor_pages(
+    fetch: PageFetcher, prefetch: bool = True, cursor: str | None = None
+) -> Iterator[dict[str, Any]]:
+    """
+    Yields the raw pages of a cursor-paginated Miro endpoint.
+
+    `fetch` is called with the cursor of the page to load (`cursor` for the first
+    page) and must return the decoded response body. With `prefetch` enabled the
+    request for page N+1 is issued on a background thread as soon as page N arrives,
+    so at most two pages are held in memory and the caller never waits a full round
+    trip between pages.
+
+    Args:
+        fetch (Callable[[str | None], dict]): Loads one page for the given cursor.
+        prefetch (bool): Whether to fetch the next page while this one is consumed.
+        cursor (str | None): Cursor to start from, e.g. saved by an interrupted run.
+
+    Returns:
+        Iterator[dict]: Response bodies, in page order.
+    """
+    if not prefetch:
+        while True:
+            page = fetch(cursor)
+            yield page
+            cursor = _next_cursor(page, cursor)
+            if cursor is None:
+                return
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="miro-prefetch")
+    pending: Future | None = executor.submit(fetch, cursor)
+    try:
+        while pending is not None:
+            page = pending.result()
+            cursor = _next_cursor(page, cursor)
+            pending = executor.submit(fetch, cursor) if cursor else None
+            yield page
+    finally:
+        if pending is not None:
+            pending.cancel()
+        executor.shutdown(wait=False)
+
+
+def iter_cursor(fetch: PageFetcher, prefetch: bool = True) -> Iterator[dict[str, Any]]:
+    """
+    Yields the individual entries of a cursor-paginated Miro endpoint.
+
+    Args:
+        fetch (Callable[[str | None], dict]): Loads one page for the given cursor.
+        prefetch (bool): Whether to fetch the next page while this one is consumed.
+
+    Returns:
+        Iterator[dict]: Entries from the `data` array of every page, in order.
+    """
+    for page in iter_cursor_pages(fetch, prefetch=prefetch):
+        yield from page.get("data") or []
+
+
+def fetch_offset_windows(
+    fetch: Callable[[int, int], dict[str, Any]],
+    page_size: int = 50,
+    max_workers: int = 8,
+) -> list[dict[str, Any]]:
+    """
+    Collects every entry of an offset-paginated Miro endpoint.
+
+    `fetch` is called with `(offset, limit)` and must return the decoded response
+    body. The first page reveals the `total`; all remaining offset windows are
+    independent of each other, so they are requested concurrently on a bounded
+    pool instead of one after another. Endpoints that do not report a total are
+    walked sequentially until a short page is returned. Windows follow the
+    `limit` the API reports, so a `page_size` above its cap still reaches
+    every entry.
+
+    Args:
+        fetch (Callable[[int, int], dict]): Loads the window at an offset and limit.
+        page_size (int): Number of entries requested per window.
+        max_workers (int): Maximum number of windows fetched at the same time.
+
+    Returns:
+        list[dict]: Entries from the `data` array of every window, in offset order.
+    """
+    first = fetch(0, page_size)
+    entries = list(first.get("data") or [])
+    total = first.get("total")
+    if not entries or (total is not None and len(entries) >= int(total)):
+        return entries
+    # Miro caps `limit` per endpoint, so page by the window it actually served:
+    # the `limit` it reports, or else the size of the first page.
+    step = min(page_size, int(first.get("limit") or len(entries)))
+
+    if total is None:
+        if len(entries) < step:
+            return entries
+        offset = len(entries)
+        while True:
+            page = list(fetch(offset, step).get("data") or [])
+            entries.extend(page)
+            if len(page) < step:
+                return entries
+            offset += len(page)
+
+    offsets = range(len(entries), int(total), step)
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(offsets))),
+        thread_name_prefix="miro-offset",
+    ) as executor:
+        for page in executor.map(lambda offset: fetch(offset, step), offsets):
+            entries.extend(page.get("data") or [])
+    return entries
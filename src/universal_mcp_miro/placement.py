@@ -0,0 +1,97 @@
+import math
+from collections.abc import Iterator, Sequence
+
+from universal_mcp_miro.spatial import Box, SpatialIndex
+
+
+def _lattice(step: float, max_rings: int) -> Iterator[tuple[float, float]]:
+    """Yields lattice offsets ring by ring, sorted by distance to the origin."""
+    yield (0.0, 0.0)
+    for ring in range(1, max_rings + 1):
+        cells = [(i, -ring) for i in range(-ring, ring + 1)]
+        cells += [(i, ring) for i in range(-ring, ring + 1)]
+        cells += [(-ring, j) for j in range(-ring + 1, ring)]
+        cells += [(ring, j) for j in range(-ring + 1, ring)]
+        cells.sort(key=lambda cell: math.hypot(*cell))
+        for i, j in cells:
+            yield (i * step, j * step)
+
+
+def find_free_positions(
+    index: SpatialIndex,
+    sizes: Sequence[tuple[float, float]],
+    *,
+    near: tuple[float, float] = (0.0, 0.0),
+    gap: float = 20.0,
+    region: Box | None = None,
+    max_rings: int = 500,
+) -> list[dict[str, float]]:
+    """
+    Finds non-overlapping positions for new items in one pass.
+
+    Candidate centers are tried on a lattice spiralling out from `near`; the
+    first candidate whose box, padded by `gap`, hits nothing in the index is
+    taken. Every placed box is added to the index while the remaining items are
+    placed, so the new items do not overlap each other either, and removed again
+    before returning.
+
+    Args:
+        index (SpatialIndex): Index of the occupied areas, e.g. from a BoardSnapshot.
+        sizes (Sequence[tuple[float, float]]): `(width, height)` of each new item.
+        near (tuple[float, float]): Canvas point the items should be placed close to.
+        gap (float): Minimum free space kept around each item.
+        region (Box | None): Optional `(left, top, right, bottom)` area to fit into.
+        max_rings (int): How far the search spirals out before giving up.
+
+    Returns:
+        list[dict[str, float]]: One `{"x", "y"}` center per item, usable as `position`.
+
+    Raises:
+        ValueError: If an item does not fit within the searched area.
+    """
+    placed: list[tuple[str, int]] = []
+    positions = []
+    try:
+        for number, (width, height) in enumerate(sizes):
+            half_width, half_height = width / 2 + gap, height / 2 + gap
+            step = max(min(width, height) / 2, gap, 1.0)
+            rings = max_rings
+            if region is not None:
+                reach = max(
+                    abs(region[0] - near[0]),
+                    abs(region[2] - near[0]),
+                    abs(region[1] - near[1]),
+                    abs(region[3] - near[1]),
+                )
+                rings = min(rings, math.ceil(reach / step))
+            for dx, dy in _lattice(step, rings):
+                x, y = near[0] + dx, near[1] + dy
+                padded = (
+                    x - half_width,
+                    y - half_height,
+                    x + half_width,
+                    y + half_height,
+                )
+                if region is not None and not (
+                    region[0] <= x - width / 2
+                    and x + width / 2 <= region[2]
+                    and region[1] <= y - height / 2
+                    and y + height / 2 <= region[3]
+                ):
+                    continue
+                if not index.query_box(padded):
+                    break
+            else:
+                raise ValueError(
+                    f"No free space found for item {number} of size {width}x{height}"
+                )
+            key = ("__placement__", number)
+            index.insert(
+                key, (x - width / 2, y - height / 2, x + width / 2, y + height / 2)
+            )
+            placed.append(key)
+            positions.append({"x": x, "y": y})
+    finally:
+        for key in placed:
+            index.remove(key)
+    return positions
@@ -0,0 +1,155 @@
+import asyncio
+import re
+import threading
+import time
+from collections.abc import Mapping
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+# Credits charged per call for each of Miro's rate limit levels.
+LEVEL_CREDITS = {1: 50, 2: 100, 3: 500, 4: 2000}
+
+DEFAULT_CREDIT_LIMIT = 100_000
+DEFAULT_WINDOW = 60.0
+
+# (HTTP method, path pattern, level) for endpoints that are not charged at the
+# default level: 1 for reads and 2 for writes.
+_ENDPOINT_LEVELS = [
+    (
+        "GET",
+        re.compile(
+            r"^/v2(-experimental)?/boards/[^/]+/(items|connectors|tags|groups|mindmap_nodes)$"
+        ),
+        2,
+    ),
+    ("GET", re.compile(r"^/v2/audit/logs$"), 3),
+    ("GET", re.compile(r"^/v2/orgs/[^/]+/content-logs/items$"), 3),
+    ("POST", re.compile(r"^/v2/boards$"), 3),
+    ("PUT", re.compile(r"^/v2/boards$"), 4),
+    ("DELETE", re.compile(r"^/v2/boards/[^/]+$"), 3),
+    ("POST", re.compile(r"^/v2/boards/[^/]+/members$"), 3),
+    ("POST", re.compile(r"^/v2/boards/[^/]+/items/bulk$"), 3),
+    ("POST", re.compile(r"^/v2/orgs/[^/]+/boards/export/jobs$"), 4),
+]
+
+
+def request_weight(method: str, url: str) -> int:
+    """
+    Returns the number of rate limit credits a Miro API call consumes.
+
+    Args:
+        method (str): HTTP method of the call.
+        url (str): Absolute or path-only URL of the call.
+
+    Returns:
+        int: Credits charged for the call.
+    """
+    method = method.upper()
+    path = urlsplit(url).path.rstrip("/")
+    for level_method, pattern, level in _ENDPOINT_LEVELS:
+        if level_method == method and pattern.match(path):
+            return LEVEL_CREDITS[level]
+    return LEVEL_CREDITS[1 if method == "GET" else 2]
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> float | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class CreditScheduler:
+    """
+    Paces Miro API calls against the credit budget reported by the API.
+
+    Every call reserves its credit weight before it is sent. When the local
+    estimate of the remaining credits cannot cover a call, the caller waits until
+    the window resets instead of sending a request that would come back as 429.
+    The estimate is corrected from the `X-RateLimit-*` headers of each response.
+    One scheduler is thread-safe and can be shared by sync and async clients.
+    """
+
+    def __init__(
+        self, limit: int = DEFAULT_CREDIT_LIMIT, window: float = DEFAULT_WINDOW
+    ) -> None:
+        self.limit = limit
+        self.window = window
+        self._remaining = limit
+        self._reset_at = time.monotonic() + window
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        """Credits currently estimated to be left in this window."""
+        with self._lock:
+            self._roll_window(time.monotonic())
+            return self._remaining
+
+    def _roll_window(self, now: float) -> None:
+        if now >= self._reset_at:
+            self._remaining = self.limit
+            self._reset_at = now + self.window
+
+    def reserve(self, weight: int) -> float:
+        """
+        Tries to reserve credits for one call.
+
+        Args:
+            weight (int): Credits the call consumes.
+
+        Returns:
+            float: 0 when the credits were reserved, otherwise the number of
+                seconds to wait before trying again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._roll_window(now)
+            if self._remaining >= min(weight, self.limit):
+                self._remaining -= weight
+                return 0.0
+            return max(self._reset_at - now, 0.001)
+
+    def acquire(self, weight: int) -> None:
+        """Blocks the calling thread until `weight` credits are reserved."""
+        while delay := self.reserve(weight):
+            time.sleep(delay)
+
+    async def aacquire(self, weight: int) -> None:
+        """Waits without blocking the event loop until `weight` credits are reserved."""
+        while delay := self.reserve(weight):
+            await asyncio.sleep(delay)
+
+    def observe(self, headers: Mapping[str, str], status_code: int = 200) -> None:
+        """
+        Updates the budget from the rate limit headers of a response.
+
+        Args:
+            headers (Mapping[str, str]): Response headers.
+            status_code (int): Response status; a 429 empties the current window.
+        """
+        limit = _header_float(headers, "X-RateLimit-Limit")
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+        reset = _header_float(headers, "X-RateLimit-Reset")
+        with self._lock:
+            now = time.monotonic()
+            if limit is not None:
+                self.limit = int(limit)
+            if reset is not None:
+                reset_at = now + max(reset - time.time(), 0.0)
+                if reset_at - self._reset_at > 1.0:
+                    # The server has started a new window; trust its count.
+                    self._remaining = self.limit
+                self._reset_at = reset_at
+            if remaining is not None:
+                self._remaining = min(self._remaining, int(remaining))
+            if status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                self._remaining = 0
+                if reset is None:
+                    retry_after = _header_float(headers, "Retry-After")
+                    self._reset_at = now + (
+                        retry_after if retry_after is not None else self.window
+                    )
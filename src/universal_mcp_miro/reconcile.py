@@ -0,0 +1,529 @@
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from universal_mcp_miro.bulk import describe_error, run_concurrently
+
+# Fields of a desired item that are compared with, and sent to, the board.
+ITEM_FIELDS = ("data", "style", "geometry", "position")
+CONNECTOR_FIELDS = ("style", "captions", "shape")
+
+# Largest difference at which two numbers still count as equal.
+_TOLERANCE = 1e-6
+
+
+def _covers(live: Any, desired: Any) -> bool:
+    """Whether `live` holds every value set in `desired`; other fields are ignored."""
+    if isinstance(desired, Mapping):
+        return isinstance(live, Mapping) and all(
+            _covers(live.get(key), value) for key, value in desired.items()
+        )
+    if (
+        isinstance(desired, float | int)
+        and not isinstance(desired, bool)
+        and isinstance(live, float | int)
+    ):
+        return abs(live - desired) < _TOLERANCE
+    return live == desired
+
+
+def _fingerprint(
+    item_type: str | None, data: Mapping[str, Any] | None
+) -> tuple[str | None, str | None] | None:
+    data = data or {}
+    text = data.get("content") or data.get("title")
+    return (item_type, text) if text else None
+
+
+@dataclass
+class ReconcilePlan:
+    """
+    The calls needed to turn a live board into its desired state.
+
+    Item and connector references (`parent`, `start`, `end`) are desired keys
+    or live IDs; they are resolved while the plan is applied, once the items
+    they point to exist.
+    """
+
+    ids: dict[str, dict[str, str]] = field(
+        default_factory=lambda: {"items": {}, "connectors": {}, "tags": {}}
+    )
+    tag_creates: list[dict[str, Any]] = field(default_factory=list)
+    tag_updates: list[dict[str, Any]] = field(default_factory=list)
+    item_creates: list[dict[str, Any]] = field(default_factory=list)
+    item_updates: list[dict[str, Any]] = field(default_factory=list)
+    connector_creates: list[dict[str, Any]] = field(default_factory=list)
+    connector_updates: list[dict[str, Any]] = field(default_factory=list)
+    tag_attachments: list[tuple[str, str]] = field(default_factory=list)
+    tag_detachments: list[tuple[str, str]] = field(default_factory=list)
+    item_deletes: list[str] = field(default_factory=list)
+    connector_deletes: list[str] = field(default_factory=list)
+    tag_deletes: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    def summary(self) -> dict[str, int]:
+        return {
+            "create": len(self.tag_creates)
+            + len(self.item_creates)
+            + len(self.connector_creates),
+            "update": len(self.tag_updates)
+            + len(self.item_updates)
+            + len(self.connector_updates),
+            "delete": len(self.tag_deletes)
+            + len(self.item_deletes)
+            + len(self.connector_deletes),
+            "tag_changes": len(self.tag_attachments) + len(self.tag_detachments),
+            "unchanged": self.unchanged,
+        }
+
+
+def plan_reconciliation(
+    snapshot: Any,
+    items: Sequence[Mapping[str, Any]],
+    connectors: Sequence[Mapping[str, Any]] = (),
+    tags: Sequence[Mapping[str, Any]] | None = None,
+    *,
+    state: Mapping[str, Mapping[str, str]] | None = None,
+    prune: bool = False,
+) -> ReconcilePlan:
+    """
+    Diffs a desired board state against a BoardSnapshot of the live board.
+
+    Desired items are matched to live items by their `id`, by the ID recorded
+    for their `key` in `state` (the `ids` returned by a previous run), and
+    finally by type and text content, so a board generated before is adopted
+    instead of recreated. Only fields the desired spec sets are compared.
+
+    Args:
+        snapshot (BoardSnapshot): The live board.
+        items (Sequence[Mapping]): Desired items, each with a `key` (or `id`), `type`,
+            optional `data`, `style`, `geometry`, `position`, `parent` (key or ID)
+            and `tags` (titles).
+        connectors (Sequence[Mapping]): Desired connectors with `start` and `end`
+            (item keys or IDs) and optional `key`, `style`, `captions` and `shape`.
+        tags (Sequence[Mapping] | None): Desired tags with `title` and optional
+            `fillColor`; None leaves the board's tags unmanaged.
+        state (Mapping | None): `ids` mapping returned by a previous run.
+        prune (bool): Delete live items, connectors and tags that are not desired.
+
+    Returns:
+        ReconcilePlan: The calls to make.
+    """
+    state = state or {}
+    plan = ReconcilePlan()
+    _plan_tags(plan, snapshot, tags, prune=prune)
+    matches = _match_items(plan, snapshot, items, state.get("items") or {})
+    _plan_items(plan, snapshot, matches, prune=prune)
+    _plan_connectors(
+        plan, snapshot, connectors, state.get("connectors") or {}, prune=prune
+    )
+    return plan
+
+
+def _plan_tags(
+    plan: ReconcilePlan,
+    snapshot: Any,
+    tags: Sequence[Mapping[str, Any]] | None,
+    *,
+    prune: bool,
+) -> None:
+    ids = plan.ids["tags"]
+    live_tags = {tag.get("title"): tag for tag in snapshot.tags.values()}
+    # Existing tags resolve item tag titles even when tags are unmanaged.
+    ids.update((title, str(tag["id"])) for title, tag in live_tags.items() if title)
+    for tag in tags or []:
+        live = live_tags.get(tag["title"])
+        if live is None:
+            plan.tag_creates.append(dict(tag))
+        elif not _covers(live, tag):
+            plan.tag_updates.append({"id": str(live["id"]), **tag})
+        else:
+            plan.unchanged += 1
+    if tags is not None and prune:
+        desired = {tag["title"] for tag in tags}
+        pruned = [title for title in live_tags if title not in desired]
+        plan.tag_deletes = [str(live_tags[title]["id"]) for title in pruned]
+        for title in pruned:
+            ids.pop(title, None)
+
+
+def _match_items(
+    plan: ReconcilePlan,
+    snapshot: Any,
+    items: Sequence[Mapping[str, Any]],
+    known: Mapping[str, str],
+) -> list[tuple[str, Mapping[str, Any], str | None]]:
+    """Pairs each desired item with its key and the live item it maps to, if any."""
+    by_fingerprint: dict[tuple[str | None, str | None], list[str]] = {}
+    for live in snapshot:
+        fingerprint = _fingerprint(live.type, live.data)
+        if fingerprint is not None:
+            by_fingerprint.setdefault(fingerprint, []).append(live.id)
+    matched: set[str] = set()
+    matches = []
+    for spec in items:
+        if not spec.get("key") and not spec.get("id"):
+            raise ValueError("Every desired item needs a 'key' or an 'id'")
+        key = str(spec.get("key") or spec.get("id"))
+        live_id = spec.get("id") or known.get(key)
+        if live_id is None or live_id not in snapshot or live_id in matched:
+            fingerprint = _fingerprint(spec.get("type"), spec.get("data"))
+            live_id = next(
+                (
+                    candidate
+                    for candidate in by_fingerprint.get(fingerprint, ())
+                    if candidate not in matched
+                ),
+                None,
+            )
+        if live_id is not None:
+            matched.add(live_id)
+            plan.ids["items"][key] = live_id
+        matches.append((key, spec, live_id))
+    return matches
+
+
+def _plan_items(
+    plan: ReconcilePlan,
+    snapshot: Any,
+    matches: Sequence[tuple[str, Mapping[str, Any], str | None]],
+    *,
+    prune: bool,
+) -> None:
+    ids = plan.ids["items"]
+    tag_titles = {str(tag["id"]): tag.get("title") for tag in snapshot.tags.values()}
+    for key, spec, live_id in matches:
+        live = snapshot.get(live_id) if live_id is not None else None
+        if live is not None and spec.get("type") not in (None, live.type):
+            plan.item_deletes.append(live_id)
+            del ids[key]
+            live = None
+        if live is None:
+            plan.item_creates.append({**spec, "key": key})
+            continue
+        patch = {
+            name: spec[name]
+            for name in ITEM_FIELDS
+            if name in spec and not _covers(live.payload.get(name), spec[name])
+        }
+        if (
+            "parent" in spec
+            and ids.get(spec["parent"], spec["parent"]) != live.parent_id
+        ):
+            patch["parent"] = spec["parent"]
+        if patch:
+            plan.item_updates.append({"id": live.id, "type": live.type, **patch})
+        else:
+            plan.unchanged += 1
+        if "tags" in spec:
+            tag_ids = live.payload.get("tagIds") or []
+            current = {tag_titles.get(tag_id, tag_id) for tag_id in tag_ids}
+            plan.tag_attachments += [
+                (key, title) for title in spec["tags"] if title not in current
+            ]
+            plan.tag_detachments += [
+                (live.id, tag_id)
+                for tag_id in tag_ids
+                if tag_titles.get(tag_id, tag_id) not in spec["tags"]
+            ]
+    if prune:
+        matched = {live_id for _, _, live_id in matches if live_id is not None}
+        plan.item_deletes += [live.id for live in snapshot if live.id not in matched]
+
+
+def _connector_ends(connector: Mapping[str, Any]) -> tuple[str | None, str | None]:
+    return (
+        (connector.get("startItem") or {}).get("id"),
+        (connector.get("endItem") or {}).get("id"),
+    )
+
+
+def _plan_connectors(
+    plan: ReconcilePlan,
+    snapshot: Any,
+    connectors: Sequence[Mapping[str, Any]],
+    known: Mapping[str, str],
+    *,
+    prune: bool,
+) -> None:
+    item_ids = plan.ids["items"]
+    deleted = set(plan.item_deletes)
+    live_by_ends: dict[tuple[str | None, str | None], list[str]] = {}
+    for connector in snapshot.connectors.values():
+        ends = _connector_ends(connector)
+        live_by_ends.setdefault(ends, []).append(str(connector["id"]))
+    matched: set[str] = set()
+    for spec in connectors:
+        key = str(spec.get("key") or f"{spec['start']}->{spec['end']}")
+        ends = (
+            item_ids.get(spec["start"], spec["start"]),
+            item_ids.get(spec["end"], spec["end"]),
+        )
+        live_id = spec.get("id") or known.get(key)
+        if live_id not in snapshot.connectors or live_id in matched:
+            live_id = next(
+                (
+                    candidate
+                    for candidate in live_by_ends.get(ends, ())
+                    if candidate not in matched
+                ),
+                None,
+            )
+        live = snapshot.connectors.get(live_id) if live_id is not None else None
+        if live is None or not deleted.isdisjoint(ends):
+            plan.connector_creates.append({**spec, "key": key})
+            continue
+        matched.add(live_id)
+        plan.ids["connectors"][key] = live_id
+        patch = {
+            name: spec[name]
+            for name in CONNECTOR_FIELDS
+            if name in spec and not _covers(live.get(name), spec[name])
+        }
+        if patch:
+            plan.connector_updates.append({"id": live_id, **patch})
+        else:
+            plan.unchanged += 1
+    if prune:
+        # Connectors of deleted items disappear with them.
+        plan.connector_deletes += [
+            connector_id
+            for connector_id, connector in snapshot.connectors.items()
+            if connector_id not in matched
+            and deleted.isdisjoint(_connector_ends(connector))
+        ]
+
+
+def apply_plan(
+    app: Any, board_id: str, plan: ReconcilePlan, max_workers: int = 8
+) -> dict[str, Any]:
+    """
+    Executes a ReconcilePlan, running independent calls of each phase concurrently.
+
+    Phases run in dependency order: tags, items (parents before children, in
+    bulk requests), item updates, connectors, tag attachments and finally
+    deletes.
+
+    Args:
+        app (MiroApp): Client used for the calls.
+        board_id (str): Board to reconcile.
+        plan (ReconcilePlan): Plan from `plan_reconciliation`.
+        max_workers (int): Maximum number of calls in flight at the same time.
+
+    Returns:
+        dict: `ids` (key to live ID for items and connectors, title to ID for tags,
+        to pass back as `state` next time), the planned `summary` and `failures`.
+    """
+    run = _PlanRun(app, board_id, plan, max_workers)
+    run.apply_tags()
+    tag_attachments = [*plan.tag_attachments, *run.create_items()]
+    run.update_items()
+    run.apply_connectors()
+    run.apply_tag_changes(tag_attachments)
+    run.delete()
+    return {"ids": run.ids, "summary": plan.summary(), "failures": run.failures}
+
+
+class _PlanRun:
+    """The IDs known and the failures collected while one plan is applied."""
+
+    def __init__(
+        self, app: Any, board_id: str, plan: ReconcilePlan, max_workers: int
+    ) -> None:
+        self.app = app
+        self.board_id = board_id
+        self.plan = plan
+        self.max_workers = max_workers
+        self.ids = {kind: dict(known) for kind, known in plan.ids.items()}
+        self.failures: list[dict[str, Any]] = []
+
+    def fail(self, operation: str, target: str, error: str) -> None:
+        self.failures.append({"operation": operation, "target": target, "error": error})
+
+    def item_id(self, reference: str) -> str:
+        """Resolves a desired item key to its live ID; IDs resolve to themselves."""
+        return self.ids["items"].get(reference, reference)
+
+    def run(
+        self,
+        operation: str,
+        fn: Callable[[Any], Any],
+        jobs: Sequence[Any],
+        names: Sequence[str],
+    ) -> list[Any]:
+        outcomes = run_concurrently(fn, jobs, max_workers=self.max_workers)
+        for name, outcome in zip(names, outcomes):
+            if outcome.error is not None:
+                self.fail(operation, name, describe_error(outcome.error))
+        return [outcome.result for outcome in outcomes]
+
+    def _record_bulk_failures(self, operation: str, result: dict[str, Any]) -> None:
+        for entry in result["results"]:
+            if not entry["ok"]:
+                self.fail(operation, entry["id"], entry["error"])
+
+    def apply_tags(self) -> None:
+        app, board_id, plan = self.app, self.board_id, self.plan
+        created = self.run(
+            "create_tag",
+            lambda tag: app.create_tag(
+                board_id, fillColor=tag.get("fillColor"), title=tag["title"]
+            ),
+            plan.tag_creates,
+            [tag["title"] for tag in plan.tag_creates],
+        )
+        for tag, result in zip(plan.tag_creates, created):
+            if result:
+                self.ids["tags"][tag["title"]] = str(result["id"])
+        self.run(
+            "update_tag",
+            lambda tag: app.update_tag(
+                board_id,
+                tag["id"],
+                fillColor=tag.get("fillColor"),
+                title=tag.get("title"),
+            ),
+            plan.tag_updates,
+            [tag["id"] for tag in plan.tag_updates],
+        )
+
+    def create_items(self) -> list[tuple[str, str]]:
+        """Creates the planned items, parents first; returns their tags to attach."""
+        attachments = []
+        pending = list(self.plan.item_creates)
+        while pending:
+            waiting = {spec["key"] for spec in pending}
+            ready = [spec for spec in pending if spec.get("parent") not in waiting]
+            if not ready:
+                for spec in pending:
+                    self.fail(
+                        "create_item", spec["key"], "Parent references form a cycle"
+                    )
+                break
+            result = self.app.bulk_create_items(
+                self.board_id,
+                [self._item_payload(spec) for spec in ready],
+                max_workers=self.max_workers,
+            )
+            failed = set()
+            for spec, item_id in zip(ready, result["ids"]):
+                if item_id is None:
+                    failed.add(spec["key"])
+                    self.fail("create_item", spec["key"], "Bulk create failed")
+                    continue
+                self.ids["items"][spec["key"]] = str(item_id)
+                attachments += [
+                    (spec["key"], title) for title in spec.get("tags") or []
+                ]
+            done = {spec["key"] for spec in ready}
+            pending = self._skip_descendants(
+                [spec for spec in pending if spec["key"] not in done], failed
+            )
+        return attachments
+
+    def _item_payload(self, spec: Mapping[str, Any]) -> dict[str, Any]:
+        payload = {name: spec[name] for name in ("type", *ITEM_FIELDS) if name in spec}
+        if spec.get("parent"):
+            payload["parent"] = {"id": self.item_id(spec["parent"])}
+        return payload
+
+    def _skip_descendants(
+        self, pending: list[dict[str, Any]], failed: set[str]
+    ) -> list[dict[str, Any]]:
+        # Descendants of items that could not be created are skipped.
+        blocked = [spec for spec in pending if spec.get("parent") in failed]
+        while blocked:
+            for spec in blocked:
+                failed.add(spec["key"])
+                self.fail("create_item", spec["key"], "Parent could not be created")
+            pending = [spec for spec in pending if spec["key"] not in failed]
+            blocked = [spec for spec in pending if spec.get("parent") in failed]
+        return pending
+
+    def update_items(self) -> None:
+        updates = []
+        for planned in self.plan.item_updates:
+            patch = dict(planned)
+            if "parent" in patch:
+                patch["parent"] = {"id": self.item_id(patch["parent"])}
+            updates.append(patch)
+        if updates:
+            result = self.app.bulk_update_items(
+                self.board_id, updates, max_workers=self.max_workers
+            )
+            self._record_bulk_failures("update_item", result)
+
+    def apply_connectors(self) -> None:
+        app, board_id, plan = self.app, self.board_id, self.plan
+
+        def create(spec: Mapping[str, Any]) -> Any:
+            return app.create_connector(
+                board_id,
+                startItem={"id": self.item_id(spec["start"])},
+                endItem={"id": self.item_id(spec["end"])},
+                **{name: spec[name] for name in CONNECTOR_FIELDS if name in spec},
+            )
+
+        created = self.run(
+            "create_connector",
+            create,
+            plan.connector_creates,
+            [spec["key"] for spec in plan.connector_creates],
+        )
+        for spec, result in zip(plan.connector_creates, created):
+            if result:
+                self.ids["connectors"][spec["key"]] = str(result["id"])
+        self.run(
+            "update_connector",
+            lambda patch: app.update_connector(
+                board_id,
+                patch["id"],
+                **{name: patch[name] for name in CONNECTOR_FIELDS if name in patch},
+            ),
+            plan.connector_updates,
+            [patch["id"] for patch in plan.connector_updates],
+        )
+
+    def apply_tag_changes(self, attachments: Sequence[tuple[str, str]]) -> None:
+        app, board_id, ids = self.app, self.board_id, self.ids
+        jobs = []
+        for key, title in attachments:
+            if key not in ids["items"]:
+                continue
+            if title not in ids["tags"]:
+                self.fail("attach_tag", ids["items"][key], f"Unknown tag '{title}'")
+                continue
+            jobs.append((ids["items"][key], ids["tags"][title]))
+        self.run(
+            "attach_tag",
+            lambda job: app.attach_tag_to_item(board_id, job[0], tag_id=job[1]),
+            jobs,
+            [item_id for item_id, _ in jobs],
+        )
+        detachments = self.plan.tag_detachments
+        self.run(
+            "remove_tag",
+            lambda job: app.remove_tag_from_item(board_id, job[0], tag_id=job[1]),
+            detachments,
+            [item_id for item_id, _ in detachments],
+        )
+
+    def delete(self) -> None:
+        app, board_id, plan = self.app, self.board_id, self.plan
+        self.run(
+            "delete_connector",
+            lambda connector_id: app.delete_connector(board_id, connector_id),
+            plan.connector_deletes,
+            plan.connector_deletes,
+        )
+        if plan.item_deletes:
+            result = app.bulk_delete_items(
+                board_id, plan.item_deletes, max_workers=self.max_workers
+            )
+            self._record_bulk_failures("delete_item", result)
+        self.run(
+            "delete_tag",
+            lambda tag_id: app.delete_tag(board_id, tag_id),
+            plan.tag_deletes,
+            plan.tag_deletes,
+        )
@@ -0,0 +1,114 @@
+import random
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    """
+    Reads the `Retry-After` header as a number of seconds to wait.
+
+    Args:
+        headers (Mapping[str, str]): Response headers.
+
+    Returns:
+        float | None: Seconds to wait, or None when the header is absent or malformed.
+    """
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Decides whether and when a failed Miro API call is sent again.
+
+    Idempotent calls are retried on transient statuses and transport errors. A
+    429 is retried for every method, because Miro rejects throttled requests
+    before processing them. Other 4xx responses are never retried. Waits honor
+    `Retry-After` and otherwise use decorrelated jitter between `base_delay` and
+    `max_delay`.
+
+    Attributes:
+        max_attempts (int): Total number of attempts per call; 1 disables retries.
+        base_delay (float): Smallest backoff in seconds.
+        max_delay (float): Largest jittered backoff in seconds.
+        max_retry_after (float): Longest `Retry-After` the policy is willing to wait;
+            longer waits surface the error instead.
+        retry_statuses (frozenset[int]): Status codes considered transient.
+        idempotent_methods (frozenset[str]): Methods safe to resend after an error.
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    max_retry_after: float = 120.0
+    retry_statuses: frozenset[int] = RETRYABLE_STATUSES
+    idempotent_methods: frozenset[str] = IDEMPOTENT_METHODS
+
+    def backoff(self, previous_delay: float) -> float:
+        """Returns the next decorrelated-jitter delay after `previous_delay`."""
+        upper = max(previous_delay * 3, self.base_delay)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+    def retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        previous_delay: float,
+        *,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+        idempotent: bool | None = None,
+    ) -> float | None:
+        """
+        Returns how long to wait before resending a call, or None to stop.
+
+        Args:
+            method (str): HTTP method of the call.
+            attempt (int): Number of attempts made so far, starting at 1.
+            previous_delay (float): Delay used before the previous retry, 0 on the
+                first.
+            response (httpx.Response | None): Response of the last attempt, if any.
+            error (Exception | None): Transport error raised by the last attempt, if
+                any.
+            idempotent (bool | None): Whether the call is safe to resend; None decides
+                from the method.
+
+        Returns:
+            float | None: Seconds to wait, or None when the call must not be retried.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if idempotent is None:
+            idempotent = method.upper() in self.idempotent_methods
+        if response is not None:
+            status = response.status_code
+            if status not in self.retry_statuses or (
+                status != httpx.codes.TOO_MANY_REQUESTS and not idempotent
+            ):
+                return None
+            retry_after = parse_retry_after(response.headers)
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+        elif not (idempotent and isinstance(error, httpx.TransportError)):
+            return None
+        return self.backoff(previous_delay)
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
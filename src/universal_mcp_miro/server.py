@@ -1,19 +1,109 @@
+import asyncio
+import inspect
+import json
+import os
+from collections.abc import Iterable
+from typing import Any
 
-from universal_mcp.servers import SingleMCPServer
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.types import TextContent, Tool
+from universal_mcp.config import ServerConfig
 from universal_mcp.integrations import ApiKeyIntegration
+from universal_mcp.servers import BaseServer
 from universal_mcp.stores import EnvironmentStore
 
 from universal_mcp_miro.app import MiroApp
+from universal_mcp_miro.bulk import describe_error
+from universal_mcp_miro.manifest import load_manifest, select_tools
+
+
+class ManifestMCPServer(BaseServer):
+    """
+    Single-app MCP server that lists tools from the prebuilt manifest (tools.json).
+
+    Listing reads the compact manifest instead of building every tool from
+    its signature and docstring, and a call goes straight to the app method,
+    so startup and tools/list stay cheap and the listing sent to clients
+    carries short descriptions only.
+
+    `tags` restricts the server to the tool groups carrying one of the given
+    tags (e.g. `["Boards", "Items"]`); the other tools are neither listed nor
+    callable, and the feature modules behind them are never imported.
+    """
+
+    def __init__(
+        self,
+        app_instance: MiroApp,
+        tags: Iterable[str] | None = None,
+        config: ServerConfig | None = None,
+        **kwargs: Any,
+    ) -> None:
+        config = config or ServerConfig(
+            type="local",
+            name=f"{app_instance.name.title()} MCP Server for Local Development",
+            description=(
+                f"Minimal MCP server for the local {app_instance.name} application."
+            ),
+        )
+        # Unlike SingleMCPServer, no Tool is built from the app's methods here.
+        super().__init__(config, **kwargs)
+        self.app_instance = app_instance
+        self.manifest = select_tools(load_manifest(), tags)
+        # batch must not reach tools the allowlist leaves out.
+        app_instance.batch_operations = frozenset(self.manifest)
+        self._mcp_tools = [
+            Tool(
+                name=entry["name"],
+                description=entry["description"],
+                inputSchema=entry["inputSchema"],
+            )
+            for entry in self.manifest.values()
+        ]
+
+    async def list_tools(self) -> list[Tool]:
+        return self._mcp_tools
+
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any]
+    ) -> list[TextContent]:
+        entry = self.manifest.get(name) or self.manifest.get(
+            name.removeprefix(f"{self.app_instance.name}__")
+        )
+        if entry is None:
+            raise ToolError(f"Unknown tool: {name}")
+        arguments = dict(arguments or {})
+        properties = entry["inputSchema"]["properties"]
+        for key, value in arguments.items():
+            # Clients sometimes send arrays and objects JSON-encoded.
+            expected = properties.get(key, {}).get("type")
+            if isinstance(value, str) and expected in ("array", "object"):
+                try:
+                    arguments[key] = json.loads(value)
+                except ValueError:
+                    pass
+        function = getattr(self.app_instance, entry["name"])
+        try:
+            if inspect.iscoroutinefunction(function):
+                result = await function(**arguments)
+            else:
+                result = await asyncio.to_thread(function, **arguments)
+        except Exception as error:
+            raise ToolError(
+                f"Tool {entry['name']} failed: {describe_error(error)}"
+            ) from error
+        text = result if isinstance(result, str) else json.dumps(result, default=str)
+        return [TextContent(type="text", text=text)]
+
 
 env_store = EnvironmentStore()
 integration_instance = ApiKeyIntegration(name="MIRO_API_KEY", store=env_store)
 app_instance = MiroApp(integration=integration_instance)
 
-mcp = SingleMCPServer(
+mcp = ManifestMCPServer(
     app_instance=app_instance,
+    # Comma-separated tool tags to serve, e.g. "Boards,Items"; unset serves every tool.
+    tags=os.environ.get("MIRO_TOOL_TAGS", "").split(","),
 )
 
 if __name__ == "__main__":
     mcp.run()
-
-
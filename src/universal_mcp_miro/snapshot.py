@@ -0,0 +1,518 @@
+import math
+import threading
+import time
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from urllib.parse import urlsplit
+
+from universal_mcp_miro.cache import locate_resource
+
+_NAN = math.nan
+
+# Board sub-resources whose write responses are item payloads.
+_ITEM_KINDS = frozenset(
+    {
+        "app_cards",
+        "cards",
+        "connectors",
+        "documents",
+        "embeds",
+        "frames",
+        "images",
+        "items",
+        "mindmap_nodes",
+        "shapes",
+        "sticky_notes",
+        "texts",
+    }
+)
+
+
+def _number(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _NAN
+
+
+def _matches(
+    fields: Mapping[str, Any] | None, expected: Mapping[str, Any] | None
+) -> bool:
+    if not expected:
+        return True
+    if not fields:
+        return False
+    return all(fields.get(key) == value for key, value in expected.items())
+
+
+class SnapshotItem:
+    """
+    Lightweight view of one item stored in a BoardSnapshot.
+
+    Views read straight from the snapshot's columns and are only valid until the
+    snapshot is next modified.
+    """
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "ItemStore", row: int) -> None:
+        self._store = store
+        self._row = row
+
+    @property
+    def id(self) -> str:
+        return self._store.ids[self._row]
+
+    @property
+    def type(self) -> str | None:
+        return self._store.types[self._row]
+
+    @property
+    def parent_id(self) -> str | None:
+        return self._store.parents[self._row]
+
+    @property
+    def x(self) -> float:
+        return self._store.xs[self._row]
+
+    @property
+    def y(self) -> float:
+        return self._store.ys[self._row]
+
+    @property
+    def width(self) -> float:
+        return self._store.widths[self._row]
+
+    @property
+    def height(self) -> float:
+        return self._store.heights[self._row]
+
+    @property
+    def relative_to_parent(self) -> bool:
+        return bool(self._store.relative[self._row])
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        """The item as returned by the API."""
+        return self._store.payloads[self._row]
+
+    @property
+    def data(self) -> dict[str, Any]:
+        return self.payload.get("data") or {}
+
+    @property
+    def style(self) -> dict[str, Any]:
+        return self.payload.get("style") or {}
+
+    def __repr__(self) -> str:
+        return f"SnapshotItem(id={self.id!r}, type={self.type!r})"
+
+
+class ItemStore:
+    """
+    Column-oriented store of board items indexed by id, type and parent.
+
+    Geometry lives in `array('d')` columns (NaN when unknown) so scans and
+    spatial queries touch contiguous memory. Removed rows are tombstoned and
+    reclaimed once they make up half of the store.
+    """
+
+    __slots__ = (
+        "ids",
+        "types",
+        "parents",
+        "xs",
+        "ys",
+        "widths",
+        "heights",
+        "relative",
+        "payloads",
+        "_by_id",
+        "_by_type",
+        "_by_parent",
+        "_dead",
+    )
+
+    def __init__(self) -> None:
+        self.ids: list[str | None] = []
+        self.types: list[str | None] = []
+        self.parents: list[str | None] = []
+        self.xs = array("d")
+        self.ys = array("d")
+        self.widths = array("d")
+        self.heights = array("d")
+        self.relative = bytearray()
+        self.payloads: list[dict[str, Any] | None] = []
+        self._by_id: dict[str, int] = {}
+        self._by_type: dict[str | None, set[int]] = {}
+        self._by_parent: dict[str | None, set[int]] = {}
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._by_id
+
+    def row(self, item_id: str) -> int | None:
+        return self._by_id.get(item_id)
+
+    def rows(self) -> Iterator[int]:
+        return iter(self._by_id.values())
+
+    def rows_of_type(self, item_type: str) -> set[int]:
+        return self._by_type.get(item_type, set())
+
+    def rows_of_parent(self, parent_id: str | None) -> set[int]:
+        return self._by_parent.get(parent_id, set())
+
+    def upsert(self, payload: Mapping[str, Any]) -> int:
+        """Inserts or replaces an item from its API payload and returns its row."""
+        item_id = str(payload["id"])
+        item_type = payload.get("type")
+        parent_id = (payload.get("parent") or {}).get("id")
+        parent_id = str(parent_id) if parent_id is not None else None
+        position = payload.get("position") or {}
+        geometry = payload.get("geometry") or {}
+        relative = 1 if position.get("relativeTo") == "parent_top_left" else 0
+        row = self._by_id.get(item_id)
+        if row is None:
+            row = len(self.ids)
+            self.ids.append(item_id)
+            self.types.append(item_type)
+            self.parents.append(parent_id)
+            self.xs.append(_number(position.get("x")))
+            self.ys.append(_number(position.get("y")))
+            self.widths.append(_number(geometry.get("width")))
+            self.heights.append(_number(geometry.get("height")))
+            self.relative.append(relative)
+            self.payloads.append(dict(payload))
+            self._by_id[item_id] = row
+        else:
+            self._unindex(row)
+            self.types[row] = item_type
+            self.parents[row] = parent_id
+            self.xs[row] = _number(position.get("x"))
+            self.ys[row] = _number(position.get("y"))
+            self.widths[row] = _number(geometry.get("width"))
+            self.heights[row] = _number(geometry.get("height"))
+            self.relative[row] = relative
+            self.payloads[row] = dict(payload)
+        self._by_type.setdefault(item_type, set()).add(row)
+        self._by_parent.setdefault(parent_id, set()).add(row)
+        return row
+
+    def remove(self, item_id: str) -> bool:
+        """Removes an item; returns False if it was not stored."""
+        row = self._by_id.pop(item_id, None)
+        if row is None:
+            return False
+        self._unindex(row)
+        self.ids[row] = None
+        self.payloads[row] = None
+        self._dead += 1
+        if self._dead * 2 > len(self.ids):
+            self._compact()
+        return True
+
+    def _unindex(self, row: int) -> None:
+        self._by_type.get(self.types[row], set()).discard(row)
+        self._by_parent.get(self.parents[row], set()).discard(row)
+
+    def _compact(self) -> None:
+        payloads = [payload for payload in self.payloads if payload is not None]
+        self.__init__()
+        for payload in payloads:
+            self.upsert(payload)
+
+
+class BoardSnapshot:
+    """
+    Local copy of a board's items, connectors, tags, groups and members.
+
+    Items are kept in a compact ItemStore indexed by id, type and parent, so
+    questions like "what is inside frame X" or "all red sticky notes" are
+    answered in memory instead of with API calls. Build one with `load`, and
+    keep it current with `upsert_item` and `remove_item`. Writes hold `lock`,
+    so request threads can mirror their changes concurrently.
+    """
+
+    def __init__(self, board_id: str) -> None:
+        self.board_id = board_id
+        self.items = ItemStore()
+        self.connectors: dict[str, dict[str, Any]] = {}
+        self.tags: dict[str, dict[str, Any]] = {}
+        self.groups: dict[str, dict[str, Any]] = {}
+        self.members: dict[str, dict[str, Any]] = {}
+        self.loaded_at: float | None = None
+        self.lock = threading.RLock()
+
+    @classmethod
+    def load(cls, app: Any, board_id: str, max_workers: int = 5) -> "BoardSnapshot":
+        """
+        Pulls every item, connector, tag, group and member of a board.
+
+        The five collections are fetched concurrently through the app's endpoint
+        calls, so cached list pages are served from its response cache; use
+        MiroApp.board_snapshot to load the board's current state.
+
+        Args:
+            app (MiroApp): Client used to fetch the board.
+            board_id (str): ID of the board to snapshot.
+            max_workers (int): Maximum number of collections fetched at the same time.
+
+        Returns:
+            BoardSnapshot: The populated snapshot.
+        """
+        sources: dict[str, Callable[[], Iterable[dict[str, Any]]]] = {
+            "items": lambda: list(app.iter_items_on_board(board_id)),
+            "connectors": lambda: list(app.iter_connectors(board_id)),
+            "tags": lambda: app.fetch_all_tags_from_board(board_id),
+            "groups": lambda: list(app.iter_groups_on_board(board_id)),
+            "members": lambda: app.fetch_all_board_members(board_id),
+        }
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="miro-snapshot"
+        ) as executor:
+            futures = {name: executor.submit(fetch) for name, fetch in sources.items()}
+            results = {name: future.result() for name, future in futures.items()}
+        snapshot = cls(board_id)
+        for item in results["items"]:
+            snapshot.items.upsert(item)
+        snapshot.connectors = {
+            str(connector["id"]): connector for connector in results["connectors"]
+        }
+        snapshot.tags = {str(tag["id"]): tag for tag in results["tags"]}
+        snapshot.groups = {str(group["id"]): group for group in results["groups"]}
+        snapshot.members = {str(member["id"]): member for member in results["members"]}
+        snapshot.loaded_at = time.time()
+        return snapshot
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self.items
+
+    def __iter__(self) -> Iterator[SnapshotItem]:
+        return (SnapshotItem(self.items, row) for row in list(self.items.rows()))
+
+    def get(self, item_id: str) -> SnapshotItem | None:
+        """Returns the item with the given ID, or None."""
+        row = self.items.row(item_id)
+        return SnapshotItem(self.items, row) if row is not None else None
+
+    def of_type(self, item_type: str) -> list[SnapshotItem]:
+        """Returns all items of one type, e.g. 'sticky_note' or 'frame'."""
+        return [
+            SnapshotItem(self.items, row)
+            for row in sorted(self.items.rows_of_type(item_type))
+        ]
+
+    def children(self, parent_id: str | None) -> list[SnapshotItem]:
+        """Returns the children of `parent_id`; None returns the top-level items."""
+        return [
+            SnapshotItem(self.items, row)
+            for row in sorted(self.items.rows_of_parent(parent_id))
+        ]
+
+    def find(
+        self,
+        type: str | None = None,
+        parent_id: str | None = None,
+        data: Mapping[str, Any] | None = None,
+        style: Mapping[str, Any] | None = None,
+        predicate: Callable[[SnapshotItem], bool] | None = None,
+    ) -> list[SnapshotItem]:
+        """
+        Returns the items matching every given filter.
+
+        Args:
+            type (str | None): Item type to match.
+            parent_id (str | None): Parent (e.g. frame) ID to match.
+            data (Mapping | None): Fields that must be equal in the item's `data`.
+            style (Mapping | None): Fields that must be equal in the item's `style`,
+                e.g. `{"fillColor": "red"}`.
+            predicate (Callable | None): Extra test applied to each candidate.
+
+        Returns:
+            list[SnapshotItem]: Matching items.
+        """
+        if type is not None and parent_id is not None:
+            rows = self.items.rows_of_type(type) & self.items.rows_of_parent(parent_id)
+        elif type is not None:
+            rows = self.items.rows_of_type(type)
+        elif parent_id is not None:
+            rows = self.items.rows_of_parent(parent_id)
+        else:
+            rows = set(self.items.rows())
+        found = []
+        for row in sorted(rows):
+            payload = self.items.payloads[row]
+            if not _matches(payload.get("data"), data) or not _matches(
+                payload.get("style"), style
+            ):
+                continue
+            item = SnapshotItem(self.items, row)
+            if predicate is None or predicate(item):
+                found.append(item)
+        return found
+
+    def bounds(self, item_id: str) -> tuple[float, float, float, float] | None:
+        """
+        Returns the absolute `(left, top, right, bottom)` box of an item on the canvas.
+
+        Positions of items inside a frame are relative to the frame's top-left
+        corner; they are resolved through the parent chain.
+
+        Returns:
+            tuple | None: The box, or None if the item or its geometry is unknown.
+        """
+        store = self.items
+        row = store.row(item_id)
+        if row is None:
+            return None
+        x, y, width, height = (
+            store.xs[row],
+            store.ys[row],
+            store.widths[row],
+            store.heights[row],
+        )
+        if math.isnan(x) or math.isnan(y):
+            return None
+        width = 0.0 if math.isnan(width) else width
+        height = 0.0 if math.isnan(height) else height
+        if store.relative[row] and store.parents[row] is not None:
+            parent = self.bounds(store.parents[row])
+            if parent is None:
+                return None
+            x += parent[0]
+            y += parent[1]
+        return (x - width / 2, y - height / 2, x + width / 2, y + height / 2)
+
+    def upsert_item(self, payload: Mapping[str, Any]) -> None:
+        """Adds or replaces an item from its API payload."""
+        with self.lock:
+            if payload.get("type") == "connector":
+                self.connectors[str(payload["id"])] = dict(payload)
+            else:
+                self.items.upsert(payload)
+
+    def remove_item(self, item_id: str) -> None:
+        """Removes an item or connector, and the connectors attached to an item."""
+        with self.lock:
+            if self.connectors.pop(item_id, None) is not None:
+                return
+            if self.items.remove(item_id):
+                attached = [
+                    connector_id
+                    for connector_id, connector in self.connectors.items()
+                    if (connector.get("startItem") or {}).get("id") == item_id
+                    or (connector.get("endItem") or {}).get("id") == item_id
+                ]
+                for connector_id in attached:
+                    del self.connectors[connector_id]
+
+    def apply_event(self, event_type: str, item: Mapping[str, Any]) -> None:
+        """
+        Applies a webhook item event to the snapshot.
+
+        Update events are merged into the stored payload, so fields the event
+        leaves out keep their last known value.
+
+        Args:
+            event_type (str): 'create', 'update' or 'delete'.
+            item (Mapping): The event's item; delete events only need its `id`.
+        """
+        item_id = str(item["id"])
+        if event_type == "delete":
+            self.remove_item(item_id)
+            return
+        if event_type not in ("create", "update"):
+            return
+        with self.lock:
+            known = self.connectors.get(item_id)
+            if known is None:
+                row = self.items.row(item_id)
+                known = self.items.payloads[row] if row is not None else None
+            self.upsert_item({**known, **item} if known else item)
+
+    def apply_write(
+        self,
+        method: str,
+        kind: str | None,
+        item_id: str | None,
+        params: Mapping[str, Any] | None,
+        body: Any,
+    ) -> None:
+        """
+        Mirrors a successful write made through the API onto the snapshot.
+
+        Args:
+            method (str): HTTP method of the write.
+            kind (str | None): Board sub-resource written, e.g. 'sticky_notes'.
+            item_id (str | None): ID of the addressed item, if the write targeted one.
+            params (Mapping | None): Query parameters of the write.
+            body (Any): Decoded response body, or None when there was none.
+        """
+        method = method.upper()
+        with self.lock:
+            if method == "DELETE":
+                if item_id is None:
+                    return
+                if kind == "tags":
+                    self.tags.pop(item_id, None)
+                elif kind in _ITEM_KINDS and not (params or {}).get("tag_id"):
+                    self.remove_item(item_id)
+                return
+            if not isinstance(body, dict):
+                return
+            if kind == "tags" and body.get("id"):
+                self.tags[str(body["id"])] = body
+            elif kind in _ITEM_KINDS:
+                created = (
+                    body.get("data")
+                    if item_id is None and isinstance(body.get("data"), list)
+                    else [body]
+                )
+                for payload in created:
+                    if (
+                        isinstance(payload, dict)
+                        and payload.get("id")
+                        and payload.get("type")
+                    ):
+                        self.upsert_item(payload)
+
+
+def apply_write_to_snapshots(
+    snapshots: Mapping[str, BoardSnapshot],
+    method: str,
+    url: str,
+    params: Mapping[str, Any] | None,
+    response: Any,
+) -> None:
+    """
+    Mirrors a successful write onto the held snapshot of the board it touched.
+
+    Args:
+        snapshots (Mapping[str, BoardSnapshot]): Snapshots by board ID.
+        method (str): HTTP method of the write.
+        url (str): Absolute or path-only URL of the write.
+        params (Mapping | None): Query parameters of the write.
+        response (httpx.Response): Successful response of the write.
+    """
+    if not snapshots:
+        return
+    scope, kind, item_id = locate_resource(urlsplit(url).path.rstrip("/"))
+    if scope is None or not scope.startswith("board:"):
+        return
+    snapshot = snapshots.get(scope.removeprefix("board:"))
+    if snapshot is None:
+        return
+    try:
+        body = response.json() if response.content else None
+    except ValueError:
+        body = None
+    snapshot.apply_write(method, kind, item_id, params, body)
@@ -0,0 +1,212 @@
+import heapq
+import math
+from collections.abc import Hashable, Iterator
+from typing import Any
+
+Box = tuple[float, float, float, float]
+
+# Boxes covering more grid cells than this are kept in a separate list and
+# tested directly, so a few huge frames do not flood the grid.
+MAX_CELLS_PER_BOX = 64
+
+
+def box_distance(box: Box, x: float, y: float) -> float:
+    """Euclidean distance from a point to a box; 0 when the point is inside."""
+    dx = max(box[0] - x, 0.0, x - box[2])
+    dy = max(box[1] - y, 0.0, y - box[3])
+    return math.hypot(dx, dy)
+
+
+def boxes_intersect(a: Box, b: Box) -> bool:
+    """Whether two `(left, top, right, bottom)` boxes overlap or touch."""
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+class SpatialIndex:
+    """
+    Uniform-grid spatial index over `(left, top, right, bottom)` boxes.
+
+    Each box is registered in every grid cell it covers, so box and point
+    queries only look at the handful of cells around the query instead of every
+    item. Pick a `cell_size` close to the typical item size; `from_snapshot`
+    does this automatically.
+    """
+
+    def __init__(self, cell_size: float = 500.0) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+        self._boxes: dict[Hashable, Box] = {}
+        self._cells: dict[tuple[int, int], set[Hashable]] = {}
+        self._oversized: set[Hashable] = set()
+        self._extent: tuple[int, int, int, int] | None = None
+
+    @classmethod
+    def from_snapshot(
+        cls, snapshot: Any, cell_size: float | None = None
+    ) -> "SpatialIndex":
+        """
+        Indexes the absolute bounds of every item in a BoardSnapshot.
+
+        Args:
+            snapshot (BoardSnapshot): Snapshot whose items are indexed by ID.
+            cell_size (float | None): Grid cell size; defaults to twice the median item
+                size.
+
+        Returns:
+            SpatialIndex: The populated index.
+        """
+        boxes = {}
+        for item in snapshot:
+            box = snapshot.bounds(item.id)
+            if box is not None:
+                boxes[item.id] = box
+        if cell_size is None:
+            sizes = sorted(
+                max(box[2] - box[0], box[3] - box[1]) for box in boxes.values()
+            )
+            median = sizes[len(sizes) // 2] if sizes else 0.0
+            cell_size = max(median * 2, 100.0)
+        index = cls(cell_size)
+        for key, box in boxes.items():
+            index.insert(key, box)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._boxes
+
+    def box(self, key: Hashable) -> Box | None:
+        return self._boxes.get(key)
+
+    def _cell_range(self, box: Box) -> tuple[int, int, int, int]:
+        size = self.cell_size
+        return (
+            math.floor(box[0] / size),
+            math.floor(box[1] / size),
+            math.floor(box[2] / size),
+            math.floor(box[3] / size),
+        )
+
+    def _cells_of(self, box: Box) -> Iterator[tuple[int, int]]:
+        x0, y0, x1, y1 = self._cell_range(box)
+        for i in range(x0, x1 + 1):
+            for j in range(y0, y1 + 1):
+                yield (i, j)
+
+    def insert(self, key: Hashable, box: Box) -> None:
+        """Adds a box, replacing any box already stored under `key`."""
+        if key in self._boxes:
+            self.remove(key)
+        box = (float(box[0]), float(box[1]), float(box[2]), float(box[3]))
+        self._boxes[key] = box
+        x0, y0, x1, y1 = self._cell_range(box)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > MAX_CELLS_PER_BOX:
+            self._oversized.add(key)
+            return
+        for cell in self._cells_of(box):
+            self._cells.setdefault(cell, set()).add(key)
+        if self._extent is None:
+            self._extent = (x0, y0, x1, y1)
+        else:
+            ex0, ey0, ex1, ey1 = self._extent
+            self._extent = (min(ex0, x0), min(ey0, y0), max(ex1, x1), max(ey1, y1))
+
+    def remove(self, key: Hashable) -> bool:
+        """Removes the box stored under `key`; returns False if there was none."""
+        box = self._boxes.pop(key, None)
+        if box is None:
+            return False
+        if key in self._oversized:
+            self._oversized.discard(key)
+            return True
+        for cell in self._cells_of(box):
+            keys = self._cells.get(cell)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._cells[cell]
+        return True
+
+    def query_box(self, box: Box) -> set[Hashable]:
+        """Returns the keys of all boxes intersecting `box`."""
+        found = {
+            key for key in self._oversized if boxes_intersect(self._boxes[key], box)
+        }
+        x0, y0, x1, y1 = self._cell_range(box)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self._cells):
+            candidates = (key for keys in self._cells.values() for key in keys)
+        else:
+            candidates = (
+                key for cell in self._cells_of(box) for key in self._cells.get(cell, ())
+            )
+        for key in candidates:
+            if key not in found and boxes_intersect(self._boxes[key], box):
+                found.add(key)
+        return found
+
+    def query_point(self, x: float, y: float) -> set[Hashable]:
+        """Returns the keys of all boxes containing the point (hit-testing)."""
+        return self.query_box((x, y, x, y))
+
+    def nearest(self, x: float, y: float, k: int = 1) -> list[tuple[Hashable, float]]:
+        """
+        Returns the `k` boxes closest to a point.
+
+        Grid rings around the point are searched outward until no unvisited
+        cell can hold anything closer than the current k-th result.
+
+        Returns:
+            list[tuple[Hashable, float]]: `(key, distance)` pairs, closest first.
+        """
+        if k <= 0 or not self._boxes:
+            return []
+        best: list[tuple[float, int, Hashable]] = []
+        seen: set[Hashable] = set()
+        counter = 0
+
+        def consider(key: Hashable) -> None:
+            nonlocal counter
+            if key in seen:
+                return
+            seen.add(key)
+            distance = box_distance(self._boxes[key], x, y)
+            counter += 1
+            entry = (-distance, counter, key)
+            if len(best) < k:
+                heapq.heappush(best, entry)
+            elif distance < -best[0][0]:
+                heapq.heapreplace(best, entry)
+
+        for key in self._oversized:
+            consider(key)
+        if self._extent is not None:
+            ci, cj = math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+            ex0, ey0, ex1, ey1 = self._extent
+            max_ring = max(ci - ex0, ex1 - ci, cj - ey0, ey1 - cj, 0)
+            for ring in range(max_ring + 1):
+                if len(best) == k and -best[0][0] <= (ring - 1) * self.cell_size:
+                    break
+                for cell in self._ring(ci, cj, ring):
+                    for key in self._cells.get(cell, ()):
+                        consider(key)
+        return [
+            (key, -negative)
+            for negative, _, key in sorted(
+                best, key=lambda entry: (-entry[0], entry[1])
+            )
+        ]
+
+    @staticmethod
+    def _ring(ci: int, cj: int, ring: int) -> Iterator[tuple[int, int]]:
+        if ring == 0:
+            yield (ci, cj)
+            return
+        for i in range(ci - ring, ci + ring + 1):
+            yield (i, cj - ring)
+            yield (i, cj + ring)
+        for j in range(cj - ring + 1, cj + ring):
+            yield (ci - ring, j)
+            yield (ci + ring, j)
@@ -0,0 +1,223 @@
+import hashlib
+import hmac
+import inspect
+import json
+from collections import OrderedDict
+from collections.abc import Callable, MutableMapping
+from typing import Any
+
+from universal_mcp_miro.cache import ResponseCache
+from universal_mcp_miro.snapshot import BoardSnapshot
+
+# Largest callback body accepted; Miro item events are a few kilobytes.
+MAX_BODY_BYTES = 1 << 20
+
+SIGNATURE_HEADER = b"x-miro-signature"
+
+EventListener = Callable[[dict[str, Any]], Any]
+
+
+class WebhookReceiver:
+    """
+    ASGI endpoint for Miro board subscription callbacks.
+
+    Answers the challenge Miro sends when a subscription is created, drops redelivered
+    events (see `event_key`), applies item create/update/delete events to the held board
+    snapshots and evicts the affected cache entries, so changes made by other users
+    reach the client without polling get_items_on_board. Every new event is then passed
+    to the registered listeners. An event whose handling raises is forgotten again, so
+    Miro's redelivery after the error response is processed instead of being dropped as
+    a duplicate.
+
+    Mount it in any ASGI server, e.g. `uvicorn module:receiver`; it has no
+    dependencies of its own.
+
+    Args:
+        snapshots (MutableMapping[str, BoardSnapshot] | None): Snapshots by board ID to
+            keep current.
+        cache (ResponseCache | None): Cache whose board entries are invalidated.
+        secret (str | None): When set, callbacks must carry a valid `X-Miro-Signature`
+            (hex HMAC-SHA256 of the body) or they are rejected.
+        max_seen (int): Number of recent event keys remembered for deduplication.
+    """
+
+    def __init__(
+        self,
+        snapshots: MutableMapping[str, BoardSnapshot] | None = None,
+        cache: ResponseCache | None = None,
+        secret: str | None = None,
+        max_seen: int = 10000,
+    ) -> None:
+        self.snapshots = snapshots if snapshots is not None else {}
+        self.cache = cache
+        self.secret = secret
+        self.max_seen = max_seen
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        self._listeners: list[EventListener] = []
+
+    @classmethod
+    def for_app(cls, app: Any, secret: str | None = None) -> "WebhookReceiver":
+        """Creates a receiver keeping a MiroApp's or AsyncMiroApp's state current."""
+        return cls(snapshots=app.snapshots, cache=app.cache, secret=secret)
+
+    def add_listener(self, listener: EventListener) -> None:
+        """Registers a function, sync or async, called with every new event."""
+        self._listeners.append(listener)
+
+    def _is_duplicate(self, key: str) -> bool:
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            return True
+        self._seen[key] = None
+        while len(self._seen) > self.max_seen:
+            self._seen.popitem(last=False)
+        return False
+
+    def _signature_ok(self, body: bytes, signature: str | None) -> bool:
+        if self.secret is None:
+            return True
+        if not signature:
+            return False
+        expected = hmac.new(self.secret.encode(), body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, signature.strip())
+
+    async def handle(
+        self, body: bytes, signature: str | None = None
+    ) -> tuple[int, dict[str, Any]]:
+        """
+        Processes one callback body and returns the status and JSON body to answer.
+
+        Args:
+            body (bytes): Raw request body.
+            signature (str | None): Value of the `X-Miro-Signature` header.
+
+        Returns:
+            tuple[int, dict]: HTTP status and response payload.
+        """
+        if not self._signature_ok(body, signature):
+            return 401, {"error": "invalid signature"}
+        payload = _decode_object(body)
+        if payload is None:
+            return 400, {"error": "expected a JSON object"}
+        if "challenge" in payload:
+            return 200, {"challenge": payload["challenge"]}
+        event = payload.get("event")
+        if not isinstance(event, dict):
+            return 400, {"error": "missing event"}
+        key = event_key(payload, event)
+        if self._is_duplicate(key):
+            return 200, {"status": "duplicate"}
+        try:
+            self.apply(event)
+            for listener in list(self._listeners):
+                result = listener(event)
+                if inspect.isawaitable(result):
+                    await result
+        except BaseException:
+            self._seen.pop(key, None)
+            raise
+        return 200, {"status": "ok"}
+
+    def apply(self, event: dict[str, Any]) -> None:
+        """Applies one item event to the matching snapshot and cache scope."""
+        board_id, item = event.get("boardId"), event.get("item") or {}
+        if not board_id or item.get("id") is None:
+            return
+        event_type = event.get("type")
+        snapshot = self.snapshots.get(board_id)
+        if snapshot is not None:
+            snapshot.apply_event(event_type, item)
+        if self.cache is not None:
+            # Deletes also remove connectors and frame children: drop the whole board.
+            self.cache.invalidate_scope(
+                f"board:{board_id}", None if event_type == "delete" else str(item["id"])
+            )
+
+    async def __call__(
+        self, scope: dict[str, Any], receive: Callable, send: Callable
+    ) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+        if scope["method"] != "POST":
+            await _respond(send, 405, {"error": "method not allowed"})
+            return
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                await _respond(send, 413, {"error": "body too large"})
+                return
+            chunks.append(chunk)
+            if not message.get("more_body"):
+                break
+        headers = dict(scope.get("headers") or [])
+        signature = headers.get(SIGNATURE_HEADER)
+        status, payload = await self.handle(
+            b"".join(chunks), signature.decode("latin-1") if signature else None
+        )
+        await _respond(send, status, payload)
+
+
+def _decode_object(body: bytes) -> dict[str, Any] | None:
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def event_key(payload: dict[str, Any], event: dict[str, Any]) -> str:
+    """
+    Identifies an event across redeliveries, independently of the envelope around it.
+
+    Uses the event's own ID when it has one, and otherwise its board, type,
+    item ID and the item's modification time (or the event time).
+    """
+    event_id = event.get("id") or event.get("eventId")
+    if event_id is not None:
+        return f"id:{event_id}"
+    item = event.get("item") or {}
+    timestamp = (
+        item.get("modifiedAt")
+        or item.get("createdAt")
+        or event.get("eventTime")
+        or payload.get("eventTime")
+    )
+    if timestamp is not None and item.get("id") is not None:
+        return (
+            f"item:{event.get('boardId')}:{event.get('type')}:{item['id']}:{timestamp}"
+        )
+    # Without an identity, the event content itself is the key.
+    return (
+        "event:"
+        + hashlib.sha256(
+            json.dumps(event, sort_keys=True, default=str).encode()
+        ).hexdigest()
+    )
+
+
+async def _respond(send: Callable, status: int, payload: dict[str, Any]) -> None:
+    body = json.dumps(payload).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
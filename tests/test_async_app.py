@@ -0,0 +1,77 @@
+import asyncio
+import inspect
+
+import httpx
+import pytest
+
+from universal_mcp_miro.app import MiroApp
+from universal_mcp_miro.async_app import AsyncMiroApp, prepare_request
+
+
+def make_app(handler):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncMiroApp(integration=None, client=client)
+
+
+def test_operations_mirror_sync_app():
+    app = AsyncMiroApp(integration=None)
+    tools = app.list_tools()
+    assert [tool.__name__ for tool in tools] == [
+        tool.__name__ for tool in MiroApp.list_tools(MiroApp.__new__(MiroApp))
+    ]
+    assert all(inspect.iscoroutinefunction(tool) for tool in tools)
+    assert inspect.signature(AsyncMiroApp.get_specific_board) == inspect.signature(
+        MiroApp.get_specific_board
+    )
+
+
+def test_prepare_request_builds_without_sending():
+    request = prepare_request(
+        MiroApp.get_items_on_board, "https://api.miro.com", "b1", limit="10"
+    )
+    assert request.method == "GET"
+    assert request.url == "https://api.miro.com/v2/boards/b1/items"
+    assert request.params == {"limit": "10"}
+
+
+def test_prepare_request_validates_required_parameters():
+    with pytest.raises(ValueError):
+        prepare_request(MiroApp.get_specific_board, "https://api.miro.com", None)
+
+
+def test_concurrent_calls_share_client():
+    requests = []
+
+    def handler(request):
+        requests.append((request.method, request.url.path))
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+    async def run():
+        async with make_app(handler) as app:
+            return await asyncio.gather(
+                *(app.get_specific_board(f"b{i}") for i in range(5))
+            )
+
+    results = asyncio.run(run())
+    assert [result["id"] for result in results] == [f"b{i}" for i in range(5)]
+    assert sorted(requests) == [("GET", f"/v2/boards/b{i}") for i in range(5)]
+
+
+def test_identical_concurrent_gets_share_one_request():
+    requests = []
+
+    async def handler(request):
+        requests.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"data": [], "total": 0})
+
+    async def run():
+        async with make_app(handler) as app:
+            return await asyncio.gather(
+                *(app.get_all_board_members("b1", limit="10") for _ in range(5)),
+                app.get_all_board_members("b2"),
+            )
+
+    results = asyncio.run(run())
+    assert results == [{"data": [], "total": 0}] * 6
+    assert sorted(requests) == ["/v2/boards/b1/members", "/v2/boards/b2/members"]
@@ -0,0 +1,79 @@
+import json
+import math
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from universal_mcp_miro.auditlogs import AuditLogExport, split_windows
+
+
+class FakeAuditLogs:
+    def __init__(self, events, failing=()):
+        self.events = events
+        self.failing = set(failing)
+        self.windows = []
+
+    def get_audit_logs(
+        self,
+        createdAfter=None,
+        createdBefore=None,
+        cursor=None,
+        limit=None,
+        sorting=None,
+    ):
+        if createdAfter in self.failing:
+            raise RuntimeError("unavailable")
+        self.windows.append(createdAfter)
+        # The boundary is inclusive on both sides, like a lenient server.
+        matching = [
+            event
+            for event in self.events
+            if createdAfter <= event["createdAt"] <= createdBefore
+        ]
+        start = int(cursor or 0)
+        page = matching[start : start + limit]
+        return {
+            "data": page,
+            "cursor": str(start + limit) if start + limit < len(matching) else None,
+        }
+
+
+def test_split_windows():
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    assert split_windows(start, start + timedelta(hours=30), timedelta(hours=12)) == [
+        ("2024-01-01T00:00:00.000Z", "2024-01-01T12:00:00.000Z"),
+        ("2024-01-01T12:00:00.000Z", "2024-01-02T00:00:00.000Z"),
+        ("2024-01-02T00:00:00.000Z", "2024-01-02T06:00:00.000Z"),
+    ]
+
+
+def test_export_is_ordered_deduplicated_and_resumable(tmp_path):
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    events = [
+        {"id": str(n), "createdAt": f"2024-01-0{1 + n // 24}T{n % 24:02d}:00:00.000Z"}
+        for n in range(72)
+    ]
+    path = tmp_path / "audit.jsonl"
+    failing = FakeAuditLogs(events, failing={"2024-01-02T00:00:00.000Z"})
+    with pytest.raises(RuntimeError):
+        AuditLogExport(failing, path, start, start + timedelta(days=3)).run(limit=5)
+    assert not path.exists()
+
+    app = FakeAuditLogs(events)
+    limit = 5
+    result = AuditLogExport(app, path, start, start + timedelta(days=3)).run(
+        limit=limit
+    )
+    # Only the failed day is fetched again: its 24 events, `limit` per page.
+    assert app.windows.count("2024-01-02T00:00:00.000Z") == math.ceil(24 / limit)
+    assert "2024-01-01T00:00:00.000Z" not in app.windows
+    assert result == {
+        "path": str(path),
+        "events": 72,
+        "duplicates": 2,
+        "windows": 3,
+        "resumed": 2,
+    }
+    written = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [event["id"] for event in written] == [str(n) for n in range(72)]
+    assert not (tmp_path / "audit.jsonl.parts").exists()
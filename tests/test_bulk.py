@@ -0,0 +1,147 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from universal_mcp_miro.app import MiroApp
+from universal_mcp_miro.bulk import chunked, run_concurrently
+
+
+def test_chunked_splits_into_bounded_slices():
+    assert chunked(list(range(5)), 2) == [[0, 1], [2, 3], [4]]
+    assert chunked([], 3) == []
+    with pytest.raises(ValueError):
+        chunked([1], 0)
+
+
+def test_run_concurrently_keeps_order_and_captures_errors():
+    broken = 3
+
+    def square(n):
+        if n == broken:
+            raise RuntimeError("boom")
+        return n * n
+
+    outcomes = run_concurrently(square, range(5), max_workers=3)
+    assert [outcome.result for outcome in outcomes] == [0, 1, 4, None, 16]
+    assert isinstance(outcomes[broken].error, RuntimeError)
+
+
+def test_bulk_create_items_chunks_and_reports_failures():
+    app = MiroApp(integration=MagicMock())
+
+    def create(board_id, items):
+        if items[0]["data"]["content"] == "2":
+            raise RuntimeError("rejected")
+        return {"data": [{"id": f"id{item['data']['content']}"} for item in items]}
+
+    app.create_items_in_bulk = MagicMock(side_effect=create)
+    items = [{"type": "sticky_note", "data": {"content": str(i)}} for i in range(5)]
+    result = app.bulk_create_items("b1", items, chunk_size=2)
+    assert result["ids"] == ["id0", "id1", None, None, "id4"]
+    assert result["failures"] == [
+        {"start": 2, "size": 2, "error": "RuntimeError: rejected"}
+    ]
+    assert app.create_items_in_bulk.call_count == len(chunked(items, 2))
+
+
+def test_bulk_update_items_routes_by_type():
+    app = MiroApp(integration=MagicMock())
+    app.update_sticky_note_item = MagicMock(return_value={})
+    app.update_item_position_or_parent = MagicMock(return_value={})
+    result = app.bulk_update_items(
+        "b1",
+        [
+            {"id": "i1", "type": "sticky_note", "style": {"fillColor": "red"}},
+            {"id": "i2", "position": {"x": 1, "y": 2}},
+            {"id": "i3", "type": "hologram"},
+        ],
+    )
+    app.update_sticky_note_item.assert_called_once_with(
+        "b1", "i1", style={"fillColor": "red"}
+    )
+    app.update_item_position_or_parent.assert_called_once_with(
+        "b1", "i2", position={"x": 1, "y": 2}
+    )
+    assert [entry["ok"] for entry in result["results"]] == [True, True, False]
+    assert (result["succeeded"], result["failed"]) == (2, 1)
+
+
+def test_batch_returns_results_and_errors_in_input_order():
+    def handler(request):
+        item_id = request.url.path.rsplit("/", 1)[-1]
+        if item_id == "missing":
+            return httpx.Response(404, json={"message": "not found"})
+        return httpx.Response(200, json={"id": item_id})
+
+    app = MiroApp(integration=MagicMock())
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    result = app.batch(
+        [
+            {
+                "operation": "get_specific_item_on_board",
+                "args": {"board_id": "b1", "item_id": "i1"},
+            },
+            {
+                "operation": "get_specific_item_on_board",
+                "args": {"board_id": "b1", "item_id": "missing"},
+            },
+            {
+                "operation": "bulk_delete_items",
+                "args": {"board_id": "b1", "item_ids": ["i1"]},
+            },
+            {
+                "operation": "get_sticky_note_item",
+                "args": {"board_id": "b1", "item_id": "i2"},
+            },
+        ],
+        max_workers=4,
+    )
+    assert [entry["ok"] for entry in result["results"]] == [True, False, False, True]
+    assert result["results"][0]["result"] == {"id": "i1"}
+    assert result["results"][1]["error"].startswith("HTTP 404")
+    assert (
+        result["results"][2]["error"]
+        == "ValueError: Unknown operation 'bulk_delete_items'"
+    )
+    assert result["results"][3] == {
+        "operation": "get_sticky_note_item",
+        "ok": True,
+        "result": {"id": "i2"},
+    }
+    assert (result["succeeded"], result["failed"]) == (2, 2)
+
+
+def test_bulk_delete_items_runs_concurrently_and_reports_failures():
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+    paths = []
+
+    def handler(request):
+        with lock:
+            paths.append(request.url.path)
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        if request.url.path.endswith("/i3"):
+            return httpx.Response(404, json={"message": "not found"})
+        return httpx.Response(204)
+
+    app = MiroApp(integration=MagicMock())
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    item_ids = [f"i{i}" for i in range(6)]
+    max_workers = 3
+    result = app.bulk_delete_items("b1", item_ids, max_workers=max_workers)
+    assert [entry["id"] for entry in result["results"]] == item_ids
+    failed = [entry["id"] for entry in result["results"] if not entry["ok"]]
+    assert failed == ["i3"]
+    assert result["results"][3]["error"].startswith("HTTP 404")
+    assert (result["succeeded"], result["failed"]) == (5, 1)
+    assert sorted(paths) == sorted(
+        f"/v2/boards/b1/items/{item_id}" for item_id in item_ids
+    )
+    assert 1 < state["peak"] <= max_workers
@@ -0,0 +1,108 @@
+import time
+
+from universal_mcp_miro.cache import ResponseCache
+
+
+def test_key_for_matches_only_configured_lookups():
+    cache = ResponseCache()
+    key = cache.key_for(
+        "https://api.miro.com/v2/boards/b1", {"b": 2, "a": 1, "c": None}
+    )
+    assert key.operation == "get_specific_board"
+    assert key.params == (("a", "1"), ("b", "2"))
+    assert cache.key_for("https://api.miro.com/v2/boards/b1/members") is None
+
+
+def test_hits_misses_and_ttl_expiry():
+    cache = ResponseCache(ttls={"get_specific_board": 0.05})
+    key = cache.key_for("/v2/boards/b1")
+    assert cache.get(key) is None
+    cache.put(key, "board")
+    assert cache.get(key) == "board"
+    time.sleep(0.06)
+    assert cache.get(key) is None
+    stats = cache.stats
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+    keys = [cache.key_for(f"/v2/boards/b{i}") for i in range(3)]
+    cache.put(keys[0], 0)
+    cache.put(keys[1], 1)
+    cache.get(keys[0])
+    cache.put(keys[2], 2)
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == 0
+    assert cache.stats.evictions == 1
+
+
+def test_zero_ttl_or_size_disables_caching():
+    assert ResponseCache(ttls={"get_team": 0}).key_for("/v2/orgs/o/teams/t") is None
+    assert ResponseCache(max_entries=0).key_for("/v2/boards/b1") is None
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    def json(self):
+        return self.body
+
+
+def fill_board(cache):
+    paths = [
+        "/v2/boards/b1",
+        "/v2/boards/b1/items",
+        "/v2/boards/b1/sticky_notes/i1",
+        "/v2/boards/b1/sticky_notes/i2",
+        "/v2/boards/b2/sticky_notes/i9",
+    ]
+    keys = {path: cache.key_for(path) for path in paths}
+    for path, key in keys.items():
+        cache.put(key, path)
+    return keys
+
+
+def test_item_update_evicts_board_lists_and_writes_through():
+    cache = ResponseCache()
+    keys = fill_board(cache)
+    updated = FakeResponse({"id": "i1", "data": {"content": "new"}})
+    cache.on_write(
+        "PATCH", "https://api.miro.com/v2/boards/b1/sticky_notes/i1", updated
+    )
+    assert cache.get(keys["/v2/boards/b1"]) is None
+    assert cache.get(keys["/v2/boards/b1/items"]) is None
+    assert cache.get(keys["/v2/boards/b1/sticky_notes/i1"]) is updated
+    assert (
+        cache.get(keys["/v2/boards/b1/sticky_notes/i2"])
+        == "/v2/boards/b1/sticky_notes/i2"
+    )
+    assert (
+        cache.get(keys["/v2/boards/b2/sticky_notes/i9"])
+        == "/v2/boards/b2/sticky_notes/i9"
+    )
+
+
+def test_create_writes_new_item_through():
+    cache = ResponseCache()
+    created = FakeResponse({"id": "i3"})
+    cache.on_write("POST", "/v2/boards/b1/sticky_notes", created)
+    assert cache.get(cache.key_for("/v2/boards/b1/sticky_notes/i3")) is created
+
+
+def test_delete_evicts_whole_board():
+    cache = ResponseCache()
+    keys = fill_board(cache)
+    cache.on_write("DELETE", "/v2/boards/b1/items/i1")
+    assert cache.get(keys["/v2/boards/b1/sticky_notes/i2"]) is None
+    assert cache.get(keys["/v2/boards/b2/sticky_notes/i9"]) is not None
+
+
+def test_put_discards_response_that_raced_with_a_write():
+    cache = ResponseCache()
+    key = cache.key_for("/v2/boards/b1/items")
+    generation = cache.generation(key)
+    cache.on_write("POST", "/v2/boards/b1/sticky_notes")
+    cache.put(key, "stale", generation)
+    assert cache.get(key) is None
@@ -0,0 +1,87 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from universal_mcp_miro.contentlogs import ContentLogStore
+
+
+def entry(entry_id, board_id, time, action="update"):
+    return {
+        "id": entry_id,
+        "boardKey": board_id,
+        "itemId": f"item-{entry_id}",
+        "actionType": action,
+        "actionTime": time,
+        "actor": {"email": "a@example.com"},
+    }
+
+
+class FakeLogs:
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def retrieve_content_change_logs_of_board_items(self, org_id, **query):
+        cursor = query["cursor"]
+        self.calls.append((query["from_"], query["to"], cursor))
+        page = self.pages[cursor]
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+
+def test_sync_checkpoints_and_resumes():
+    now = datetime(2024, 5, 1, 12, 0, tzinfo=UTC)
+    pages = {
+        None: {
+            "data": [
+                entry("1", "b1", "2024-05-01T10:00:00Z"),
+                entry("2", "b2", "2024-05-01T10:05:00Z"),
+            ],
+            "cursor": "c1",
+        },
+        "c1": RuntimeError("connection lost"),
+    }
+    app = FakeLogs(pages)
+    store = ContentLogStore()
+    with pytest.raises(RuntimeError):
+        store.sync(app, "org", start=now - timedelta(hours=3), until=now)
+    assert store.checkpoint("org")["cursor"] == "c1"
+
+    pages["c1"] = {
+        "data": [entry("3", "b1", "2024-05-01T11:00:00Z", "delete")],
+        "cursor": None,
+    }
+    result = store.sync(app, "org", until=now)
+    assert result == {
+        "fetched": 1,
+        "from": "2024-05-01T09:00:00Z",
+        "to": "2024-05-01T12:00:00Z",
+        "resumed": True,
+    }
+    assert app.calls[-1] == ("2024-05-01T09:00:00Z", "2024-05-01T12:00:00Z", "c1")
+    assert store.checkpoint("org") == {
+        "org_id": "org",
+        "synced_to": "2024-05-01T12:00:00Z",
+        "window_from": None,
+        "window_to": None,
+        "cursor": None,
+    }
+
+    pages[None] = {
+        "data": [
+            entry("3", "b1", "2024-05-01T11:00:00Z", "delete"),
+            entry("4", "b1", "2024-05-01T12:30:00Z"),
+        ]
+    }
+    store.sync(app, "org", until=now + timedelta(hours=1), overlap=timedelta(minutes=5))
+    assert app.calls[-1] == ("2024-05-01T11:55:00Z", "2024-05-01T13:00:00Z", None)
+
+    assert [change["id"] for change in store.changes(board_id="b1")] == ["1", "3", "4"]
+    assert [change["id"] for change in store.changes(action_type="delete")] == ["3"]
+    assert [
+        change["id"]
+        for change in store.changes(
+            since="2024-05-01T10:05:00Z", until="2024-05-01T12:00:00Z"
+        )
+    ] == ["2", "3"]
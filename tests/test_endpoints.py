@@ -0,0 +1,100 @@
+import httpx
+import pytest
+
+from universal_mcp_miro.app import COMPOSITE_OPERATIONS, MiroApp
+from universal_mcp_miro.endpoints import ENDPOINTS, Endpoint, decode_response
+from universal_mcp_miro.retry import RetryPolicy
+
+
+def make_app(handler):
+    app = MiroApp(integration=None, retry_policy=RetryPolicy())
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return app
+
+
+def test_prepare_formats_path_and_drops_unset_fields():
+    endpoint = Endpoint(
+        "op",
+        "PATCH",
+        "/v2/boards/{board_id}/items/{item_id}",
+        query=("limit", "from_"),
+        body=("data", "style"),
+    )
+    request = endpoint.prepare(
+        "https://api.miro.com",
+        {
+            "self": None,
+            "board_id": "b1",
+            "item_id": "i1",
+            "limit": None,
+            "from_": "2024-01-01",
+            "data": {"content": "x"},
+            "style": None,
+        },
+    )
+    assert request.method == "PATCH"
+    assert request.url == "https://api.miro.com/v2/boards/b1/items/i1"
+    assert request.params == {"from": "2024-01-01"}
+    assert request.data == {"data": {"content": "x"}}
+
+
+def test_prepare_body_variants():
+    assert Endpoint("op", "GET", "/v2/boards").prepare("", {}).data is None
+    assert (
+        Endpoint("op", "POST", "/v1/oauth/revoke", body=()).prepare("", {}).data == {}
+    )
+    items = [{"type": "text"}]
+    assert (
+        Endpoint("op", "POST", "/v2/items/bulk", raw_body="items")
+        .prepare("", {"items": items})
+        .data
+        is items
+    )
+
+
+def test_prepare_requires_path_parameters():
+    with pytest.raises(ValueError, match="Missing required parameter 'item_id'"):
+        ENDPOINTS["get_specific_item_on_board"].prepare(
+            "", {"board_id": "b1", "item_id": None}
+        )
+
+
+def test_table_matches_endpoint_methods():
+    tools = [tool.__name__ for tool in MiroApp.__new__(MiroApp).list_tools()]
+    assert tools == [*ENDPOINTS, *COMPOSITE_OPERATIONS]
+
+
+def test_decode_response_accepts_empty_body():
+    assert (
+        decode_response(
+            httpx.Response(204, request=httpx.Request("DELETE", "https://api.miro.com"))
+        )
+        is None
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        decode_response(
+            httpx.Response(
+                404, json={}, request=httpx.Request("GET", "https://api.miro.com")
+            )
+        )
+
+
+def test_calls_retry_and_decode_through_the_engine():
+    requests = []
+
+    def handler(request):
+        requests.append((request.method, request.url.path, request.content))
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        if len(requests) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(201, json={"id": "s1"})
+
+    app = make_app(handler)
+    assert app.create_sticky_note_item("b1", data={"content": "hi"}) == {"id": "s1"}
+    assert app.delete_sticky_note_item("b1", "s1") is None
+    assert requests == [
+        ("POST", "/v2/boards/b1/sticky_notes", b'{"data":{"content":"hi"}}'),
+        ("POST", "/v2/boards/b1/sticky_notes", b'{"data":{"content":"hi"}}'),
+        ("DELETE", "/v2/boards/b1/sticky_notes/s1", b""),
+    ]
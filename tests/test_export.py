@@ -0,0 +1,138 @@
+import json
+
+import httpx
+import pytest
+
+from universal_mcp_miro.app import MiroApp
+from universal_mcp_miro.export import download_file, export_boards, wait_for_job
+
+
+def test_wait_for_job_backs_off_and_resets_on_progress():
+    statuses = iter(
+        ["CREATED", "CREATED", "CREATED", "IN_PROGRESS", "IN_PROGRESS", "FINISHED"]
+    )
+    waits = []
+    assert (
+        wait_for_job(
+            lambda: next(statuses),
+            initial_interval=1,
+            factor=2,
+            max_interval=3,
+            sleep=waits.append,
+        )
+        == "FINISHED"
+    )
+    assert waits == [1, 2, 3, 1, 2]
+
+
+def test_wait_for_job_times_out():
+    with pytest.raises(TimeoutError):
+        wait_for_job(lambda: "IN_PROGRESS", timeout=0, sleep=lambda _: None)
+
+
+def serve(content, etag, requests, range_offset=0):
+    def handler(request):
+        requests.append((request.headers.get("Range"), request.headers.get("If-Range")))
+        if "Range" in request.headers and request.headers.get("If-Range") == etag:
+            start = (
+                int(request.headers["Range"].removeprefix("bytes=").rstrip("-"))
+                + range_offset
+            )
+            return httpx.Response(
+                206,
+                content=content[start:],
+                headers={
+                    "ETag": etag,
+                    "Content-Range": f"bytes {start}-{len(content) - 1}/{len(content)}",
+                },
+            )
+        return httpx.Response(200, content=content, headers={"ETag": etag})
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_download_resumes_partial_file(tmp_path):
+    content = bytes(range(256)) * 64
+    requests = []
+    target = tmp_path / "board.zip"
+    (tmp_path / "board.zip.part").write_bytes(content[:1000])
+    (tmp_path / "board.zip.part.validator").write_text('"v1"')
+    with serve(content, '"v1"', requests) as client:
+        assert (
+            download_file(
+                client, "https://example.com/board.zip", target, chunk_size=512
+            )
+            == target
+        )
+    assert target.read_bytes() == content
+    assert requests == [("bytes=1000-", '"v1"')]
+    assert not (tmp_path / "board.zip.part").exists()
+    assert not (tmp_path / "board.zip.part.validator").exists()
+
+
+def test_download_restarts_when_partial_file_is_stale(tmp_path):
+    content = b"new archive" * 500
+    target = tmp_path / "board.zip"
+    # Another job's file, a mismatched Content-Range, and a part without a validator.
+    for validator, range_offset in (('"old-job"', 0), ('"v2"', 7), (None, 0)):
+        (tmp_path / "board.zip.part").write_bytes(b"old archive" * 100)
+        if validator:
+            (tmp_path / "board.zip.part.validator").write_text(validator)
+        with serve(content, '"v2"', [], range_offset=range_offset) as client:
+            download_file(
+                client, "https://example.com/board.zip", target, chunk_size=512
+            )
+        assert target.read_bytes() == content
+
+
+def test_export_boards_maps_shard_results_back_to_boards(tmp_path):
+    jobs = {}
+
+    def handler(request):
+        path = request.url.path
+        if request.url.host == "files.example.com":
+            return httpx.Response(200, content=b"archive " + path.encode())
+        if request.method == "POST":
+            board_ids = json.loads(request.content)["boardIds"]
+            jobs[f"job-{board_ids[0]}"] = board_ids
+            return httpx.Response(200, json={"jobId": f"job-{board_ids[0]}"})
+        job_id = path.removesuffix("/results").rsplit("/", 1)[1]
+        if not path.endswith("/results"):
+            failed = "b4" in jobs[job_id]
+            return httpx.Response(
+                200, json={"jobStatus": "CANCELLED" if failed else "FINISHED"}
+            )
+        # Results come back out of order, and b1 is missing altogether.
+        return httpx.Response(
+            200,
+            json={
+                "results": [
+                    {
+                        "boardId": "b3",
+                        "status": "SUCCESS",
+                        "exportLink": "https://files.example.com/b3.zip",
+                    },
+                    {"boardId": "b2", "status": "ERROR", "errorMessage": "Locked"},
+                ]
+            },
+        )
+
+    transport = httpx.MockTransport(handler)
+    app = MiroApp(integration=None)
+    app._client = httpx.Client(transport=transport)
+    with httpx.Client(transport=transport) as client:
+        boards = export_boards(
+            app, "o1", ["b1", "b2", "b3", "b4"], tmp_path, shard_size=3, client=client
+        )
+    assert jobs == {"job-b1": ["b1", "b2", "b3"], "job-b4": ["b4"]}
+    assert boards == [
+        {
+            "boardId": "b1",
+            "jobId": None,
+            "error": "Missing from the export job results",
+        },
+        {"boardId": "b2", "jobId": "job-b1", "error": "Locked"},
+        {"boardId": "b3", "jobId": "job-b1", "path": str(tmp_path / "b3.zip")},
+        {"boardId": "b4", "jobId": "job-b4", "error": "Export job ended as CANCELLED"},
+    ]
+    assert (tmp_path / "b3.zip").read_bytes() == b"archive /b3.zip"
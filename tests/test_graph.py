@@ -0,0 +1,57 @@
+import pytest
+
+from universal_mcp_miro.graph import ConnectorGraph
+
+
+def connector(connector_id, start, end):
+    return {"id": connector_id, "startItem": {"id": start}, "endItem": {"id": end}}
+
+
+def flowchart():
+    return ConnectorGraph.from_connectors(
+        [
+            connector("c1", "start", "a"),
+            connector("c2", "a", "b"),
+            connector("c3", "a", "c"),
+            connector("c4", "b", "end"),
+            connector("c5", "c", "end"),
+            {"id": "dangling", "startItem": {"id": "a"}},
+        ]
+    )
+
+
+def test_neighbors_and_reachability():
+    graph = flowchart()
+    assert graph.neighbors("a") == ["b", "c"]
+    assert graph.neighbors("end", direction="in") == ["b", "c"]
+    assert graph.reachable("a") == {"b", "c", "end"}
+    assert graph.reachable("end", direction="in") == {"start", "a", "b", "c"}
+    assert sorted(graph.edges) == ["c1", "c2", "c3", "c4", "c5"]
+
+
+def test_shortest_path():
+    graph = flowchart()
+    assert graph.shortest_path("start", "end") == ["start", "a", "b", "end"]
+    assert graph.shortest_path("end", "start") is None
+    assert graph.shortest_path("end", "start", directed=False) == [
+        "end",
+        "b",
+        "a",
+        "start",
+    ]
+    assert graph.shortest_path("start", "missing") is None
+
+
+def test_topological_order_and_cycles():
+    graph = flowchart()
+    order = graph.topological_order()
+    for start, end in graph.edges.values():
+        assert order.index(start) < order.index(end)
+    assert graph.find_cycle() is None
+    graph.add_edge("back", "end", "a")
+    cycle = graph.find_cycle()
+    assert cycle[0] == cycle[-1] and "a" in cycle and "end" in cycle
+    with pytest.raises(ValueError):
+        graph.topological_order()
+    assert graph.remove_edge("back")
+    assert not graph.has_cycle()
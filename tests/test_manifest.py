@@ -0,0 +1,110 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from universal_mcp_miro.app import MiroApp
+from universal_mcp_miro.manifest import (
+    MANIFEST_PATH,
+    build_manifest,
+    describe_tool,
+    select_tools,
+)
+
+
+def sample_tool(board_id, items, limit=10, cursor=None):
+    """
+    Does something with
+    items.
+
+    Args:
+        board_id (string): board_id
+            Example:
+            ```json
+            "b1"
+            ```
+        items (array): Items to process. Example: `[{"id": "1"}]`.
+        limit (integer): Page size, wrapped
+            over two lines.
+
+    Returns:
+        dict: Result.
+
+    Tags:
+        Items, Bulk operations
+    """
+
+
+def test_describe_tool_builds_compact_schema():
+    assert describe_tool(sample_tool) == {
+        "name": "sample_tool",
+        "description": "Does something with items.",
+        "tags": ["Items", "Bulk operations"],
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "board_id": {"type": "string"},
+                "items": {
+                    "type": "array",
+                    "description": 'Items to process. Example: `[{"id": "1"}]`.',
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Page size, wrapped over two lines.",
+                    "default": 10,
+                },
+                "cursor": {},
+            },
+            "required": ["board_id", "items"],
+        },
+    }
+
+
+def test_committed_manifest_is_current():
+    # Regenerate with `python -m universal_mcp_miro.manifest` after changing tools.
+    assert json.loads(MANIFEST_PATH.read_text(encoding="utf-8")) == build_manifest(
+        MiroApp.__new__(MiroApp)
+    )
+
+
+def test_select_tools_filters_by_tag_case_insensitively():
+    manifest = {
+        "a": {"name": "a", "tags": ["Boards"]},
+        "b": {"name": "b", "tags": ["Items", "Bulk operations"]},
+        "c": {"name": "c", "tags": ["Audit Logs"]},
+    }
+    assert list(select_tools(manifest, None)) == ["a", "b", "c"]
+    assert list(select_tools(manifest, [""])) == ["a", "b", "c"]
+    assert list(select_tools(manifest, ["boards", " bulk operations"])) == ["a", "b"]
+    with pytest.raises(
+        ValueError,
+        match="Unknown tool tags: nope. Available: Audit Logs, Boards, Bulk operations",
+    ):
+        select_tools(manifest, ["Boards", "nope"])
+
+
+def test_app_import_defers_feature_modules():
+    code = (
+        "import sys, universal_mcp_miro.app; "
+        "print(sorted(m for m in sys.modules if m.startswith('universal_mcp_miro.')))"
+    )
+    loaded = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    ).stdout
+    for module in (
+        "auditlogs",
+        "contentlogs",
+        "export",
+        "graph",
+        "mindmap",
+        "reconcile",
+        "placement",
+        "spatial",
+    ):
+        assert f"universal_mcp_miro.{module}'" not in loaded
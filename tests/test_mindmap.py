@@ -0,0 +1,108 @@
+import threading
+
+from universal_mcp_miro.app import MiroApp
+from universal_mcp_miro.mindmap import MindMapTree, build_level_by_level
+
+
+def node(node_id, content, parent_id=None):
+    payload = {
+        "id": node_id,
+        "data": {"nodeView": {"data": {"type": "text", "content": content}}},
+    }
+    if parent_id is not None:
+        payload["parent"] = {"id": parent_id}
+    return payload
+
+
+def test_tree_links_nodes_in_any_order():
+    tree = MindMapTree.from_nodes(
+        [
+            node("c", "Child", "b"),
+            node("b", "Branch", "r"),
+            node("r", "Root"),
+            node("d", "Leaf", "r"),
+        ]
+    )
+    assert [root.id for root in tree.roots] == ["r"]
+    assert tree.to_outline() == [
+        {
+            "id": "r",
+            "content": "Root",
+            "children": [
+                {
+                    "id": "b",
+                    "content": "Branch",
+                    "children": [{"id": "c", "content": "Child", "children": []}],
+                },
+                {"id": "d", "content": "Leaf", "children": []},
+            ],
+        }
+    ]
+    assert [(n.id, depth) for n, depth in tree.walk()] == [
+        ("r", 0),
+        ("b", 1),
+        ("c", 2),
+        ("d", 1),
+    ]
+
+
+def test_builder_creates_parents_before_children_and_skips_failed_subtrees():
+    lock = threading.Lock()
+    created = {}
+
+    def create(spec, parent_id):
+        if spec["content"] == "broken":
+            raise RuntimeError("boom")
+        with lock:
+            assert parent_id is None or parent_id in created.values()
+            node_id = f"id-{len(created)}"
+            created[spec["content"]] = node_id
+        return node_id
+
+    outline = [
+        {
+            "content": "root",
+            "children": [
+                "a",
+                {
+                    "content": "broken",
+                    "children": ["x", {"content": "y", "children": ["z"]}],
+                },
+                {"content": "b", "children": ["c"]},
+            ],
+        }
+    ]
+    result = build_level_by_level(create, outline, max_workers=4)
+    assert sorted(entry["path"] for entry in result["nodes"]) == [
+        "0",
+        "0/0",
+        "0/2",
+        "0/2/0",
+    ]
+    assert result["failures"] == [
+        {"path": "0/1", "error": "RuntimeError: boom", "skipped": 3}
+    ]
+    assert set(created) == {"root", "a", "b", "c"}
+
+
+def test_create_mind_map_stacks_roots_by_subtree_size():
+    app = MiroApp(integration=None)
+    calls, ids = [], iter(range(100))
+    lock = threading.Lock()
+
+    def create_node(board_id, data=None, parent=None, position=None):
+        with lock:
+            calls.append((data["nodeView"]["data"]["content"], position))
+            return {"id": str(next(ids))}
+
+    app.create_mind_map_node = create_node
+    outline = ["A", {"content": "B", "children": ["b1", "b2", "b3"]}, "C"]
+    result = app.create_mind_map("b1", outline, x=10, y=20)
+    assert result["failures"] == []
+    roots = {content: position for content, position in calls if position is not None}
+    assert roots == {
+        "A": {"x": 10.0, "y": 20.0},
+        "B": {"x": 10.0, "y": 320.0},
+        "C": {"x": 10.0, "y": 620.0},
+    }
+    assert outline[1] == {"content": "B", "children": ["b1", "b2", "b3"]}
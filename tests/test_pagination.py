@@ -0,0 +1,103 @@
+import threading
+
+from universal_mcp_miro.pagination import (
+    fetch_offset_windows,
+    iter_cursor,
+    iter_cursor_pages,
+)
+
+
+def make_fetch(pages):
+    calls = []
+
+    def fetch(cursor):
+        calls.append(cursor)
+        index = int(cursor) if cursor else 0
+        page = {"data": pages[index]}
+        if index + 1 < len(pages):
+            page["cursor"] = str(index + 1)
+        return page
+
+    return fetch, calls
+
+
+def test_iter_cursor_follows_cursor_chain():
+    fetch, calls = make_fetch([[1, 2], [3], [4, 5]])
+    assert list(iter_cursor(fetch)) == [1, 2, 3, 4, 5]
+    assert calls == [None, "1", "2"]
+
+
+def test_iter_cursor_without_prefetch():
+    fetch, calls = make_fetch([[1], [2]])
+    assert list(iter_cursor(fetch, prefetch=False)) == [1, 2]
+    assert calls == [None, "1"]
+
+
+def test_iter_cursor_stops_on_empty_page_with_cursor():
+    def fetch(cursor):
+        return {"data": [], "cursor": "again"}
+
+    assert list(iter_cursor(fetch)) == []
+
+
+def test_prefetch_requests_next_page_before_current_is_consumed():
+    second_requested = threading.Event()
+
+    def fetch(cursor):
+        if cursor:
+            second_requested.set()
+            return {"data": ["b"]}
+        return {"data": ["a"], "cursor": "next"}
+
+    pages = iter_cursor_pages(fetch)
+    next(pages)
+    assert second_requested.wait(timeout=5)
+    pages.close()
+
+
+def make_offset_fetch(entries, report_total=True, cap=None):
+    calls = []
+
+    def fetch(offset, limit):
+        calls.append(offset)
+        limit = min(limit, cap or limit)
+        page = {
+            "data": entries[offset : offset + limit],
+            "offset": offset,
+            "limit": limit,
+        }
+        if report_total:
+            page["total"] = len(entries)
+        return page
+
+    return fetch, calls
+
+
+def test_fetch_offset_windows_uses_total_to_fan_out():
+    entries = list(range(23))
+    fetch, calls = make_offset_fetch(entries)
+    assert fetch_offset_windows(fetch, page_size=5, max_workers=3) == entries
+    assert sorted(calls) == [0, 5, 10, 15, 20]
+
+
+def test_fetch_offset_windows_without_total_walks_sequentially():
+    entries = list(range(12))
+    fetch, calls = make_offset_fetch(entries, report_total=False)
+    assert fetch_offset_windows(fetch, page_size=5) == entries
+    assert calls == [0, 5, 10]
+
+
+def test_fetch_offset_windows_single_short_page():
+    fetch, calls = make_offset_fetch([1, 2])
+    assert fetch_offset_windows(fetch, page_size=5) == [1, 2]
+    assert calls == [0]
+
+
+def test_fetch_offset_windows_follows_the_served_limit():
+    entries = list(range(23))
+    fetch, calls = make_offset_fetch(entries, cap=5)
+    assert fetch_offset_windows(fetch, page_size=100) == entries
+    assert sorted(calls) == [0, 5, 10, 15, 20]
+    fetch, calls = make_offset_fetch(entries, report_total=False, cap=5)
+    assert fetch_offset_windows(fetch, page_size=100) == entries
+    assert calls == [0, 5, 10, 15, 20]
@@ -0,0 +1,89 @@
+import time
+
+import pytest
+
+from universal_mcp_miro.app import MiroApp
+from universal_mcp_miro.placement import find_free_positions
+from universal_mcp_miro.snapshot import BoardSnapshot
+from universal_mcp_miro.spatial import SpatialIndex, boxes_intersect
+
+
+def as_box(position, size):
+    width, height = size
+    return (
+        position["x"] - width / 2,
+        position["y"] - height / 2,
+        position["x"] + width / 2,
+        position["y"] + height / 2,
+    )
+
+
+def test_positions_avoid_existing_items_and_each_other():
+    index = SpatialIndex(cell_size=200)
+    index.insert("a", (-100, -100, 100, 100))
+    index.insert("b", (150, -50, 400, 50))
+    occupied = len(index)
+    sizes = [(200, 200), (100, 100), (300, 50), (50, 50)]
+    positions = find_free_positions(index, sizes, gap=10)
+    boxes = [as_box(position, size) for position, size in zip(positions, sizes)]
+    for box in boxes:
+        assert not index.query_box(box)
+    for i, first in enumerate(boxes):
+        for second in boxes[i + 1 :]:
+            assert not boxes_intersect(first, second)
+    assert len(index) == occupied
+
+
+def test_empty_space_places_first_item_at_target():
+    assert find_free_positions(SpatialIndex(), [(100, 100)], near=(30, 40)) == [
+        {"x": 30, "y": 40}
+    ]
+
+
+def test_region_without_room_raises():
+    index = SpatialIndex()
+    index.insert("a", (0, 0, 100, 100))
+    with pytest.raises(ValueError):
+        find_free_positions(index, [(80, 80)], near=(50, 50), region=(0, 0, 100, 100))
+    assert len(index) == 1
+
+
+def test_app_places_items_inside_a_frame_relative_to_its_corner():
+    snapshot = BoardSnapshot("b1")
+    snapshot.upsert_item(
+        {
+            "id": "f1",
+            "type": "frame",
+            "position": {"x": 1000, "y": 1000},
+            "geometry": {"width": 400, "height": 300},
+        }
+    )
+    snapshot.upsert_item(
+        {
+            "id": "s1",
+            "type": "sticky_note",
+            "parent": {"id": "f1"},
+            "position": {"x": 100, "y": 100, "relativeTo": "parent_top_left"},
+            "geometry": {"width": 100, "height": 100},
+        }
+    )
+    snapshot.loaded_at = time.time()
+    app = MiroApp(integration=None)
+    app.snapshots["b1"] = snapshot
+    sizes = [{"width": 100, "height": 100}] * 2
+    # The frame's own box covers every candidate, so it must not count as occupied.
+    positions = app.find_free_positions(
+        "b1", sizes, near_x=900, near_y=950, gap=0, frame_id="f1"
+    )
+    left, top, right, bottom = snapshot.bounds("f1")
+    boxes = [
+        as_box({"x": position["x"] + left, "y": position["y"] + top}, (100, 100))
+        for position in positions
+    ]
+    for box in boxes:
+        assert left <= box[0] and box[2] <= right
+        assert top <= box[1] and box[3] <= bottom
+        assert not boxes_intersect(box, snapshot.bounds("s1"))
+    assert not boxes_intersect(*boxes)
+    with pytest.raises(ValueError, match="Frame 'f9' not found"):
+        app.find_free_positions("b1", sizes, frame_id="f9")
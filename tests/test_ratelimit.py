@@ -0,0 +1,57 @@
+import time
+
+from universal_mcp_miro.ratelimit import LEVEL_CREDITS, CreditScheduler, request_weight
+
+
+def test_request_weight_levels():
+    assert (
+        request_weight("GET", "https://api.miro.com/v2/boards/b1") == LEVEL_CREDITS[1]
+    )
+    assert (
+        request_weight("GET", "https://api.miro.com/v2/boards/b1/items")
+        == LEVEL_CREDITS[2]
+    )
+    assert (
+        request_weight("PATCH", "https://api.miro.com/v2/boards/b1/sticky_notes/i1")
+        == LEVEL_CREDITS[2]
+    )
+    assert request_weight("POST", "https://api.miro.com/v2/boards") == LEVEL_CREDITS[3]
+    assert request_weight("PUT", "https://api.miro.com/v2/boards") == LEVEL_CREDITS[4]
+
+
+def test_reserve_consumes_budget_until_exhausted():
+    scheduler = CreditScheduler(limit=200, window=60)
+    assert scheduler.reserve(100) == 0
+    assert scheduler.reserve(100) == 0
+    assert scheduler.reserve(50) > 0
+    assert scheduler.remaining == 0
+
+
+def test_window_rolls_over():
+    scheduler = CreditScheduler(limit=100, window=0.05)
+    assert scheduler.reserve(100) == 0
+    assert scheduler.reserve(100) > 0
+    time.sleep(0.06)
+    assert scheduler.reserve(100) == 0
+
+
+def test_observe_applies_server_headers():
+    scheduler = CreditScheduler(limit=100_000, window=60)
+    remaining = 80
+    scheduler.observe(
+        {
+            "X-RateLimit-Limit": "100000",
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(time.time() + 30),
+        }
+    )
+    assert scheduler.remaining == remaining
+    assert scheduler.reserve(100) > 0
+
+
+def test_observe_429_empties_window():
+    scheduler = CreditScheduler(limit=1000, window=60)
+    retry_after = 2
+    scheduler.observe({"Retry-After": str(retry_after)}, status_code=429)
+    delay = scheduler.reserve(50)
+    assert 0 < delay <= retry_after
@@ -0,0 +1,225 @@
+import itertools
+import threading
+
+import httpx
+
+from universal_mcp_miro.app import MiroApp
+from universal_mcp_miro.reconcile import apply_plan, plan_reconciliation
+from universal_mcp_miro.snapshot import BoardSnapshot
+
+
+def live_board():
+    snapshot = BoardSnapshot("b1")
+    snapshot.upsert_item(
+        {
+            "id": "f1",
+            "type": "frame",
+            "data": {"title": "Sprint"},
+            "position": {"x": 0, "y": 0},
+            "geometry": {"width": 800, "height": 600},
+        }
+    )
+    snapshot.upsert_item(
+        {
+            "id": "s1",
+            "type": "sticky_note",
+            "data": {"content": "Keep"},
+            "style": {"fillColor": "yellow"},
+            "position": {"x": 10, "y": 10, "origin": "center"},
+            "parent": {"id": "f1"},
+            "tagIds": ["t1"],
+        }
+    )
+    snapshot.upsert_item(
+        {
+            "id": "s2",
+            "type": "sticky_note",
+            "data": {"content": "Recolor"},
+            "style": {"fillColor": "yellow"},
+        }
+    )
+    snapshot.upsert_item(
+        {"id": "s3", "type": "sticky_note", "data": {"content": "Stale"}}
+    )
+    snapshot.upsert_item(
+        {
+            "id": "c1",
+            "type": "connector",
+            "startItem": {"id": "s1"},
+            "endItem": {"id": "s2"},
+        }
+    )
+    snapshot.upsert_item(
+        {
+            "id": "c2",
+            "type": "connector",
+            "startItem": {"id": "s2"},
+            "endItem": {"id": "s3"},
+        }
+    )
+    snapshot.tags = {
+        "t1": {"id": "t1", "title": "done", "fillColor": "green"},
+        "t2": {"id": "t2", "title": "old"},
+    }
+    return snapshot
+
+
+DESIRED_ITEMS = [
+    {"key": "sprint", "type": "frame", "data": {"title": "Sprint"}},
+    {
+        "key": "keep",
+        "type": "sticky_note",
+        "data": {"content": "Keep"},
+        "position": {"x": 10, "y": 10},
+        "parent": "sprint",
+        "tags": ["done"],
+    },
+    {
+        "key": "recolor",
+        "type": "sticky_note",
+        "data": {"content": "Recolor"},
+        "style": {"fillColor": "red"},
+    },
+    {"key": "new-frame", "type": "frame", "data": {"title": "Later"}},
+    {
+        "key": "new",
+        "type": "text",
+        "data": {"content": "Fresh"},
+        "parent": "new-frame",
+        "tags": ["todo"],
+    },
+]
+DESIRED_CONNECTORS = [
+    {"start": "keep", "end": "recolor"},
+    {"start": "recolor", "end": "new"},
+]
+DESIRED_TAGS = [
+    {"title": "done", "fillColor": "green"},
+    {"title": "todo", "fillColor": "blue"},
+]
+
+
+def test_plan_only_touches_differences():
+    plan = plan_reconciliation(
+        live_board(), DESIRED_ITEMS, DESIRED_CONNECTORS, DESIRED_TAGS, prune=True
+    )
+    assert plan.ids["items"] == {"sprint": "f1", "keep": "s1", "recolor": "s2"}
+    assert [spec["key"] for spec in plan.item_creates] == ["new-frame", "new"]
+    assert plan.item_updates == [
+        {"id": "s2", "type": "sticky_note", "style": {"fillColor": "red"}}
+    ]
+    assert plan.item_deletes == ["s3"]
+    assert plan.connector_deletes == []
+    assert [spec["key"] for spec in plan.connector_creates] == ["recolor->new"]
+    assert [tag["title"] for tag in plan.tag_creates] == ["todo"]
+    assert plan.tag_deletes == ["t2"]
+    assert plan.tag_attachments == [] and plan.tag_detachments == []
+    assert plan.summary() == {
+        "create": 4,
+        "update": 1,
+        "delete": 2,
+        "tag_changes": 0,
+        "unchanged": 4,
+    }
+
+
+class RecordingApp:
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+        self.counter = itertools.count(100)
+
+    def record(self, *call):
+        with self.lock:
+            self.calls.append(call)
+            return str(next(self.counter))
+
+    def create_tag(self, board_id, fillColor=None, title=None):
+        return {"id": self.record("create_tag", title)}
+
+    def bulk_create_items(self, board_id, items, max_workers=4):
+        return {
+            "ids": [
+                self.record(
+                    "create_item", item["type"], (item.get("parent") or {}).get("id")
+                )
+                for item in items
+            ],
+            "failures": [],
+        }
+
+    def bulk_update_items(self, board_id, updates, max_workers=8):
+        self.record("update_items", updates)
+        return {"results": [{"id": update["id"], "ok": True} for update in updates]}
+
+    def bulk_delete_items(self, board_id, item_ids, max_workers=8):
+        self.record("delete_items", list(item_ids))
+        return {"results": [{"id": item_id, "ok": True} for item_id in item_ids]}
+
+    def create_connector(self, board_id, startItem=None, endItem=None, **fields):
+        return {"id": self.record("create_connector", startItem["id"], endItem["id"])}
+
+    def attach_tag_to_item(self, board_id, item_id, tag_id=None):
+        self.record("attach_tag", item_id, tag_id)
+
+    def delete_tag(self, board_id, tag_id):
+        self.record("delete_tag", tag_id)
+
+
+def test_apply_creates_parents_first_and_reports_ids():
+    app = RecordingApp()
+    plan = plan_reconciliation(
+        live_board(), DESIRED_ITEMS, DESIRED_CONNECTORS, DESIRED_TAGS, prune=True
+    )
+    result = apply_plan(app, "b1", plan)
+    assert result["failures"] == []
+    assert app.calls[:3] == [
+        ("create_tag", "todo"),
+        ("create_item", "frame", None),
+        ("create_item", "text", "101"),
+    ]
+    assert result["ids"]["items"]["new"] == "102"
+    assert ("create_connector", "s2", "102") in app.calls
+    assert ("attach_tag", "102", "100") in app.calls
+    assert app.calls[-2:] == [("delete_items", ["s3"]), ("delete_tag", "t2")]
+
+    second = plan_reconciliation(
+        live_board(), DESIRED_ITEMS[:3], DESIRED_CONNECTORS[:1], state=result["ids"]
+    )
+    assert second.summary()["create"] == 0
+
+
+def test_unmanaged_tags_resolve_to_existing_board_tags():
+    app = RecordingApp()
+    items = [
+        {
+            "key": "note",
+            "type": "sticky_note",
+            "data": {"content": "Tagged"},
+            "tags": ["old"],
+        }
+    ]
+    plan = plan_reconciliation(live_board(), items)
+    assert plan.tag_creates == [] and plan.tag_deletes == []
+    result = apply_plan(app, "b1", plan)
+    assert result["failures"] == []
+    assert ("attach_tag", result["ids"]["items"]["note"], "t2") in app.calls
+
+
+def test_reconcile_board_plans_against_the_current_board():
+    board = []
+
+    def handler(request):
+        data = board if request.url.path.endswith("/items") else []
+        return httpx.Response(200, json={"data": list(data)})
+
+    app = MiroApp(integration=None)
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    items = [{"key": "note", "type": "sticky_note", "data": {"content": "Hi"}}]
+    first = app.reconcile_board("b1", items, dry_run=True)
+    assert first["summary"]["create"] == 1
+    # The note is created between the runs, while the first items page is cached.
+    board.append({"id": "s1", "type": "sticky_note", "data": {"content": "Hi"}})
+    state = {"items": {"note": "s1"}}
+    second = app.reconcile_board("b1", items, state=state, dry_run=True)
+    assert second["summary"]["create"] == 0
@@ -0,0 +1,96 @@
+import httpx
+import pytest
+
+from universal_mcp_miro.app import MiroApp
+from universal_mcp_miro.retry import RetryPolicy, parse_retry_after
+
+
+def response(status, headers=None):
+    return httpx.Response(status, headers=headers or {})
+
+
+def test_parse_retry_after_seconds_and_missing():
+    headers = [{"Retry-After": "3"}, {}, {"Retry-After": "soon"}]
+    assert [parse_retry_after(header) for header in headers] == [3.0, None, None]
+
+
+def test_retries_transient_status_for_idempotent_methods():
+    policy = RetryPolicy(base_delay=0.1, max_delay=1.0)
+    delay = policy.retry_delay("GET", 1, 0.0, response=response(503))
+    assert policy.base_delay <= delay <= policy.max_delay
+    assert policy.retry_delay("POST", 1, 0.0, response=response(503)) is None
+
+
+def test_never_retries_validation_errors():
+    policy = RetryPolicy()
+    for status in (400, 401, 404, 409, 422):
+        assert policy.retry_delay("GET", 1, 0.0, response=response(status)) is None
+
+
+def test_honors_retry_after_for_throttled_writes():
+    policy = RetryPolicy()
+    delays = [
+        policy.retry_delay(
+            "POST", 1, 0.0, response=response(429, {"Retry-After": "2"})
+        ),
+        policy.retry_delay(
+            "GET", 1, 0.0, response=response(429, {"Retry-After": "600"})
+        ),
+    ]
+    assert delays == [2.0, None]
+
+
+def test_stops_after_max_attempts():
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.retry_delay("GET", 2, 0.5, response=response(502)) is not None
+    assert policy.retry_delay("GET", 3, 0.5, response=response(502)) is None
+
+
+def test_transport_errors_retried_only_when_idempotent():
+    policy = RetryPolicy()
+    error = httpx.ConnectError("boom")
+    assert policy.retry_delay("DELETE", 1, 0.0, error=error) is not None
+    assert policy.retry_delay("PATCH", 1, 0.0, error=error) is None
+
+
+def test_app_retries_throttled_and_failed_responses():
+    statuses = [429, 503, 200]
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        status = statuses[len(seen) - 1]
+        return httpx.Response(
+            status,
+            headers={"Retry-After": "0"}
+            if status == httpx.codes.TOO_MANY_REQUESTS
+            else {},
+            json={"id": "b1"},
+        )
+
+    app = MiroApp(
+        integration=None, retry_policy=RetryPolicy(base_delay=0.0, max_delay=0.0)
+    )
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    assert app.get_specific_board("b1") == {"id": "b1"}
+    assert seen == ["/v2/boards/b1"] * 3
+
+
+def test_copy_board_is_not_resent_after_server_error():
+    policy = RetryPolicy(base_delay=0.0, max_delay=0.0)
+    assert policy.retry_delay("PUT", 1, 0.0, response=response(503)) is not None
+    assert (
+        policy.retry_delay("PUT", 1, 0.0, response=response(503), idempotent=False)
+        is None
+    )
+    seen = []
+
+    def handler(request):
+        seen.append(request.method)
+        return httpx.Response(503)
+
+    app = MiroApp(integration=None, retry_policy=policy)
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    with pytest.raises(httpx.HTTPStatusError):
+        app.copy_board(copy_from="b1")
+    assert seen == ["PUT"]
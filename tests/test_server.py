@@ -0,0 +1,86 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from mcp.server.fastmcp.exceptions import ToolError
+
+from universal_mcp_miro.app import MiroApp
+from universal_mcp_miro.server import ManifestMCPServer
+
+
+def make_server(handler=None, tags=None):
+    app = MiroApp(integration=None)
+    if handler is not None:
+        app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return ManifestMCPServer(app_instance=app, tags=tags)
+
+
+def call(server, name, arguments):
+    return json.loads(asyncio.run(server.call_tool(name, arguments))[0].text)
+
+
+def test_batch_is_limited_to_allowlisted_tools():
+    requests = []
+
+    def handler(request):
+        requests.append((request.method, request.url.path))
+        return httpx.Response(200, json={"id": "i1"})
+
+    server = make_server(handler, tags=["Bulk operations", "Items"])
+    result = call(
+        server,
+        "batch",
+        {
+            "operations": [
+                {
+                    "operation": "get_specific_item_on_board",
+                    "args": {"board_id": "b1", "item_id": "i1"},
+                },
+                {"operation": "delete_board", "args": {"board_id": "b1"}},
+            ]
+        },
+    )
+    assert [entry["ok"] for entry in result["results"]] == [True, False]
+    assert (
+        result["results"][1]["error"]
+        == "ValueError: Operation 'delete_board' is not enabled"
+    )
+    assert requests == [("GET", "/v2/boards/b1/items/i1")]
+
+
+def test_tag_allowlist_limits_listed_and_callable_tools():
+    server = make_server(tags=["boards"])
+    names = {tool.name for tool in asyncio.run(server.list_tools())}
+    assert "get_specific_board" in names
+    assert "delete_sticky_note_item" not in names
+    with pytest.raises(ToolError, match="Unknown tool: delete_sticky_note_item"):
+        asyncio.run(
+            server.call_tool(
+                "delete_sticky_note_item", {"board_id": "b1", "item_id": "i1"}
+            )
+        )
+    with pytest.raises(ValueError, match="Unknown tool tags: nope"):
+        make_server(tags=["nope"])
+
+
+def test_unknown_tool_is_rejected():
+    with pytest.raises(ToolError, match="Unknown tool: miro__no_such_tool"):
+        asyncio.run(make_server().call_tool("miro__no_such_tool", {}))
+
+
+def test_json_string_arguments_are_decoded():
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(201, json={"id": "s1"})
+
+    server = make_server(handler)
+    result = call(
+        server,
+        "miro__create_sticky_note_item",
+        {"board_id": "b1", "data": '{"content": "hi"}', "position": "not json"},
+    )
+    assert result == {"id": "s1"}
+    assert bodies == [{"data": {"content": "hi"}, "position": "not json"}]
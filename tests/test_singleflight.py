@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from universal_mcp_miro.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.1)
+        return "result"
+
+    results = []
+    callers = 8
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("key", slow)))
+        for _ in range(callers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ["result"] * callers
+    assert len(calls) == 1
+    assert flight.shared == callers - 1
+    assert flight.do("key", lambda: "again") == "again"
+
+
+def test_errors_reach_every_waiter():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        time.sleep(0.05)
+        raise RuntimeError("boom")
+
+    errors = []
+
+    def call():
+        try:
+            flight.do("key", failing)
+        except RuntimeError as error:
+            errors.append(error)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    follower = threading.Thread(target=call)
+    follower.start()
+    leader.join()
+    follower.join()
+    assert [str(error) for error in errors] == ["boom", "boom"]
+
+
+def test_async_calls_share_one_execution():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise ValueError("bad")
+
+    async def run():
+        results = await asyncio.gather(*(flight.do("key", slow) for _ in range(5)))
+        outcomes = await asyncio.gather(
+            *(flight.do("other", failing) for _ in range(3)), return_exceptions=True
+        )
+        return results, outcomes
+
+    results, outcomes = asyncio.run(run())
+    assert results == [1] * 5
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+    with pytest.raises(ValueError):
+        asyncio.run(flight.do("other", failing))
+
+
+def test_follower_outlives_a_cancelled_leader():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def run():
+        leader = asyncio.create_task(flight.do("key", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", slow))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        result = await follower
+        assert leader.cancelled()
+        return result
+
+    assert asyncio.run(run()) == "done"
+    assert calls == [1]
+    assert flight._calls == {}
@@ -0,0 +1,204 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import httpx
+
+from universal_mcp_miro.app import MiroApp
+from universal_mcp_miro.snapshot import BoardSnapshot
+
+ITEMS = [
+    {
+        "id": "f1",
+        "type": "frame",
+        "position": {"x": 0, "y": 0},
+        "geometry": {"width": 200, "height": 100},
+    },
+    {
+        "id": "s1",
+        "type": "sticky_note",
+        "style": {"fillColor": "red"},
+        "parent": {"id": "f1"},
+        "position": {"x": 50, "y": 25, "relativeTo": "parent_top_left"},
+        "geometry": {"width": 20, "height": 10},
+    },
+    {
+        "id": "s2",
+        "type": "sticky_note",
+        "style": {"fillColor": "yellow"},
+        "position": {"x": 500, "y": 500},
+    },
+    {
+        "id": "t1",
+        "type": "text",
+        "data": {"content": "hi"},
+        "position": {"x": 10, "y": 10},
+    },
+]
+
+
+def fake_app():
+    return SimpleNamespace(
+        iter_items_on_board=lambda board_id: iter(ITEMS),
+        iter_connectors=lambda board_id: iter(
+            [{"id": "c1", "startItem": {"id": "s1"}, "endItem": {"id": "s2"}}]
+        ),
+        fetch_all_tags_from_board=lambda board_id: [{"id": "tag1", "title": "todo"}],
+        iter_groups_on_board=lambda board_id: iter([]),
+        fetch_all_board_members=lambda board_id: [{"id": "u1", "name": "Ada"}],
+    )
+
+
+def test_load_indexes_items_and_collections():
+    snapshot = BoardSnapshot.load(fake_app(), "b1")
+    assert len(snapshot) == len(ITEMS)
+    assert [item.id for item in snapshot.children("f1")] == ["s1"]
+    assert [
+        item.id
+        for item in snapshot.find(type="sticky_note", style={"fillColor": "red"})
+    ] == ["s1"]
+    assert [item.id for item in snapshot.find(data={"content": "hi"})] == ["t1"]
+    assert set(snapshot.connectors) == {"c1"}
+    assert snapshot.tags["tag1"]["title"] == "todo"
+    assert "u1" in snapshot.members
+
+
+def test_bounds_resolve_frame_relative_positions():
+    snapshot = BoardSnapshot.load(fake_app(), "b1")
+    assert snapshot.bounds("f1") == (-100, -50, 100, 50)
+    assert snapshot.bounds("s1") == (-60, -30, -40, -20)
+
+
+def test_upsert_and_remove_keep_indexes_current():
+    snapshot = BoardSnapshot.load(fake_app(), "b1")
+    snapshot.upsert_item(
+        {
+            "id": "s2",
+            "type": "sticky_note",
+            "parent": {"id": "f1"},
+            "position": {"x": 1, "y": 1},
+        }
+    )
+    assert {item.id for item in snapshot.children("f1")} == {"s1", "s2"}
+    snapshot.remove_item("s1")
+    assert snapshot.get("s1") is None
+    assert "c1" not in snapshot.connectors
+    for item_id in ("s2", "t1"):
+        snapshot.remove_item(item_id)
+    assert [item.id for item in snapshot] == ["f1"]
+    assert [item.id for item in snapshot.of_type("frame")] == ["f1"]
+
+
+def test_hydrate_items_serves_snapshot_and_fetches_the_rest_once():
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        kind, item_id = request.url.path.split("/")[-2:]
+        if item_id == "gone":
+            return httpx.Response(404, json={"message": "not found"})
+        return httpx.Response(
+            200,
+            json={
+                "id": item_id,
+                "type": "sticky_note" if kind == "sticky_notes" else "shape",
+                "data": {"content": item_id},
+            },
+        )
+
+    app = MiroApp(integration=None)
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    app.snapshots["b1"] = BoardSnapshot.load(fake_app(), "b1")
+    result = app.hydrate_items(
+        "b1", ["t1", {"id": "s1"}, "s1", {"id": "x9", "type": "unknown"}, "gone"]
+    )
+    assert sorted(requests) == [
+        "/v2/boards/b1/items/gone",
+        "/v2/boards/b1/items/x9",
+        "/v2/boards/b1/sticky_notes/s1",
+    ]
+    assert [item and item["data"]["content"] for item in result["items"]] == [
+        "hi",
+        "s1",
+        "s1",
+        "x9",
+        None,
+    ]
+    assert (result["served"], result["fetched"]) == (1, 2)
+    assert [failure["id"] for failure in result["failures"]] == ["gone"]
+    assert app.snapshots["b1"].get("s1").data == {"content": "s1"}
+
+
+def test_concurrent_deletes_keep_the_store_consistent():
+    snapshot = BoardSnapshot("b1")
+    for i in range(2000):
+        snapshot.upsert_item(
+            {
+                "id": f"i{i}",
+                "type": "sticky_note",
+                "parent": {"id": f"f{i % 7}"},
+                "position": {"x": i, "y": i},
+            }
+        )
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(
+                executor.map(
+                    lambda i: snapshot.apply_write(
+                        "DELETE", "sticky_notes", f"i{i}", None, None
+                    ),
+                    (i for i in range(2000) if i % 4),
+                )
+            )
+    finally:
+        sys.setswitchinterval(interval)
+    kept = sorted(f"i{i}" for i in range(0, 2000, 4))
+    assert sorted(item.id for item in snapshot) == kept
+    assert sorted(item.id for item in snapshot.of_type("sticky_note")) == kept
+    assert sum(len(snapshot.children(f"f{p}")) for p in range(7)) == len(kept)
+
+
+def test_reload_ignores_cached_list_pages():
+    items = [{"id": "s1", "type": "sticky_note"}]
+
+    def handler(request):
+        data = items if request.url.path.endswith("/items") else []
+        return httpx.Response(200, json={"data": list(data)})
+
+    app = MiroApp(integration=None)
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    assert [item.id for item in app.board_snapshot("b1")] == ["s1"]
+    # Another user adds an item while the first items page is still cached.
+    items.append({"id": "s2", "type": "text"})
+    assert [item.id for item in app.board_snapshot("b1")] == ["s1"]
+    assert [item.id for item in app.board_snapshot("b1", max_age=0)] == ["s1", "s2"]
+
+
+def test_snapshot_follows_writes():
+    snapshot = BoardSnapshot("b1")
+    snapshot.apply_write(
+        "POST",
+        "sticky_notes",
+        None,
+        None,
+        {
+            "id": "1",
+            "type": "sticky_note",
+            "position": {"x": 0, "y": 0},
+            "geometry": {"width": 100, "height": 100},
+        },
+    )
+    snapshot.apply_write(
+        "POST",
+        "items",
+        None,
+        None,
+        {"data": [{"id": "2", "type": "text", "position": {"x": 500, "y": 0}}]},
+    )
+    assert "1" in snapshot and "2" in snapshot
+    snapshot.apply_write("DELETE", "items", "1", {"tag_id": "t"}, None)
+    assert "1" in snapshot
+    snapshot.apply_write("DELETE", "sticky_notes", "1", None, None)
+    assert "1" not in snapshot
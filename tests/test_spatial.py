@@ -0,0 +1,49 @@
+import random
+
+from universal_mcp_miro.spatial import SpatialIndex, box_distance, boxes_intersect
+
+
+def random_boxes(count, seed=7):
+    rng = random.Random(seed)
+    boxes = {}
+    for key in range(count):
+        x, y = rng.uniform(-5000, 5000), rng.uniform(-5000, 5000)
+        width, height = rng.uniform(10, 400), rng.uniform(10, 400)
+        boxes[key] = (x, y, x + width, y + height)
+    boxes["huge"] = (-20000, -20000, 20000, 20000)
+    return boxes
+
+
+def build(boxes):
+    index = SpatialIndex(cell_size=250)
+    for key, box in boxes.items():
+        index.insert(key, box)
+    return index
+
+
+def test_query_box_matches_brute_force():
+    boxes = random_boxes(500)
+    index = build(boxes)
+    query = (-1000, -1000, 500, 800)
+    assert index.query_box(query) == {
+        key for key, box in boxes.items() if boxes_intersect(box, query)
+    }
+
+
+def test_query_point_and_remove():
+    index = SpatialIndex(cell_size=100)
+    index.insert("a", (0, 0, 50, 50))
+    index.insert("b", (40, 40, 200, 200))
+    assert index.query_point(45, 45) == {"a", "b"}
+    assert index.remove("a")
+    assert index.query_point(45, 45) == {"b"}
+    assert not index.remove("a")
+
+
+def test_nearest_matches_brute_force():
+    boxes = random_boxes(300)
+    del boxes["huge"]
+    index = build(boxes)
+    x, y = 1234.0, -321.0
+    expected = sorted(boxes, key=lambda key: box_distance(boxes[key], x, y))[:5]
+    assert [key for key, _ in index.nearest(x, y, k=5)] == expected
@@ -0,0 +1,150 @@
+import asyncio
+import hashlib
+import hmac
+import json
+
+import httpx
+
+from universal_mcp_miro.cache import ResponseCache
+from universal_mcp_miro.snapshot import BoardSnapshot
+from universal_mcp_miro.webhooks import WebhookReceiver, event_key
+
+
+def deliver(receiver, payloads, headers=None):
+    async def run():
+        transport = httpx.ASGITransport(app=receiver, raise_app_exceptions=False)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://receiver"
+        ) as sender:
+            return [
+                await sender.post(
+                    "/miro", content=json.dumps(payload), headers=headers or {}
+                )
+                for payload in payloads
+            ]
+
+    return asyncio.run(run())
+
+
+def test_challenge_is_echoed():
+    (response,) = deliver(WebhookReceiver(), [{"challenge": "abc"}])
+    assert response.status_code == httpx.codes.OK
+    assert response.json() == {"challenge": "abc"}
+
+
+def test_events_update_snapshot_and_cache_once():
+    snapshot = BoardSnapshot("b1")
+    snapshot.upsert_item(
+        {
+            "id": "1",
+            "type": "sticky_note",
+            "data": {"content": "old"},
+            "position": {"x": 0, "y": 0},
+        }
+    )
+    cache = ResponseCache()
+    key = cache.key_for("https://api.miro.com/v2/boards/b1/items/1")
+    cache.put(key, "cached")
+    receiver = WebhookReceiver({"b1": snapshot}, cache)
+    events = []
+    receiver.add_listener(events.append)
+
+    update = {
+        "event": {
+            "boardId": "b1",
+            "type": "update",
+            "item": {"id": "1", "data": {"content": "new"}},
+        }
+    }
+    create = {
+        "event": {
+            "boardId": "b1",
+            "type": "create",
+            "item": {"id": "2", "type": "text", "position": {"x": 5, "y": 5}},
+        }
+    }
+    delete = {"event": {"boardId": "b1", "type": "delete", "item": {"id": "1"}}}
+    responses = deliver(receiver, [update, update, create])
+    assert [response.json()["status"] for response in responses] == [
+        "ok",
+        "duplicate",
+        "ok",
+    ]
+    assert snapshot.get("1").data == {"content": "new"}
+    assert snapshot.get("1").type == "sticky_note"
+    assert "2" in snapshot
+    assert cache.get(key) is None
+    deliver(receiver, [delete])
+    assert "1" not in snapshot
+    assert [event["type"] for event in events] == ["update", "create", "delete"]
+
+
+def test_duplicates_are_detected_by_event_identity():
+    receiver = WebhookReceiver()
+    first = {
+        "eventTime": "2024-01-01T10:00:00Z",
+        "event": {
+            "boardId": "b1",
+            "type": "update",
+            "item": {"id": "1", "modifiedAt": "2024-01-01T10:00:00Z"},
+        },
+    }
+    redelivered = {**first, "eventTime": "2024-01-01T10:05:00Z", "attempt": 2}
+    later = {
+        "event": {
+            "boardId": "b1",
+            "type": "update",
+            "item": {"id": "1", "modifiedAt": "2024-01-01T10:01:00Z"},
+        }
+    }
+    with_id = [
+        {"event": {"id": "e1", "boardId": "b1", "type": "update", "item": {"id": "1"}}},
+        {"event": {"id": "e2", "boardId": "b1", "type": "update", "item": {"id": "1"}}},
+    ]
+    responses = deliver(receiver, [first, redelivered, later, *with_id])
+    assert [response.json()["status"] for response in responses] == [
+        "ok",
+        "duplicate",
+        "ok",
+        "ok",
+        "ok",
+    ]
+    assert event_key({}, with_id[0]["event"]) == "id:e1"
+
+
+def test_failed_delivery_is_processed_when_redelivered():
+    receiver = WebhookReceiver()
+    events = []
+
+    def listener(event):
+        events.append(event)
+        if len(events) == 1:
+            raise RuntimeError("listener failed")
+
+    receiver.add_listener(listener)
+    body = {
+        "event": {"id": "e1", "boardId": "b1", "type": "update", "item": {"id": "1"}}
+    }
+    failed, redelivered, duplicate = deliver(receiver, [body, body, body])
+    assert failed.status_code == httpx.codes.INTERNAL_SERVER_ERROR
+    assert redelivered.json() == {"status": "ok"}
+    assert duplicate.json() == {"status": "duplicate"}
+    assert events == [body["event"]] * 2
+
+
+def test_signature_is_enforced():
+    receiver = WebhookReceiver(secret="s3cret")
+    body = {"event": {"boardId": "b1", "type": "create", "item": {"id": "1"}}}
+    signature = hmac.new(
+        b"s3cret", json.dumps(body).encode(), hashlib.sha256
+    ).hexdigest()
+    rejected, accepted = deliver(
+        receiver, [body], {"X-Miro-Signature": "bad"}
+    ) + deliver(receiver, [body], {"X-Miro-Signature": signature})
+    assert rejected.status_code == httpx.codes.UNAUTHORIZED
+    assert accepted.status_code == httpx.codes.OK
+    assert deliver(receiver, [body])[0].status_code == httpx.codes.UNAUTHORIZED
+    assert (
+        deliver(WebhookReceiver(), ["not an object"])[0].status_code
+        == httpx.codes.BAD_REQUEST
+    )